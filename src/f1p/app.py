@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Self
 
 from direct.showbase.ShowBase import ShowBase
@@ -22,6 +23,9 @@ class F1PlayerApp(ShowBase):
         draw_origin: bool = False,
         show_frame_rate: bool = False,
         pstat_debug: bool = False,
+        parse_workers: int | None = None,
+        progressive_window_laps: int | None = None,
+        timing_report_path: Path | None = None,
     ):
         super().__init__(self)
 
@@ -30,6 +34,9 @@ class F1PlayerApp(ShowBase):
 
         self.width = width
         self.height = height
+        self.parse_workers = parse_workers
+        self.progressive_window_laps = progressive_window_laps
+        self.timing_report_path = timing_report_path
 
         self._session_parser: SessionParser | None = None
         self._data_extractor: DataExtractorService | None = None
@@ -37,7 +44,6 @@ class F1PlayerApp(ShowBase):
         self.setBackgroundColor(0.3, 0.3, 0.3, 1)
 
         self.taskMgr.setupTaskChain("loadingData", numThreads=1)
-        self.taskMgr.setupTaskChain("updating", numThreads=7)
 
         self.ui_components: list = []
 
@@ -69,6 +75,9 @@ class F1PlayerApp(ShowBase):
                 self.width,
                 self.height,
                 self.text_font,
+                self.parse_workers,
+                self.progressive_window_laps,
+                self.timing_report_path,
             )
 
         return self._data_extractor
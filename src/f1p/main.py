@@ -1,4 +1,52 @@
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from collections.abc import Sequence
+from pathlib import Path
+
 from f1p.app import F1PlayerApp
 
-app = F1PlayerApp()
-app.configure_window().draw_menu().register_ui_components().register_controls().run()
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f"{value} is not a positive integer")
+
+    return number
+
+
+def parse_args(argv: Sequence[str] | None = None) -> Namespace:
+    parser = ArgumentParser(prog="f1p", description="F1 session player.")
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="Parse position and car data per driver in this many worker processes.",
+    )
+    parser.add_argument(
+        "--progressive-window-laps",
+        type=positive_int,
+        default=None,
+        help="Start playback once this many laps are processed, then load the rest in windows of doubling size.",
+    )
+    parser.add_argument(
+        "--timing-report-path",
+        type=Path,
+        default=None,
+        help="Write the per-stage extraction timings to this JSON file.",
+    )
+
+    return parser.parse_args(argv)
+
+
+def app(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    f1p_app = F1PlayerApp(
+        parse_workers=args.parse_workers,
+        progressive_window_laps=args.progressive_window_laps,
+        timing_report_path=args.timing_report_path,
+    )
+    f1p_app.configure_window().draw_menu().register_ui_components().register_controls().run()
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Any
+
+import fastf1
+import pandas as pd
+from pandas import DataFrame
+
+
+class ProcessedSessionCache:
+    source_path: Path = Path(__file__).parent.parent.parent
+    pipeline_sources: list[str] = [
+        "services/data_extractor/**/*.py",
+        "utils/dataframe.py",
+        "utils/geometry.py",
+        "utils/timedelta.py",
+    ]
+
+    def __init__(self, cache_path: Path, year: int, event_name: str, session_id: str):
+        self.cache_path = cache_path
+        self.year = year
+        self.event_name = event_name
+        self.session_id = session_id
+
+        self._pipeline_version: str | None = None
+
+    @property
+    def pipeline_version(self) -> str:
+        if self._pipeline_version is None:
+            digest = hashlib.sha256()
+            digest.update(pd.__version__.encode())
+            digest.update(fastf1.__version__.encode())
+
+            for pattern in self.pipeline_sources:
+                for source_file in sorted(self.source_path.glob(pattern)):
+                    digest.update(source_file.read_bytes())
+
+            self._pipeline_version = digest.hexdigest()[:16]
+
+        return self._pipeline_version
+
+    @staticmethod
+    def slugify(value: str) -> str:
+        return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+
+    @property
+    def entry_path(self) -> Path:
+        return (
+            self.cache_path
+            / str(self.year)
+            / self.slugify(self.event_name)
+            / self.slugify(self.session_id)
+            / self.pipeline_version
+        )
+
+    @property
+    def metadata_path(self) -> Path:
+        return self.entry_path / "metadata.json"
+
+    def exists(self) -> bool:
+        return self.metadata_path.exists()
+
+    def save(self, frames: dict[str, DataFrame], metadata: dict[str, Any]) -> None:
+        staging_path = self.entry_path.with_name(f"{self.pipeline_version}.tmp")
+
+        if staging_path.exists():
+            shutil.rmtree(staging_path)
+
+        staging_path.mkdir(parents=True)
+
+        for name, df in frames.items():
+            DataFrame(df).to_pickle(staging_path / f"{name}.pkl")
+
+        (staging_path / "metadata.json").write_text(json.dumps(metadata))
+
+        if self.entry_path.exists():
+            shutil.rmtree(self.entry_path)
+
+        staging_path.rename(self.entry_path)
+
+    def store_path(self, name: str) -> Path:
+        return self.entry_path / name
+
+    def frame_path(self, name: str) -> Path:
+        return self.entry_path / f"{name}.pkl"
+
+    def has_frame(self, name: str) -> bool:
+        return self.frame_path(name).exists()
+
+    def save_frame(self, name: str, df: DataFrame) -> None:
+        staging_path = self.frame_path(name).with_suffix(".tmp")
+
+        DataFrame(df).to_pickle(staging_path)
+        staging_path.replace(self.frame_path(name))
+
+    def load_frame(self, name: str) -> DataFrame:
+        return pd.read_pickle(self.frame_path(name))
+
+    def load_metadata(self) -> dict[str, Any]:
+        return json.loads(self.metadata_path.read_text())
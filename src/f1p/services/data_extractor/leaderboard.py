@@ -0,0 +1,161 @@
+import sys
+from collections.abc import Callable
+from typing import Self
+
+import numpy as np
+
+from f1p.services.data_extractor.store import TickDriverStore
+
+
+class LeaderboardTable:
+    """
+    Leaderboard display strings of every mode for every tick, as [tick, position] codes into one interned strings array.
+    Built once from the tick store, so rendering a tick or switching modes is a row lookup.
+    """
+
+    gap_columns: dict[str, str] = {"interval": "DiffToCarInFront", "leader": "DiffToLeader"}
+    first_labels: dict[str, str] = {"interval": "Interval", "leader": "Leader"}
+
+    # Time color codes, the team color resolves to the color of the driver in the cell
+    default_color: int = 0
+    dnf_color: int = 1
+    team_color: int = 2
+
+    def __init__(
+        self,
+        arrays: dict[str, np.ndarray],
+        times: dict[str, np.ndarray],
+        time_colors: dict[str, np.ndarray],
+        strings: np.ndarray,
+        tire_colors: tuple[tuple[float, ...] | None, ...],
+        driver_numbers: list[str],
+        first_tick: int,
+    ):
+        self.arrays = arrays
+        self.times = times
+        self.time_colors = time_colors
+        self.strings = strings
+        self.tire_colors = tire_colors
+        self.driver_numbers = driver_numbers
+        self.first_tick = first_tick
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [*self.arrays.values(), *self.times.values(), *self.time_colors.values()]
+        arrays_bytes = sum(array.nbytes for array in arrays)
+        strings_bytes = self.strings.nbytes + sum(sys.getsizeof(string) for string in self.strings.tolist())
+
+        return arrays_bytes + strings_bytes
+
+    @staticmethod
+    def code_dtype(count: int) -> str:
+        return next(dtype for dtype in ("int8", "int16", "int32") if count < np.iinfo(dtype).max)
+
+    @staticmethod
+    def format_codes(values: np.ndarray, formatter: Callable[[object], str], codes: dict[str, int]) -> np.ndarray:
+        # Only the distinct values are formatted, every cell then maps onto the code of its value
+        uniques, inverse = np.unique(values, return_inverse=True)
+        unique_codes = [codes.setdefault(sys.intern(formatter(value)), len(codes)) for value in uniques.tolist()]
+
+        return np.asarray(unique_codes, dtype="int64")[inverse.reshape(values.shape)]
+
+    @staticmethod
+    def format_gap(value: float) -> str:
+        return f"+{value:.3f}"
+
+    @staticmethod
+    def format_tyre_life(value: float) -> str:
+        return "" if np.isnan(value) else str(int(value))
+
+    @staticmethod
+    def format_compound(value: object) -> str:
+        return value if isinstance(value, str) else ""
+
+    @classmethod
+    def from_store(cls, tick_store: TickDriverStore) -> Self:
+        present = tick_store.present
+        ticks, driver_indexes = np.nonzero(present)
+        positions = tick_store.arrays["PositionIndex"][ticks, driver_indexes].astype("int64")
+        shape = present.shape
+
+        def by_position(column: str, fill_value: object) -> np.ndarray:
+            values = tick_store.arrays[column][ticks, driver_indexes]
+            array = np.full(shape, fill_value, dtype=values.dtype)
+            array[ticks, positions] = values
+
+            return array
+
+        drivers = np.full(shape, -1, dtype="int8")
+        drivers[ticks, positions] = driver_indexes
+        is_dnf = by_position("IsDNF", False)
+        in_pit = by_position("InPit", False)
+
+        codes: dict[str, int] = {}
+        out_code = codes.setdefault("OUT", len(codes))
+        in_pit_code = codes.setdefault("IN PIT", len(codes))
+
+        times: dict[str, np.ndarray] = {}
+        time_colors: dict[str, np.ndarray] = {}
+
+        for mode, gap_column in cls.gap_columns.items():
+            mode_times = cls.format_codes(by_position(gap_column, np.nan), cls.format_gap, codes)
+            mode_time_colors = np.full(shape, cls.default_color, dtype="int8")
+
+            mode_times[in_pit] = in_pit_code
+            mode_time_colors[in_pit] = cls.team_color
+            mode_times[is_dnf] = out_code
+            mode_time_colors[is_dnf] = cls.dnf_color
+            mode_times[:, 0] = codes.setdefault(cls.first_labels[mode], len(codes))
+            mode_time_colors[:, 0] = cls.default_color
+
+            times[mode] = mode_times
+            time_colors[mode] = mode_time_colors
+
+        tires_times = cls.format_codes(by_position("TyreLife", np.nan), cls.format_tyre_life, codes)
+        tires_times[is_dnf] = out_code
+        times["tires"] = tires_times
+        time_colors["tires"] = np.where(is_dnf, cls.dnf_color, cls.default_color).astype("int8")
+
+        # Store codes resolve through the store categories, the trailing NaN category is what -1 codes resolve to
+        compound_codes = np.asarray(
+            [
+                codes.setdefault(sys.intern(cls.format_compound(compound)), len(codes))
+                for compound in tick_store.categories["Compound"].tolist()
+            ],
+            dtype="int64",
+        )
+        tires = compound_codes[by_position("Compound", -1)]
+        tires[is_dnf] = codes.setdefault("", len(codes))
+
+        tire_colors = tuple(
+            tuple(color) if isinstance(color, tuple | list) else None
+            for color in tick_store.categories["CompoundColor"].tolist()
+        )
+        tire_color_codes = by_position("CompoundColor", -1)
+        tire_color_codes[is_dnf] = -1
+
+        code_dtype = cls.code_dtype(len(codes))
+        arrays = {"Driver": drivers, "IsDNF": is_dnf, "Tire": tires.astype(code_dtype), "TireColor": tire_color_codes}
+        times = {mode: mode_times.astype(code_dtype) for mode, mode_times in times.items()}
+        strings = np.asarray(list(codes), dtype=object)
+
+        return cls(arrays, times, time_colors, strings, tire_colors, tick_store.driver_numbers, tick_store.first_tick)
+
+    def rows(self, mode: str, tick: int) -> list[tuple[int, bool, str, int, str, tuple[float, ...] | None]]:
+        """
+        Driver index, DNF flag, time, time color code, tire and tire color of every position at a tick.
+        """
+        row = tick - self.first_tick
+        arrays = self.arrays
+
+        return list(
+            zip(
+                arrays["Driver"][row].tolist(),
+                arrays["IsDNF"][row].tolist(),
+                self.strings[self.times[mode][row]].tolist(),
+                self.time_colors[mode][row].tolist(),
+                self.strings[arrays["Tire"][row]].tolist(),
+                [self.tire_colors[code] for code in arrays["TireColor"][row].tolist()],
+                strict=True,
+            ),
+        )
@@ -4,13 +4,15 @@ from fastf1.core import Session
 from pandas import DataFrame, Series, Timedelta
 
 from f1p.ui.enums import Colors
+from f1p.utils.performance import TimingReport, instrumented
 from f1p.utils.timedelta import td_series_to_min_n_sec
 
 
 class LapsParser:
-    def __init__(self, session: Session, total_laps: int):
+    def __init__(self, session: Session, total_laps: int, timing_report: TimingReport | None = None):
         self.session = session
         self.total_laps = total_laps
+        self.timing_report = timing_report
 
         self._laps: DataFrame | None = None
         self._processed_laps: DataFrame | None = None
@@ -33,6 +35,11 @@ class LapsParser:
 
         return self._processed_laps
 
+    @processed_laps.setter
+    def processed_laps(self, value: DataFrame) -> None:
+        self._processed_laps = value
+
+    @instrumented("_processed_laps")
     def _add_total_laps(self) -> Self:
         df = self.laps.copy()
 
@@ -42,8 +49,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _convert_sector_session_time_to_milliseconds(self, sector: int) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         sector_session_time_in_milliseconds = (
             df[f"Sector{sector}SessionTime"].fillna(Timedelta(milliseconds=0)).dt.total_seconds() * 1e3
@@ -54,8 +62,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _convert_sector_time_to_milliseconds(self, sector: int) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         sector_time_in_milliseconds = (
             df[f"Sector{sector}Time"].fillna(Timedelta(milliseconds=0)).dt.total_seconds() * 1e3
@@ -66,8 +75,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _format_sector_time_milliseconds(self, sector: int) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df[f"Sector{sector}TimeFormatted"] = td_series_to_min_n_sec(df[f"Sector{sector}TimeMilliseconds"])
 
@@ -75,8 +85,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_sector_diff_to_car_ahead(self, sector: int) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df[f"S{sector}DiffToCarAhead"] = (
             df.sort_values(by=[f"Sector{sector}SessionTimeMilliseconds"], ascending=[True])
@@ -88,8 +99,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_sector_time_best(self, sector: int) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         sector_time_sr = df[f"Sector{sector}TimeMilliseconds"]
         df[f"Sector{sector}Best"] = sector_time_sr[sector_time_sr > 0].min()
@@ -98,8 +110,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_fastest_sector_time_milliseconds_so_far(self, sector: int) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df[f"FastestSector{sector}TimeMillisecondsSoFar"] = (
             df[df[f"Sector{sector}TimeMilliseconds"].gt(0) & df[f"Sector{sector}TimeMilliseconds"].notna()]
@@ -111,8 +124,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_sector_color_code(self, sector: int) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df[f"Sector{sector}ColorCode"] = "Y"
 
@@ -134,8 +148,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _add_sector_color(self, sector: int) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         compound_mapping = {
             "Y": Colors.YELLOW,
@@ -162,8 +177,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _convert_lap_start_time_to_milliseconds(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         lap_start_time_in_milliseconds = df["LapStartTime"].fillna(Timedelta(milliseconds=0)).dt.total_seconds() * 1e3
         df["LapStartTimeMilliseconds"] = lap_start_time_in_milliseconds.astype("int64")
@@ -172,8 +188,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _convert_lap_time_to_milliseconds(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         lap_time_in_milliseconds = df["LapTime"].fillna(Timedelta(milliseconds=0)).dt.total_seconds() * 1e3
         df["LapTimeMilliseconds"] = lap_time_in_milliseconds.astype("int64")
@@ -182,8 +199,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _format_lap_time_milliseconds(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["LapTimeFormatted"] = td_series_to_min_n_sec(df["LapTimeMilliseconds"])
 
@@ -191,8 +209,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_lap_end_time_milliseconds(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["LapEndTimeMilliseconds"] = df["LapStartTimeMilliseconds"] + df["LapTimeMilliseconds"]
 
@@ -200,8 +219,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _convert_pit_in_time_to_milliseconds(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         pit_in_time_in_milliseconds = df.loc[df["PitInTime"].notna(), "PitInTime"].dt.total_seconds() * 1e3
         df.loc[df["PitInTime"].notna(), "PitInTimeMilliseconds"] = pit_in_time_in_milliseconds.astype("int64")
@@ -210,8 +230,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _convert_pit_out_time_to_milliseconds(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         pit_out_time_in_milliseconds = df.loc[df["PitOutTime"].notna(), "PitOutTime"].dt.total_seconds() * 1e3
         df.loc[df["PitOutTime"].notna(), "PitOutTimeMilliseconds"] = pit_out_time_in_milliseconds.astype("int64")
@@ -220,8 +241,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _add_last_lap_time_milliseconds(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["LastLapTimeMilliseconds"] = df.groupby("DriverNumber")["LapTimeMilliseconds"].shift(1)
 
@@ -229,8 +251,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _add_fastest_lap_time_milliseconds_so_far(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["FastestLapTimeMillisecondsSoFar"] = df.groupby("DriverNumber")["LastLapTimeMilliseconds"].cummin()
 
@@ -238,8 +261,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _fill_in_compound(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["Compound"] = df["Compound"].str[0]
         df["Compound"] = df.groupby("DriverNumber")["Compound"].ffill()
@@ -248,8 +272,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _add_compound_color(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         compound_mapping = {
             "S": Colors.SCompound,
@@ -264,8 +289,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_lap_time_best_milliseconds(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["LapTimeBestMilliseconds"] = df["LapTimeMilliseconds"][df["LapTimeMilliseconds"] > 0].min()
 
@@ -273,8 +299,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_lap_time_personal_best_milliseconds(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["LapTimePersonalBestMilliseconds"] = (
             df[df["LapTimeMilliseconds"].gt(0) & df["LapTimeMilliseconds"].notna()]
@@ -287,8 +314,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_lap_time_color_code(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["LapTimeColorCode"] = "Y"
 
@@ -308,8 +336,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_lap_time_color(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         color_mapping = {
             "Y": Colors.YELLOW,
@@ -322,8 +351,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_lap_time_ratio(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["LapTimeRatio"] = df["LapTimeMilliseconds"] / self.fastest_lap["LapTimeMilliseconds"] * 100
 
@@ -331,8 +361,9 @@ class LapsParser:
 
         return self
 
+    @instrumented("_processed_laps")
     def _compute_s2_lap_time(self) -> Self:
-        df = self._processed_laps.copy()
+        df = self._processed_laps
 
         df["S2LapTime"] = df["Sector2SessionTime"] - df["LapStartTime"]
 
@@ -369,7 +400,7 @@ class LapsParser:
     @property
     def slowest_non_pit_lap(self) -> Series:
         if self._slowest_non_pit_lap is None:
-            df = self._processed_laps.copy()
+            df = self._processed_laps
 
             eligible_laps = df[
                 df["PitInTimeMilliseconds"].isna() & df["PitOutTimeMilliseconds"].isna() & (df["TrackStatus"] == "1")
@@ -384,7 +415,7 @@ class LapsParser:
     @property
     def fastest_lap(self) -> Series:
         if self._fastest_lap is None:
-            df = self._processed_laps.copy()
+            df = self._processed_laps
 
             eligible_laps = df[df["LapTimeMilliseconds"].notna() & (df["LapTimeMilliseconds"] > 0)]
             eligible_laps = eligible_laps.sort_values("LapTimeMilliseconds", ascending=True)
@@ -405,10 +436,9 @@ class LapsParser:
         return self._end_of_race_milliseconds
 
     def get_driver_laps(self, driver_number: str) -> DataFrame:
-        df = self._processed_laps.copy()
-        df = df[df["DriverNumber"] == driver_number].copy()
+        df = self._processed_laps
 
-        return df
+        return df[df["DriverNumber"] == driver_number].copy()
 
     def get_driver_tire_strategy(self, driver_number: str) -> dict[int, dict[str, str | int]]:
         df = self.get_driver_laps(driver_number).sort_values(by="LapNumber", ascending=True)
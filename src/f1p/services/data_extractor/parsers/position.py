@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Self
 
 import pandas as pd
@@ -5,11 +7,19 @@ from fastf1.core import Session
 from pandas import DataFrame, Timedelta
 
 from f1p.utils.geometry import center_pos_data, resize_pos_data
+from f1p.utils.performance import TimingReport, instrumented
 
 
 class PositionParser:
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session | None,
+        workers: int | None = None,
+        timing_report: TimingReport | None = None,
+    ):
         self.session = session
+        self.workers = workers
+        self.timing_report = timing_report
 
         self._pos_data: dict[str, DataFrame] | None = None
         self._processed_pos_data: DataFrame | None = None
@@ -28,6 +38,7 @@ class PositionParser:
 
         return self._processed_pos_data
 
+    @instrumented("_processed_pos_data")
     def _combine_position_data(self) -> Self:
         drivers_pos_data = []
         for driver_number, pos_data in self.pos_data.items():
@@ -38,23 +49,26 @@ class PositionParser:
 
         return self
 
+    @instrumented("_processed_pos_data")
     def _remove_records_before_session_start_time(self, session_start_time: Timedelta) -> Self:
-        df = self._processed_pos_data.copy()
+        df = self._processed_pos_data
 
-        self._processed_pos_data = df[df["SessionTime"] >= session_start_time]
+        self._processed_pos_data = df[df["SessionTime"] >= session_start_time].reset_index(drop=True)
 
         return self
 
+    @instrumented("_processed_pos_data")
     def _normalize_position_data(self, map_rotation: float, map_center_coordinate: tuple[float, float, float]) -> Self:
-        df = self._processed_pos_data.copy()
+        df = self._processed_pos_data
 
         resized_pos_data_df = resize_pos_data(map_rotation, df)
         self._processed_pos_data = center_pos_data(map_center_coordinate, resized_pos_data_df)
 
         return self
 
+    @instrumented("_processed_pos_data")
     def _add_session_time_in_milliseconds(self) -> Self:
-        df = self._processed_pos_data.copy()
+        df = self._processed_pos_data
 
         df["SessionTimeMilliseconds"] = (df["SessionTime"].dt.total_seconds() * 1e3).astype("int64")
 
@@ -62,8 +76,9 @@ class PositionParser:
 
         return self
 
+    @instrumented("_processed_pos_data")
     def _add_session_time_tick(self) -> Self:
-        df = self._processed_pos_data.copy()
+        df = self._processed_pos_data
 
         df["SessionTimeTick"] = df.groupby("DriverNumber").cumcount().add(1)
 
@@ -71,12 +86,54 @@ class PositionParser:
 
         return self
 
+    @staticmethod
+    def parse_driver_pos_data(
+        driver_number: str,
+        pos_data: DataFrame,
+        session_start_time: Timedelta,
+        map_rotation: float,
+        map_center_coordinate: tuple[float, float, float],
+    ) -> DataFrame:
+        parser = PositionParser(None)
+        parser._pos_data = {driver_number: pos_data}
+
+        return parser.parse(session_start_time, map_rotation, map_center_coordinate)
+
+    @instrumented("_processed_pos_data")
+    def _parse_drivers_in_processes(
+        self,
+        session_start_time: Timedelta,
+        map_rotation: float,
+        map_center_coordinate: tuple[float, float, float],
+    ) -> Self:
+        driver_numbers = list(self.pos_data.keys())
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            drivers_pos_data = executor.map(
+                self.parse_driver_pos_data,
+                driver_numbers,
+                # Plain frames so the fastf1 session attached to Telemetry is not pickled along
+                [DataFrame(self.pos_data[driver_number]) for driver_number in driver_numbers],
+                repeat(session_start_time),
+                repeat(map_rotation),
+                repeat(map_center_coordinate),
+            )
+
+            self._processed_pos_data = pd.concat(list(drivers_pos_data), ignore_index=True)
+
+        return self
+
     def parse(
         self,
         session_start_time: Timedelta,
         map_rotation: float,
         map_center_coordinate: tuple[float, float, float],
     ) -> DataFrame:
+        if self.workers:
+            self._parse_drivers_in_processes(session_start_time, map_rotation, map_center_coordinate)
+
+            return self._processed_pos_data
+
         (
             self._combine_position_data()
             ._remove_records_before_session_start_time(session_start_time)
@@ -18,6 +18,7 @@ class SessionParser(DirectObject):
         self._event_schedule: DataFrame | None = None
         self._event: Series | None = None
         self._session: Session | None = None
+        self._weather_session: Session | None = None
 
         self._session_status: DataFrame | None = None
         self._session_start_time: Timedelta | None = None
@@ -103,6 +104,13 @@ class SessionParser(DirectObject):
 
         return self._session
 
+    @property
+    def weather_session(self) -> Session:
+        if self._weather_session is None:
+            self._weather_session = fastf1.get_session(self.year, self.event_name, self.session_id)
+
+        return self._weather_session
+
     @property
     def session_status(self) -> DataFrame:
         if self._session_status is None:
@@ -117,6 +125,10 @@ class SessionParser(DirectObject):
 
         return self._session_start_time
 
+    @session_start_time.setter
+    def session_start_time(self, value: Timedelta) -> None:
+        self._session_start_time = value
+
     @property
     def session_end_time(self) -> Timedelta:
         if self._session_end_time is None:
@@ -124,6 +136,10 @@ class SessionParser(DirectObject):
 
         return self._session_end_time
 
+    @session_end_time.setter
+    def session_end_time(self, value: Timedelta) -> None:
+        self._session_end_time = value
+
     @property
     def session_results(self) -> DataFrame:
         if self._session_results is None:
@@ -138,20 +154,27 @@ class SessionParser(DirectObject):
 
         return self._total_laps
 
+    @total_laps.setter
+    def total_laps(self, value: int) -> None:
+        self._total_laps = value
+
     def reset_from_year(self) -> None:
         self._event_schedule = None
         self._event_name = None
         self._session_id = None
         self._event = None
         self._session = None
+        self._weather_session = None
 
     def reset_from_event_name(self) -> None:
         self._session_id = None
         self._event = None
         self._session = None
+        self._weather_session = None
 
     def reset_from_session_id(self) -> None:
         self._session = None
+        self._weather_session = None
 
     def process_team_colors(self) -> DataFrame:
         df = self.session_results.copy()
@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Self
 
 import pandas as pd
@@ -5,11 +7,19 @@ from fastf1.core import Session
 from pandas import DataFrame, Timedelta
 
 from f1p.utils.dataframe import merge_in_session_time_ticks
+from f1p.utils.performance import TimingReport, instrumented
 
 
 class TelemetryParser:
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session | None,
+        workers: int | None = None,
+        timing_report: TimingReport | None = None,
+    ):
         self.session = session
+        self.workers = workers
+        self.timing_report = timing_report
 
         self._car_data: dict[str, DataFrame] | None = None
         self._processed_car_data: DataFrame | None = None
@@ -28,6 +38,7 @@ class TelemetryParser:
 
         return self._processed_car_data
 
+    @instrumented("_processed_car_data")
     def _combine_car_data(self) -> Self:
         drivers_car_data = []
         for driver_number, car_data in self.car_data.items():
@@ -38,12 +49,13 @@ class TelemetryParser:
 
         return self
 
+    @instrumented("_processed_car_data")
     def _trim_to_session_time(
         self,
         session_start_time: Timedelta,
         session_end_time: Timedelta,
     ) -> Self:
-        df = self._processed_car_data.copy()
+        df = self._processed_car_data
         df = df[df["SessionTime"] >= session_start_time]
         df = df[df["SessionTime"] <= session_end_time]
 
@@ -51,6 +63,7 @@ class TelemetryParser:
 
         return self
 
+    @instrumented("_processed_car_data")
     def _add_session_time_ticks(self, session_time_ticks_df: DataFrame) -> Self:
         df = merge_in_session_time_ticks(self._processed_car_data, session_time_ticks_df)
 
@@ -58,8 +71,9 @@ class TelemetryParser:
 
         return self
 
+    @instrumented("_processed_car_data")
     def _normalize_gear_indicator(self) -> Self:
-        df = self._processed_car_data.copy()
+        df = self._processed_car_data
 
         df["nGear"] = df["nGear"].astype("int64").astype(str).replace("0", "N")
 
@@ -67,8 +81,9 @@ class TelemetryParser:
 
         return self
 
+    @instrumented("_processed_car_data")
     def _convert_speed_to_mph(self) -> Self:
-        df = self._processed_car_data.copy()
+        df = self._processed_car_data
 
         df["SpeedMph"] = df["Speed"] / 1.609344
 
@@ -76,8 +91,9 @@ class TelemetryParser:
 
         return self
 
+    @instrumented("_processed_car_data")
     def _clean_up(self) -> Self:
-        df = self._processed_car_data.copy()
+        df = self._processed_car_data
 
         df = df.drop_duplicates(
             subset=["DriverNumber", "SessionTimeTick"],
@@ -97,12 +113,54 @@ class TelemetryParser:
 
         return self
 
+    @staticmethod
+    def parse_driver_car_data(
+        driver_number: str,
+        car_data: DataFrame,
+        session_start_time: Timedelta,
+        session_end_time: Timedelta,
+        session_time_ticks_df: DataFrame,
+    ) -> DataFrame:
+        parser = TelemetryParser(None)
+        parser._car_data = {driver_number: car_data}
+
+        return parser.parse(session_start_time, session_end_time, session_time_ticks_df)
+
+    @instrumented("_processed_car_data")
+    def _parse_drivers_in_processes(
+        self,
+        session_start_time: Timedelta,
+        session_end_time: Timedelta,
+        session_time_ticks_df: DataFrame,
+    ) -> Self:
+        driver_numbers = list(self.car_data.keys())
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            drivers_car_data = executor.map(
+                self.parse_driver_car_data,
+                driver_numbers,
+                # Plain frames so the fastf1 session attached to Telemetry is not pickled along
+                [DataFrame(self.car_data[driver_number]) for driver_number in driver_numbers],
+                repeat(session_start_time),
+                repeat(session_end_time),
+                repeat(session_time_ticks_df),
+            )
+
+            self._processed_car_data = pd.concat(list(drivers_car_data), ignore_index=True)
+
+        return self
+
     def parse(
         self,
         session_start_time: Timedelta,
         session_end_time: Timedelta,
         session_time_ticks_df: DataFrame,
     ) -> DataFrame:
+        if self.workers:
+            self._parse_drivers_in_processes(session_start_time, session_end_time, session_time_ticks_df)
+
+            return self._processed_car_data
+
         (
             self._combine_car_data()
             ._trim_to_session_time(session_start_time, session_end_time)
@@ -15,11 +15,13 @@ from f1p.services.data_extractor.track_statuses import (
 )
 from f1p.utils.dataframe import merge_in_session_time_ticks
 from f1p.utils.geometry import center_pos_data, resize_pos_data
+from f1p.utils.performance import TimingReport, instrumented
 
 
 class TrackParser:
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, timing_report: TimingReport | None = None):
         self.session = session
+        self.timing_report = timing_report
 
         self._circuit_info: CircuitInfo | None = None
         self._corners: DataFrame | None = None
@@ -55,6 +57,10 @@ class TrackParser:
 
         return self._track_status
 
+    @track_status.setter
+    def track_status(self, value: DataFrame) -> None:
+        self._track_status = value
+
     @property
     def track_status_colors(self) -> DataFrame:
         if self._track_status_colors is None:
@@ -105,12 +111,13 @@ class TrackParser:
 
         return self
 
+    @instrumented("_processed_track_statuses")
     def _trim_to_session_time(
         self,
         session_start_time: Timedelta,
         session_end_time: Timedelta,
     ) -> Self:
-        df = self.track_status.copy()
+        df = self.track_status
         df = df[df["Time"] >= session_start_time]
         df = df[df["Time"] <= session_end_time]
 
@@ -120,6 +127,7 @@ class TrackParser:
 
         return self
 
+    @instrumented("_processed_track_statuses")
     def _add_session_time_ticks(self) -> Self:
         ts_df = merge_in_session_time_ticks(
             self._processed_track_statuses,
@@ -137,8 +145,9 @@ class TrackParser:
 
         return self
 
+    @instrumented("_processed_track_statuses")
     def _merge_in_augmented_session_time_ticks(self) -> Self:
-        df = self._processed_track_statuses.copy()
+        df = self._processed_track_statuses
 
         # Pixel Start
         df = df.merge(self._augmented_session_time_ticks_df, on="SessionTimeTick", how="left")
@@ -165,8 +174,9 @@ class TrackParser:
 
         return self
 
+    @instrumented("_processed_track_statuses")
     def _compute_width(self) -> Self:
-        df = self._processed_track_statuses.copy()
+        df = self._processed_track_statuses
 
         df["Width"] = df["PixelEnd"] - df["PixelStart"]
 
@@ -174,8 +184,9 @@ class TrackParser:
 
         return self
 
+    @instrumented("_processed_track_statuses")
     def _convert_status_to_integer(self) -> Self:
-        df = self._processed_track_statuses.copy()
+        df = self._processed_track_statuses
 
         df["Status"] = df["Status"].astype("int64")
 
@@ -183,8 +194,9 @@ class TrackParser:
 
         return self
 
+    @instrumented("_processed_track_statuses")
     def _merge_status_colors(self) -> Self:
-        df = self._processed_track_statuses.copy()
+        df = self._processed_track_statuses
 
         df = df.merge(self.track_status_colors, on="Status", how="left")
 
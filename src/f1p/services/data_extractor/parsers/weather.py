@@ -6,22 +6,30 @@ from fastf1.core import Session
 from pandas import DataFrame, Series, Timedelta
 
 from f1p.utils.dataframe import merge_in_session_time_ticks
+from f1p.utils.performance import TimingReport, instrumented
 
 
 class WeatherParser:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, timing_report: TimingReport | None = None) -> None:
         self.session: Session = session
+        self.timing_report = timing_report
 
         self._weather_data: DataFrame | None = None
         self._processed_weather_data: DataFrame | None = None
+        self._weather_ticks: np.ndarray | None = None
+        self._weather_rows: list[Series] = []
 
     @property
-    def weather_data(self) -> DataFrame:
-        if self._weather_data is None:
-            self._weather_data = self.session.weather_data
-
+    def weather_data(self) -> DataFrame | None:
         return self._weather_data
 
+    @instrumented("_weather_data")
+    def load_weather_data(self) -> Self:
+        self.session.load(laps=False, telemetry=False, weather=True, messages=False)
+        self._weather_data = self.session.weather_data
+
+        return self
+
     @property
     def processed_weather_data(self) -> DataFrame:
         if self._processed_weather_data is None:
@@ -29,12 +37,21 @@ class WeatherParser:
 
         return self._processed_weather_data
 
+    @processed_weather_data.setter
+    def processed_weather_data(self, value: DataFrame) -> None:
+        self._processed_weather_data = value
+        self._weather_ticks = None
+
+    @instrumented("_processed_weather_data")
     def _trim_to_session_time(
         self,
         session_start_time: Timedelta,
         session_end_time: Timedelta,
     ) -> Self:
-        df = self.weather_data.copy()
+        df = self.weather_data
+        if df is None:
+            raise ValueError("Weather data is not loaded yet.")
+
         df = df[df["Time"] >= session_start_time]
         df = df[df["Time"] <= session_end_time]
 
@@ -42,6 +59,7 @@ class WeatherParser:
 
         return self
 
+    @instrumented("_processed_weather_data")
     def _add_session_time_ticks(self, session_time_ticks_df: DataFrame) -> Self:
         df = merge_in_session_time_ticks(self._processed_weather_data, session_time_ticks_df, "Time")
 
@@ -49,8 +67,9 @@ class WeatherParser:
 
         return self
 
+    @instrumented("_processed_weather_data")
     def _convert_air_temp_to_fahrenheit(self) -> Self:
-        df = self._processed_weather_data.copy()
+        df = self._processed_weather_data
 
         df["AirTempF"] = (df["AirTemp"] * 9 / 5) + 32
 
@@ -58,8 +77,9 @@ class WeatherParser:
 
         return self
 
+    @instrumented("_processed_weather_data")
     def _convert_track_temp_to_fahrenheit(self) -> Self:
-        df = self._processed_weather_data.copy()
+        df = self._processed_weather_data
 
         df["TrackTempF"] = (df["TrackTemp"] * 9 / 5) + 32
 
@@ -67,8 +87,9 @@ class WeatherParser:
 
         return self
 
+    @instrumented("_processed_weather_data")
     def _convert_pressure_to_kilopascal(self) -> Self:
-        df = self._processed_weather_data.copy()
+        df = self._processed_weather_data
 
         df["Pressure"] = df["Pressure"] / 10
 
@@ -76,8 +97,9 @@ class WeatherParser:
 
         return self
 
+    @instrumented("_processed_weather_data")
     def _convert_wind_speed_to_km_p_h(self) -> Self:
-        df = self._processed_weather_data.copy()
+        df = self._processed_weather_data
 
         df["WindSpeed"] = df["WindSpeed"] * 18 / 5
 
@@ -85,8 +107,9 @@ class WeatherParser:
 
         return self
 
+    @instrumented("_processed_weather_data")
     def _add_weather_symbol(self) -> Self:
-        df = self._processed_weather_data.copy()
+        df = self._processed_weather_data
 
         df.loc[df["Rainfall"], "WeatherSymbol"] = "🌧"
         df["WeatherSymbol"] = df["WeatherSymbol"].fillna("🌣")
@@ -95,8 +118,9 @@ class WeatherParser:
 
         return self
 
+    @instrumented("_processed_weather_data")
     def _add_weather_text(self) -> Self:
-        df = self._processed_weather_data.copy()
+        df = self._processed_weather_data
 
         df.loc[df["Rainfall"], "WeatherText"] = "RAIN"
         df["WeatherText"] = df["WeatherText"].fillna("SUNNY")
@@ -105,8 +129,9 @@ class WeatherParser:
 
         return self
 
+    @instrumented("_processed_weather_data")
     def _add_wind_direction_symbol(self) -> Self:
-        df = self._processed_weather_data.copy()
+        df = self._processed_weather_data
 
         df["WindDirectionSymbol"] = np.select(
             [
@@ -128,8 +153,9 @@ class WeatherParser:
 
         return self
 
+    @instrumented("_processed_weather_data")
     def _add_wind_direction_text(self) -> Self:
-        df = self._processed_weather_data.copy()
+        df = self._processed_weather_data
 
         df["WindDirectionText"] = np.select(
             [
@@ -168,15 +194,33 @@ class WeatherParser:
             ._add_weather_text()
             ._add_wind_direction_symbol()
             ._add_wind_direction_text()
+            ._index_weather_data()
         )
 
-    def get_current_weather_data(self, session_time_tick: int) -> Series | None:
+    def _index_weather_data(self) -> Self:
         df = self.processed_weather_data
+        df = df[df["SessionTimeTick"].notna()].sort_values(by="SessionTimeTick", kind="stable")
+
+        self._weather_ticks = df["SessionTimeTick"].to_numpy(dtype="int64")
+        self._weather_rows = [row for _, row in df.iterrows()]
 
-        df = df[df["SessionTimeTick"] <= session_time_tick]
-        df = df.sort_values(by="SessionTimeTick", ascending=False)
+        return self
+
+    def get_current_weather_row_id(self, session_time_tick: int) -> int | None:
+        if self._weather_ticks is None:
+            self._index_weather_data()
+
+        row_id = int(np.searchsorted(self._weather_ticks, session_time_tick, side="right")) - 1
+
+        if row_id < 0:
+            return None
+
+        return row_id
+
+    def get_current_weather_data(self, session_time_tick: int) -> Series | None:
+        row_id = self.get_current_weather_row_id(session_time_tick)
 
-        if df.empty:
+        if row_id is None:
             return None
 
-        return df.iloc[0]
+        return self._weather_rows[row_id]
@@ -0,0 +1,56 @@
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Self
+
+
+class StageScheduler:
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+
+        self.stages: dict[str, Callable[[], Any]] = {}
+        self.dependencies: dict[str, list[str]] = {}
+
+    def add(self, name: str, stage: Callable[[], Any], depends_on: list[str] | None = None) -> Self:
+        if name in self.stages:
+            raise ValueError(f"Stage {name} already added.")
+
+        depends_on = depends_on or []
+        for dependency in depends_on:
+            if dependency not in self.stages:
+                raise ValueError(f"Stage {name} depends on unknown stage {dependency}.")
+
+        self.stages[name] = stage
+        self.dependencies[name] = depends_on
+
+        return self
+
+    def ready_stages(self, completed: set[str], started: set[str]) -> list[str]:
+        return [
+            name
+            for name, depends_on in self.dependencies.items()
+            if name not in started and all(dependency in completed for dependency in depends_on)
+        ]
+
+    def run(self) -> None:
+        completed: set[str] = set()
+        started: set[str] = set()
+        running: dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as executor:
+            while len(completed) < len(self.stages):
+                for name in self.ready_stages(completed, started):
+                    started.add(name)
+                    running[executor.submit(self.stages[name])] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = running.pop(future)
+
+                    if future.exception() is not None:
+                        for pending in running:
+                            pending.cancel()
+
+                        raise future.exception()
+
+                    completed.add(name)
@@ -1,4 +1,5 @@
-import math
+import threading
+import time
 from pathlib import Path
 from typing import Any, Self
 
@@ -11,22 +12,40 @@ from direct.gui.OnscreenText import OnscreenText
 from direct.showbase.DirectObject import DirectObject
 from direct.showbase.MessengerGlobal import messenger
 from direct.task.Task import Task, TaskManager
-from fastf1.core import Session, Telemetry
-from panda3d.core import LVecBase4f, NodePath, Point3, StaticTextFont
+from fastf1.core import Session
+from panda3d.core import LVecBase4f, NodePath, Point3, StaticTextFont, TextNode
 from pandas import DataFrame, Series, Timedelta
 
+from f1p.services.data_extractor.cache import ProcessedSessionCache
+from f1p.services.data_extractor.leaderboard import LeaderboardTable
 from f1p.services.data_extractor.parsers.laps import LapsParser
 from f1p.services.data_extractor.parsers.position import PositionParser
 from f1p.services.data_extractor.parsers.session import SessionParser
 from f1p.services.data_extractor.parsers.telemetry import TelemetryParser
 from f1p.services.data_extractor.parsers.track import TrackParser
 from f1p.services.data_extractor.parsers.weather import WeatherParser
+from f1p.services.data_extractor.scheduler import StageScheduler
+from f1p.services.data_extractor.snapshot import TickSnapshot
+from f1p.services.data_extractor.stages import PosDataStages, PosDataWindow
+from f1p.services.data_extractor.store import TickDriverStore
+from f1p.services.data_extractor.tick_data import TickData
+from f1p.utils.dataframe import compact_dtypes, memory_usage_report
 from f1p.utils.geometry import center_pos_data, find_center, resize_pos_data
-from f1p.utils.timedelta import td_series_to_min_n_sec
-
-
-class DataExtractorService(DirectObject):
+from f1p.utils.performance import StageTiming, TimingReport, instrumented
+
+
+class DataExtractorService(DirectObject, PosDataStages):
+    compact_pos_data_dtypes: dict[str, str] = {
+        "X": "float32",
+        "Y": "float32",
+        "Z": "float32",
+        "SessionTimeTick": "int32",
+        "PositionIndex": "int8",
+        "TotalLaps": "int16",
+    }
     cache_path: Path = Path(__file__).parent.parent.parent.parent.parent / ".fastf1-cache"
+    processed_cache_path: Path = Path(__file__).parent.parent.parent.parent.parent / ".f1p-cache"
+    stage_workers: int = 4
 
     def __init__(
         self,
@@ -35,21 +54,34 @@ class DataExtractorService(DirectObject):
         window_width: int,
         window_height: int,
         text_font: StaticTextFont,
+        parse_workers: int | None = None,
+        progressive_window_laps: int | None = None,
+        timing_report_path: Path | None = None,
     ):
         super().__init__()
 
+        if progressive_window_laps is not None and progressive_window_laps < 1:
+            raise ValueError("Progressive window laps must be at least 1.")
+
         self.parent = parent
         self.task_manager = task_manager
         self.window_width = window_width
         self.window_height = window_height
         self.text_font = text_font
+        self.parse_workers = parse_workers
+        self.progressive_window_laps = progressive_window_laps
+        self.timing_report_path = timing_report_path
+        self.timing_report = TimingReport(self.show_stage_timing)
 
         self.session_parser: SessionParser | None = None
+        self._processed_session_cache: ProcessedSessionCache | None = None
         self._session_results: DataFrame | None = None
 
         self._track_parser: TrackParser | None = None
         self._processed_corners: DataFrame | None = None
         self._track_statuses: DataFrame | None = None
+        self._track_status_rows: list[Series] = []
+        self._track_status_ids: np.ndarray | None = None
 
         self._weather_parser: WeatherParser | None = None
         self._laps_parser: LapsParser | None = None
@@ -58,9 +90,15 @@ class DataExtractorService(DirectObject):
         self.processed_pos_data: DataFrame | None = None
         self._telemetry_parser: TelemetryParser | None = None
 
-        self._car_data: dict[str, Telemetry] | None = None
-
+        self._session_ticks: int | None = None
         self._session_time_ticks_df: DataFrame | None = None
+        self._processed_ticks: int | None = None
+        self._dtype_report: DataFrame | None = None
+        self._built_tick_data: TickData | None = None
+        self._tick_data: TickData | None = None
+        self._snapshot: TickSnapshot | None = None
+        self.snapshot_seconds: float = 0.0
+        self.session_ready: bool = False
 
         self.fastest_lap_telemetry: DataFrame | None = None
         self.map_center_coordinate: tuple[float, float, float] | None = None
@@ -68,8 +106,15 @@ class DataExtractorService(DirectObject):
         self.loading_frame: DirectFrame | None = None
         self.loading_text: OnscreenText | None = None
         self.wait_bar: DirectWaitBar | None = None
+        self.timing_text: OnscreenText | None = None
+        self.loading_lock = threading.Lock()
 
+        self.session_loaded: bool = False
         self.processed_car_data: DataFrame | None = None
+        self.car_telemetry_requested: bool = False
+        self._car_telemetry: dict[str, tuple[np.ndarray, dict[str, list]]] | None = None
+        self.weather_requested: bool = False
+        self.weather_ready: bool = False
 
         self.accept("loadData", self.load_data)
 
@@ -82,6 +127,18 @@ class DataExtractorService(DirectObject):
     def session(self) -> Session:
         return self.session_parser.session
 
+    @property
+    def processed_session_cache(self) -> ProcessedSessionCache:
+        if self._processed_session_cache is None:
+            self._processed_session_cache = ProcessedSessionCache(
+                self.processed_cache_path,
+                self.session_parser.year,
+                self.session_parser.event_name,
+                self.session_parser.session_id,
+            )
+
+        return self._processed_session_cache
+
     @property
     def session_start_time(self) -> Timedelta:
         return self.session_parser.session_start_time
@@ -104,7 +161,7 @@ class DataExtractorService(DirectObject):
     @property
     def track_parser(self) -> TrackParser:
         if self._track_parser is None:
-            self._track_parser = TrackParser(self.session)
+            self._track_parser = TrackParser(self.session, self.timing_report)
 
         return self._track_parser
 
@@ -141,42 +198,96 @@ class DataExtractorService(DirectObject):
     @property
     def weather_parser(self) -> WeatherParser:
         if self._weather_parser is None:
-            self._weather_parser = WeatherParser(self.session)
+            self._weather_parser = WeatherParser(self.session_parser.weather_session, self.timing_report)
 
         return self._weather_parser
 
     @property
     def laps_parser(self) -> LapsParser:
         if self._laps_parser is None:
-            self._laps_parser = LapsParser(self.session, self.total_laps)
+            self._laps_parser = LapsParser(self.session, self.total_laps, self.timing_report)
 
         return self._laps_parser
 
+    @property
+    def processed_laps(self) -> DataFrame:
+        return self.laps_parser.processed_laps
+
+    @property
+    def end_of_race_milliseconds(self) -> int:
+        return self.laps_parser.end_of_race_milliseconds
+
     @property
     def pos_parser(self) -> PositionParser:
         if self._pos_parser is None:
-            self._pos_parser = PositionParser(self.session)
+            self._pos_parser = PositionParser(self.session, self.parse_workers, self.timing_report)
 
         return self._pos_parser
 
     @property
     def telemetry_parser(self) -> TelemetryParser:
         if self._telemetry_parser is None:
-            self._telemetry_parser = TelemetryParser(self.session)
+            self._telemetry_parser = TelemetryParser(self.session, self.parse_workers, self.timing_report)
 
         return self._telemetry_parser
 
     @property
-    def car_data(self) -> dict[str, Telemetry]:
-        if self._car_data is None:
-            self._car_data = self.session.car_data
+    def tick_data(self) -> TickData:
+        if self._tick_data is None:
+            self._tick_data = self.build_tick_data(TickDriverStore.from_frame(self.processed_pos_data))
+
+        return self._tick_data
+
+    def build_tick_data(self, tick_store: TickDriverStore) -> TickData:
+        return TickData(
+            tick_store,
+            self.compute_leader_lap_numbers(tick_store),
+            self.compute_tick_session_milliseconds(tick_store),
+            LeaderboardTable.from_store(tick_store),
+            self._processed_ticks,
+        )
+
+    @property
+    def tick_store(self) -> TickDriverStore:
+        return self.tick_data.tick_store
 
-        return self._car_data
+    @property
+    def leader_lap_numbers(self) -> np.ndarray:
+        return self.tick_data.leader_lap_numbers
 
-    def get_current_lap_number(self, session_time_tick: int) -> int:
-        df = self.processed_pos_data
+    @staticmethod
+    def compute_leader_lap_numbers(tick_store: TickDriverStore) -> np.ndarray:
+        laps_completion = tick_store.arrays["LapsCompletion"]
+        laps_completion = np.where(tick_store.present & ~np.isnan(laps_completion), laps_completion, -np.inf)
+
+        leader_laps_completion = laps_completion.max(axis=1)
+        leader_laps_completion[np.isinf(leader_laps_completion)] = 0
+
+        return np.ceil(leader_laps_completion).astype("int64")
+
+    @property
+    def leaderboard_table(self) -> LeaderboardTable:
+        return self.tick_data.leaderboard_table
+
+    @property
+    def tick_session_milliseconds(self) -> np.ndarray:
+        return self.tick_data.tick_session_milliseconds
+
+    @staticmethod
+    def compute_tick_session_milliseconds(tick_store: TickDriverStore) -> np.ndarray:
+        present = tick_store.present
+        session_milliseconds = np.where(present, tick_store.arrays["SessionTimeMilliseconds"], 0).sum(axis=1)
+        drivers = present.sum(axis=1)
+
+        valid = drivers > 0
+        rows = np.arange(len(drivers))
+        tick_session_milliseconds = np.interp(rows, rows[valid], session_milliseconds[valid] / drivers[valid])
 
-        return int(math.ceil(df[df["SessionTimeTick"] == session_time_tick]["LapsCompletion"].max()))
+        # Playback maps session time back to ticks, so the tick clock must never run backwards
+        return np.maximum.accumulate(tick_session_milliseconds)
+
+    def get_current_lap_number(self, session_time_tick: int) -> int:
+        return int(self.leader_lap_numbers[session_time_tick - self.tick_store.first_tick])
 
     @property
     def lowest_z_coordinate(self) -> float:
@@ -184,29 +295,37 @@ class DataExtractorService(DirectObject):
 
     @property
     def session_ticks(self) -> int:
-        df = self.processed_pos_data.copy()
+        if self._session_ticks is None:
+            self._session_ticks = (
+                self.processed_pos_data.groupby("DriverNumber", observed=True)["SessionTimeTick"].count().min()
+            )
+
+        return self._session_ticks
 
-        df = df[["DriverNumber", "SessionTimeTick"]]
-        df = df.groupby("DriverNumber")["SessionTimeTick"].count()
+    @property
+    def processed_ticks(self) -> int:
+        if self._tick_data is None or self._tick_data.processed_ticks is None:
+            return self.session_ticks
 
-        return df.min()
+        return self._tick_data.processed_ticks
+
+    @property
+    def dtype_report(self) -> DataFrame:
+        if self._dtype_report is None:
+            raise ValueError("Dtypes are not compacted yet.")
+
+        return self._dtype_report
 
     @property
     def session_time_ticks_df(self) -> DataFrame:
         if self._session_time_ticks_df is None:
-            df = self.processed_pos_data.copy()
-            df = (
-                df[["SessionTimeTick", "SessionTime"]]
-                .drop_duplicates(
-                    keep="first",
-                )
-                .copy()
+            self._session_time_ticks_df = self.processed_pos_data[["SessionTimeTick", "SessionTime"]].drop_duplicates(
+                keep="first",
             )
 
-            self._session_time_ticks_df = df
-
         return self._session_time_ticks_df
 
+    @instrumented("_track_statuses")
     def process_track_statuses(self, width: int) -> None:
         self._track_statuses = self.track_parser.parse(
             width,
@@ -215,21 +334,107 @@ class DataExtractorService(DirectObject):
             self.session_start_time,
             self.session_end_time,
         )
+        self.index_track_statuses()
 
-    def get_current_track_status(self, session_time_tick: int) -> Series | None:
+    def index_track_statuses(self) -> None:
         ts_df = self.track_statuses
+        track_status_ids = np.full(self.session_ticks + 1, -1, dtype="int32")
 
-        ts_df = ts_df[ts_df["SessionTimeTick"] <= session_time_tick]
-        ts_df = ts_df[ts_df["SessionTimeTickEnd"] >= session_time_tick]
+        for row_id in reversed(range(len(ts_df))):
+            start_tick = ts_df["SessionTimeTick"].iat[row_id]
+            end_tick = ts_df["SessionTimeTickEnd"].iat[row_id]
 
-        if ts_df.empty:
+            if pd.isna(start_tick) or pd.isna(end_tick):
+                continue
+
+            track_status_ids[max(int(start_tick), 0) : int(end_tick) + 1] = row_id
+
+        self._track_status_rows = [row for _, row in ts_df.iterrows()]
+        self._track_status_ids = track_status_ids
+
+    def get_current_track_status(self, session_time_tick: int) -> Series | None:
+        if self._track_status_ids is None:
+            self.index_track_statuses()
+
+        if not 0 <= session_time_tick < len(self._track_status_ids):
+            return None
+
+        row_id = self._track_status_ids[session_time_tick]
+        if row_id < 0:
             return None
 
-        return ts_df.iloc[0]
+        return self._track_status_rows[row_id]
 
     def get_current_weather_data(self, session_time_tick: int) -> Series | None:
+        if not self.weather_ready:
+            self.request_weather_data()
+            return None
+
         return self.weather_parser.get_current_weather_data(session_time_tick)
 
+    def get_current_weather_row_id(self, session_time_tick: int) -> int | None:
+        if not self.weather_ready:
+            self.request_weather_data()
+            return None
+
+        return self.weather_parser.get_current_weather_row_id(session_time_tick)
+
+    def interpolate_positions(self, playback_tick: float) -> dict[str, tuple[float, float, float]]:
+        positions = self.tick_store.interpolate(playback_tick)
+        present = ~np.isnan(positions[:, 0])
+
+        return {
+            driver_number: tuple(position)
+            for driver_number, position, is_present in zip(
+                self.tick_store.driver_numbers,
+                positions.tolist(),
+                present,
+                strict=True,
+            )
+            if is_present
+        }
+
+    def snapshot(self, playback_tick: float) -> TickSnapshot:
+        if self._snapshot is not None and self._snapshot.playback_tick == playback_tick:
+            return self._snapshot
+
+        start_time = time.perf_counter()
+
+        session_time_tick = int(playback_tick)
+        if self._snapshot is None or self._snapshot.session_time_tick != session_time_tick:
+            weather_row_id = self.get_current_weather_row_id(session_time_tick)
+            self._snapshot = TickSnapshot(
+                session_time_tick,
+                self.tick_store.records(session_time_tick),
+                self.get_current_lap_number(session_time_tick),
+                self.get_current_track_status(session_time_tick),
+                weather_row_id,
+                None if weather_row_id is None else self.weather_parser.get_current_weather_data(session_time_tick),
+            )
+
+        self._snapshot = self._snapshot.at_playback_tick(playback_tick, self.interpolate_positions(playback_tick))
+
+        self.snapshot_seconds = time.perf_counter() - start_time
+
+        return self._snapshot
+
+    def get_car_record(self, driver_number: str, session_time_tick: int) -> dict | None:
+        if self._car_telemetry is None:
+            self.request_car_telemetry()
+            return None
+
+        if driver_number not in self._car_telemetry:
+            self.index_driver_car_telemetry(driver_number)
+
+        ticks, columns = self._car_telemetry[driver_number]
+        index = np.searchsorted(ticks, session_time_tick, side="right") - 1
+
+        if index < 0:
+            return None
+
+        return {column: values[index] for column, values in columns.items()}
+
+    @instrumented("fastest_lap_telemetry")
     def process_fastest_lap(self) -> Self:
         pos_data = self.laps_parser.fastest_lap.get_pos_data()
         resized_pos_data_df = resize_pos_data(self.map_rotation, pos_data)
@@ -242,6 +447,7 @@ class DataExtractorService(DirectObject):
 
         return self
 
+    @instrumented("processed_pos_data")
     def parse_pos_data(self) -> Self:
         self.processed_pos_data = self.pos_parser.parse(
             self.session_start_time,
@@ -249,10 +455,15 @@ class DataExtractorService(DirectObject):
             self.map_center_coordinate,
         )
 
+        # Resolve the ticks before the stages that depend on them start mutating processed_pos_data in parallel
+        _ = self.session_ticks
+        _ = self.session_time_ticks_df
+
         self.update_loading(10)
 
         return self
 
+    @instrumented("_laps_parser._processed_laps")
     def parse_laps(self) -> Self:
         self.laps_parser.parse()
 
@@ -260,276 +471,247 @@ class DataExtractorService(DirectObject):
 
         return self
 
-    def merge_pos_and_laps(self) -> Self:
-        df = self.processed_pos_data.copy()
-        ts_df = df[["SessionTimeTick", "SessionTimeMilliseconds"]].drop_duplicates(keep="first").copy()
-        laps_df = self.laps_parser.processed_laps.copy()
-
-        for record in laps_df.itertuples():
-            laps_df.loc[
-                (laps_df["LapNumber"] == record.LapNumber) & (laps_df["DriverNumber"] == record.DriverNumber),
-                "SessionTimeTick",
-            ] = ts_df.loc[
-                ts_df["SessionTimeMilliseconds"] <= record.LapStartTimeMilliseconds,
-                "SessionTimeTick",
-            ].max()
-
-        laps_df.loc[laps_df["LapNumber"] == 1.0, "SessionTimeTick"] = 1
-        laps_df = laps_df.dropna(subset=["SessionTimeTick"])
-        laps_df["SessionTimeTick"] = laps_df["SessionTimeTick"].astype("int64")
-
-        lap_n_tick_df = laps_df[["DriverNumber", "LapNumber", "SessionTimeTick"]]
-
-        # Merge once to get he LapNumber and fill it for all SessionTimeTicks
-        combined_df = df.merge(lap_n_tick_df, on=["DriverNumber", "SessionTimeTick"], how="left")
-        combined_df["LapNumber"] = combined_df.groupby("DriverNumber")["LapNumber"].ffill()
-
-        # Merge second time with full laps_df to get full data per SessionTimeTick
-        combined_df = combined_df.merge(laps_df, on=["DriverNumber", "LapNumber"], how="left")
-        combined_df = combined_df.rename(
-            columns={
-                "Time_x": "Time",
-                "Time_y": "TimeLap",
-                "SessionTimeTick_x": "SessionTimeTick",
-            },
-        )
-        combined_df = combined_df.drop(columns=["SessionTimeTick_y"])
-
-        self.processed_pos_data = combined_df
-
-        # TODO figure out what to do with drivers that have no lap data at all. Should probably zero out everything
-        #      relevant for them and DNS them
+    @instrumented("processed_pos_data")
+    def compact_processed_pos_data(self) -> Self:
+        df = self.processed_pos_data
+        compacted_df = compact_dtypes(df, self.compact_pos_data_dtypes)
 
-        self.update_loading(5)
+        self._dtype_report = memory_usage_report(df, compacted_df)
+        self.processed_pos_data = compacted_df
 
         return self
 
-    @staticmethod
-    def compute_elapsed_time(df: DataFrame, start_column: str, column_name: str) -> None:
-        df[column_name] = df["SessionTime"] - df[start_column]
-        time_in_milliseconds = df.loc[df[column_name].notna(), column_name].dt.total_seconds() * 1e3
-        df.loc[df[column_name].notna(), f"{column_name}Milliseconds"] = time_in_milliseconds.astype("int64")
+    @instrumented("processed_pos_data")
+    def build_tick_store(self) -> Self:
+        # Built aside from the tick data the UI reads, publish_session hands it over
+        self._built_tick_data = self.build_tick_data(TickDriverStore.from_frame(self.processed_pos_data))
 
-    def compute_lap_completion(self) -> Self:
-        df = self.processed_pos_data.copy()
-
-        self.compute_elapsed_time(df, "LapStartTime", "S1ElapsedLapTime")
-        self.compute_elapsed_time(df, "Sector1SessionTime", "S2ElapsedLapTime")
-        self.compute_elapsed_time(df, "Sector2SessionTime", "S3ElapsedLapTime")
-        self.compute_elapsed_time(df, "LapStartTime", "ElapsedLapTime")
+        return self
 
-        df["LapStartTimeMilliseconds"] = df.groupby("DriverNumber")["LapStartTimeMilliseconds"].ffill()
-        df["LapEndTimeMilliseconds"] = df.groupby("DriverNumber")["LapEndTimeMilliseconds"].ffill()
+    @instrumented("processed_car_data")
+    def parse_telemetry(self) -> Self:
+        self.processed_car_data = self.telemetry_parser.parse(
+            self.session_start_time,
+            self.session_end_time,
+            self.session_time_ticks_df,
+        )
 
-        df.loc[
-            (df["LapNumber"] == self.total_laps) & (df["SessionTimeMilliseconds"] > df["LapEndTimeMilliseconds"]),
-            "LapNumber",
-        ] = self.total_laps + 1
+        return self
 
-        df["ElapsedTimeSinceStartOfLapMilliseconds"] = df["SessionTimeMilliseconds"] - df["LapStartTimeMilliseconds"]
-        df["LapPercentageCompletion"] = df["ElapsedTimeSinceStartOfLapMilliseconds"] / df["LapTimeMilliseconds"]
-        df["LapPercentageCompletion"] = df["LapPercentageCompletion"].replace([np.inf, -np.inf, np.nan], 0)
-        df.loc[df["LapNumber"] > self.total_laps, "LapPercentageCompletion"] = 0
-        df["LapsCompletion"] = (df["LapNumber"] - 1) + df["LapPercentageCompletion"]
+    def index_driver_car_telemetry(self, driver_number: str) -> None:
+        df = self.processed_car_data
+        df = df[df["DriverNumber"] == driver_number].sort_values(by="SessionTimeTick", kind="stable")
 
-        self.processed_pos_data = df
+        # Car samples are unique per tick, the latest one at or before a tick is the forward filled value
+        self._car_telemetry[driver_number] = (
+            df["SessionTimeTick"].to_numpy(),
+            {column: df[column].tolist() for column in df.columns},
+        )
 
-        self.update_loading(5)
+    @instrumented("_weather_parser._processed_weather_data")
+    def process_weather_data(self) -> Self:
+        self.weather_parser.parse(
+            self.session_time_ticks_df,
+            self.session_start_time,
+            self.session_end_time,
+        )
 
         return self
 
-    def compute_is_dnf(self) -> Self:
-        df = self.processed_pos_data.copy()
-
-        df.loc[df["Position"].notna(), "IsDNF"] = False
-        df.loc[df["Position"].isna(), "IsDNF"] = True
-
-        self.processed_pos_data = df
+    @instrumented("_processed_corners")
+    def process_corners(self) -> Self:
+        self._processed_corners = self.track_parser.process_corners(self.map_center_coordinate)
 
         self.update_loading(1)
 
         return self
 
-    def compute_is_finished(self) -> Self:
-        df = self.processed_pos_data.copy()
-        df.loc[df["LapsCompletion"] == self.total_laps, "IsFinished"] = True
-        df.loc[df["IsFinished"].isna(), "IsFinished"] = False
-        df.loc[df["IsFinished"], "IsDNF"] = False
-
-        self.processed_pos_data = df
+    @instrumented("_session_results")
+    def process_team_colors(self) -> Self:
+        self._session_results = self.session_parser.process_team_colors()
 
         self.update_loading(1)
 
         return self
 
-    def compute_position_index(self) -> Self:
-        df = self.processed_pos_data.copy()
-
-        df["PositionIndex"] = (
-            df.sort_values(by=["SessionTimeTick", "LapsCompletion"], ascending=[True, False])
-            .groupby("SessionTimeTick")
-            .cumcount()
-            .add(1)
-            - 1
+    def store_processed_session(self) -> Self:
+        self.processed_session_cache.save(
+            {
+                "processed_pos_data": self.processed_pos_data,
+                "processed_laps": self.laps_parser.processed_laps,
+                "track_status": self.track_parser.track_status,
+                "processed_corners": self.processed_corners,
+                "session_results": self.session_results,
+                "fastest_lap_telemetry": self.fastest_lap_telemetry,
+            },
+            {
+                "total_laps": self.total_laps,
+                "session_start_time": self.session_start_time.value,
+                "session_end_time": self.session_end_time.value,
+                "map_center_coordinate": [float(coordinate) for coordinate in self.map_center_coordinate],
+            },
         )
-        df.loc[df["SessionTimeMilliseconds"] >= self.laps_parser.end_of_race_milliseconds, "PositionIndex"] = pd.NA
-        df["PositionIndex"] = df.groupby("DriverNumber")["PositionIndex"].ffill().astype("int64")
 
-        self.processed_pos_data = df
-
-        self.update_loading(2)
+        if self._built_tick_data is not None:
+            self._built_tick_data.tick_store.save(self.processed_session_cache.store_path("tick_store"))
 
         return self
 
-    def compute_fastest_lap(self) -> Self:
-        df = self.processed_pos_data.copy()
-
-        df["FastestLapTimeMilliseconds"] = df.sort_values(
-            by=["SessionTimeTick", "LapsCompletion"],
-            ascending=[True, False],
-        )["FastestLapTimeMillisecondsSoFar"].cummin()
-        df.loc[
-            df["FastestLapTimeMillisecondsSoFar"] == df["FastestLapTimeMilliseconds"],
-            "HasFastestLap",
-        ] = True
-        df.loc[df["HasFastestLap"].isna(), "HasFastestLap"] = False
-        df["HasFastestLap"] = df.groupby("DriverNumber")["HasFastestLap"].ffill()
-
-        self.processed_pos_data = df
-
-        self.update_loading(3)
-
-        return self
+    @instrumented("processed_pos_data")
+    def load_processed_session(self) -> Self:
+        metadata = self.processed_session_cache.load_metadata()
 
-    def compute_formatted_times(self) -> Self:
-        df = self.processed_pos_data.copy()
+        self.session_parser.total_laps = metadata["total_laps"]
+        self.session_parser.session_start_time = Timedelta(metadata["session_start_time"])
+        self.session_parser.session_end_time = Timedelta(metadata["session_end_time"])
+        self.map_center_coordinate = tuple(metadata["map_center_coordinate"])
+        self.update_loading(10)
 
-        df["S1ElapsedLapTimeFormatted"] = td_series_to_min_n_sec(df["S1ElapsedLapTimeMilliseconds"])
-        df["S2ElapsedLapTimeFormatted"] = td_series_to_min_n_sec(df["S2ElapsedLapTimeMilliseconds"])
-        df["S3ElapsedLapTimeFormatted"] = td_series_to_min_n_sec(df["S3ElapsedLapTimeMilliseconds"])
-        df["ElapsedLapTimeFormatted"] = td_series_to_min_n_sec(df["ElapsedLapTimeMilliseconds"])
+        self.processed_pos_data = self.processed_session_cache.load_frame("processed_pos_data")
+        self.update_loading(60)
 
-        self.processed_pos_data = df
+        self.laps_parser.processed_laps = self.processed_session_cache.load_frame("processed_laps")
+        self.track_parser.track_status = self.processed_session_cache.load_frame("track_status")
+        self._processed_corners = self.processed_session_cache.load_frame("processed_corners")
+        self._session_results = self.processed_session_cache.load_frame("session_results")
+        self.fastest_lap_telemetry = self.processed_session_cache.load_frame("fastest_lap_telemetry")
 
-        return self
+        tick_store_path = self.processed_session_cache.store_path("tick_store")
+        if tick_store_path.exists():
+            self._built_tick_data = self.build_tick_data(TickDriverStore.load(tick_store_path))
 
-    def compute_diff_to_car_in_front(self) -> Self:
-        df = self.processed_pos_data.copy()
-        df.loc[
-            (df["SessionTimeMilliseconds"] >= df["Sector1SessionTimeMilliseconds"]),
-            "DiffToCarInFront",
-        ] = df["S1DiffToCarAhead"]
-        df.loc[
-            (df["SessionTimeMilliseconds"] >= df["Sector2SessionTimeMilliseconds"]),
-            "DiffToCarInFront",
-        ] = df["S2DiffToCarAhead"]
-        df.loc[
-            (df["SessionTimeMilliseconds"] >= df["Sector3SessionTimeMilliseconds"]),
-            "DiffToCarInFront",
-        ] = df["S3DiffToCarAhead"]
-        df.loc[df["PositionIndex"] == 0, "DiffToCarInFront"] = 0
-        df["DiffToCarInFront"] = df.groupby("DriverNumber")["DiffToCarInFront"].ffill()
-        df["DiffToCarInFront"] = round(df["DiffToCarInFront"] / 1000, 3)
-
-        self.processed_pos_data = df
-
-        self.update_loading(5)
+        self.update_loading(30)
 
         return self
 
-    def compute_diff_to_leader(self) -> Self:
-        df = self.processed_pos_data.copy()
-        df["DiffToLeader"] = (
-            df.sort_values(by=["SessionTimeTick", "LapsCompletion"], ascending=[True, False])
-            .groupby(["SessionTimeTick"])["DiffToCarInFront"]
-            .cumsum()
-        )
-        df["DiffToLeader"] = round(df["DiffToLeader"], 3)
-
-        self.processed_pos_data = df
-
-        self.update_loading(5)
+    @instrumented()
+    def load_session(self) -> Self:
+        # Car data can not be loaded apart from the position data, fastf1 derives the session t0 from both
+        self.session.load(laps=True, telemetry=True, weather=False, messages=False)
+        self.session_loaded = True
 
         return self
 
-    def compute_in_pit(self) -> Self:
-        df = self.processed_pos_data.copy()
-
-        df.loc[
-            (
-                (df["PitInTimeMilliseconds"].notna() & (df["PitInTimeMilliseconds"] <= df["SessionTimeMilliseconds"]))
-                | (
-                    df["PitOutTimeMilliseconds"].notna()
-                    & (df["PitOutTimeMilliseconds"] >= df["SessionTimeMilliseconds"])
-                )
-            ),
-            "InPit",
-        ] = True
-
-        df["InPit"] = df["InPit"].astype("boolean").fillna(False)
-
-        self.processed_pos_data = df
-
-        self.update_loading(5)
-
-        return self
+    def process_session(self) -> Self:
+        self.load_session()
+        self.update_loading(38)
 
-    def parse_telemetry(self) -> Self:
-        self.processed_car_data = self.telemetry_parser.parse(
-            self.session_start_time,
-            self.session_end_time,
-            self.session_time_ticks_df,
+        (
+            StageScheduler(self.stage_workers)
+            .add("parse_laps", self.parse_laps)
+            .add("process_team_colors", self.process_team_colors)
+            .add("process_fastest_lap", self.process_fastest_lap, ["parse_laps"])
+            .add("process_corners", self.process_corners, ["process_fastest_lap"])
+            .add("parse_pos_data", self.parse_pos_data, ["process_fastest_lap"])
+            .add("merge_pos_and_laps", self.merge_pos_and_laps, ["parse_laps", "parse_pos_data"])
+            .add("compute_lap_completion", self.compute_lap_completion, ["merge_pos_and_laps"])
+            .add("compute_is_dnf", self.compute_is_dnf, ["compute_lap_completion"])
+            .add("compute_is_finished", self.compute_is_finished, ["compute_is_dnf"])
+            .add("compute_position_index", self.compute_position_index, ["compute_is_finished"])
+            .add("compute_fastest_lap", self.compute_fastest_lap, ["compute_position_index"])
+            .add("compute_formatted_times", self.compute_formatted_times, ["compute_fastest_lap"])
+            .add("compute_diff_to_car_in_front", self.compute_diff_to_car_in_front, ["compute_formatted_times"])
+            .add("compute_diff_to_leader", self.compute_diff_to_leader, ["compute_diff_to_car_in_front"])
+            .add("compute_in_pit", self.compute_in_pit, ["compute_diff_to_leader"])
+            .run()
         )
 
-        self.update_loading(15)
-
         return self
 
-    def merge_pos_and_car_data(self) -> Self:
-        df = self.processed_pos_data.copy()
-        car_data = self.processed_car_data.copy()
+    def compute_window_end_ticks(self, pos_data: DataFrame) -> list[int]:
+        laps_df = self.laps_parser.processed_laps
+        ts_df = pos_data[["SessionTimeTick", "SessionTimeMilliseconds"]].drop_duplicates(keep="first")
+
+        window_laps = []
+        lap_number = self.progressive_window_laps
+        while lap_number < self.total_laps:
+            window_laps.append(lap_number)
+            lap_number *= 2
+
+        # A window closes when the leader completes its last lap
+        completed_laps_df = laps_df[laps_df["LapNumber"].isin(window_laps) & (laps_df["LapTimeMilliseconds"] > 0)]
+        lap_end_milliseconds = completed_laps_df.groupby("LapNumber")["LapEndTimeMilliseconds"].min()
+        end_ticks = self.compute_ticks_at(ts_df, lap_end_milliseconds.to_numpy())
+
+        last_tick = int(pos_data["SessionTimeTick"].max())
+        window_end_ticks = set(end_ticks[~np.isnan(end_ticks)].astype("int64").tolist()) - {last_tick}
+
+        return [*sorted(window_end_ticks), last_tick]
+
+    def process_pos_data_window(self, pos_data: DataFrame, end_tick: int) -> DataFrame:
+        # The window runs one tick past its end, laps that start after the window all land on that extra tick
+        window = PosDataWindow(
+            pos_data[pos_data["SessionTimeTick"] <= end_tick + 1],
+            self.processed_laps,
+            self.end_of_race_milliseconds,
+            self.total_laps,
+            self.timing_report,
+        )
 
-        combined_df = df.merge(car_data, on=["DriverNumber", "SessionTimeTick"], how="left")
-        combined_df["RPM"] = combined_df.groupby("DriverNumber")["RPM"].ffill()
-        combined_df["Speed"] = combined_df.groupby("DriverNumber")["Speed"].ffill()
-        combined_df["SpeedMph"] = combined_df.groupby("DriverNumber")["SpeedMph"].ffill()
-        combined_df["nGear"] = combined_df.groupby("DriverNumber")["nGear"].ffill()
-        combined_df["Throttle"] = combined_df.groupby("DriverNumber")["Throttle"].ffill()
-        combined_df["Brake"] = combined_df.groupby("DriverNumber")["Brake"].ffill()
-        combined_df["DRS"] = combined_df.groupby("DriverNumber")["DRS"].ffill()
-        combined_df["DRS"] = combined_df["DRS"].fillna(0)
-        combined_df["DRS"] = combined_df["DRS"].astype("int64")
+        (
+            window.merge_pos_and_laps()
+            .compute_lap_completion()
+            .compute_is_dnf()
+            .compute_is_finished()
+            .compute_position_index()
+            .compute_fastest_lap()
+            .compute_formatted_times()
+            .compute_diff_to_car_in_front()
+            .compute_diff_to_leader()
+            .compute_in_pit()
+        )
 
-        self.processed_pos_data = combined_df
+        df = window.processed_pos_data
+        if df["SessionTimeTick"].max() <= end_tick:
+            return df
 
-        self.update_loading(3)
+        return df[df["SessionTimeTick"] <= end_tick].reset_index(drop=True)
 
-        return self
+    def process_session_in_windows(self) -> Self:
+        self.load_session()
+        self.update_loading(38)
 
-    def process_weather_data(self) -> Self:
-        self.weather_parser.parse(
-            self.session_time_ticks_df,
-            self.session_start_time,
-            self.session_end_time,
+        (
+            StageScheduler(self.stage_workers)
+            .add("parse_laps", self.parse_laps)
+            .add("process_team_colors", self.process_team_colors)
+            .add("process_fastest_lap", self.process_fastest_lap, ["parse_laps"])
+            .add("process_corners", self.process_corners, ["process_fastest_lap"])
+            .add("parse_pos_data", self.parse_pos_data, ["process_fastest_lap"])
+            .run()
         )
 
-        self.update_loading(10)
+        pos_data = self.processed_pos_data
+        for end_tick in self.compute_window_end_ticks(pos_data):
+            self.processed_pos_data = self.process_pos_data_window(pos_data, end_tick)
+            self._processed_ticks = end_tick
 
-        return self
-
-    def process_corners(self) -> Self:
-        self._processed_corners = self.track_parser.process_corners(self.map_center_coordinate)
-
-        self.update_loading(1)
+            self.build_tick_store().publish_session()
 
         return self
 
-    def process_team_colors(self) -> Self:
-        self._session_results = self.session_parser.process_team_colors()
+    def publish_session(self) -> None:
+        if self.session_ready:
+            # The UI reads the tick data every frame, an extension is swapped in between frames on the main thread
+            self.task_manager.add(
+                self.extend_session,
+                "extendSession",
+                extraArgs=[self._built_tick_data],
+                appendTask=True,
+            )
+            return
 
-        self.update_loading(1)
+        self._tick_data = self._built_tick_data
+        self.session_ready = True
+        self.delete_loading()
+        messenger.send("sessionSelected")
 
-        return self
+    def extend_session(self, tick_data: TickData, task: Task) -> Any:
+        self._tick_data = tick_data
+        self._snapshot = None
+        messenger.send("sessionExtended", sentArgs=[self.processed_ticks])
+
+        return task.done
 
     def render_wait_bar(self) -> None:
         width = 400
@@ -554,6 +736,16 @@ class DataExtractorService(DirectObject):
             text="Loading ...",
         )
 
+        self.timing_text = OnscreenText(
+            parent=self.loading_frame,
+            pos=(10, -(height - 75)),
+            scale=11,
+            fg=(1, 1, 1, 0.6),
+            font=self.text_font,
+            align=TextNode.A_left,
+            text="",
+        )
+
         self.wait_bar = DirectWaitBar(
             parent=self.loading_frame,
             text="WaitBar",
@@ -565,43 +757,121 @@ class DataExtractorService(DirectObject):
         )
 
     def update_loading(self, value: int) -> None:
-        self.wait_bar["value"] += value
+        if self.wait_bar is None:
+            return
+
+        with self.loading_lock:
+            self.wait_bar["value"] += value
+
+    def show_stage_timing(self, _timing: StageTiming) -> None:
+        if self.timing_text is None:
+            return
+
+        with self.loading_lock:
+            self.timing_text["text"] = self.timing_report.summary(4)
 
     def delete_loading(self) -> None:
+        with self.loading_lock:
+            self.timing_text.destroy()
+            self.timing_text = None
+
         self.wait_bar.destroy()
         self.loading_text.destroy()
         self.loading_frame.destroy()
+        self.wait_bar = None
+
+    def write_timing_report(self) -> None:
+        metadata = {
+            "year": self.session_parser.year,
+            "event_name": self.session_parser.event_name,
+            "session_id": self.session_parser.session_id,
+            "pandas_version": pd.__version__,
+            "fastf1_version": fastf1.__version__,
+            "pipeline_version": self.processed_session_cache.pipeline_version,
+        }
+
+        if self._dtype_report is not None:
+            metadata["dtype_report"] = self._dtype_report.to_dict(orient="records")
+
+        self.timing_report.write_json(self.timing_report_path, metadata)
 
     def load_data(self) -> None:
         self.render_wait_bar()
         self.task_manager.add(self.extract, "extractData", taskChain="loadingData")
 
     def extract(self, task: Task) -> Any:
-        self.session.load()
-        self.update_loading(10)
+        if self.processed_session_cache.exists():
+            self.load_processed_session()
+        elif self.progressive_window_laps:
+            (
+                self.process_session_in_windows()
+                .compact_processed_pos_data()
+                .build_tick_store()
+                .store_processed_session()
+            )
+        else:
+            self.process_session().compact_processed_pos_data().build_tick_store().store_processed_session()
 
-        (
-            self.parse_laps()
-            .process_fastest_lap()
-            .parse_pos_data()
-            .parse_telemetry()
-            .merge_pos_and_laps()
-            .compute_lap_completion()
-            .compute_is_dnf()
-            .compute_is_finished()
-            .compute_position_index()
-            .compute_fastest_lap()
-            .compute_formatted_times()
-            .compute_diff_to_car_in_front()
-            .compute_diff_to_leader()
-            .compute_in_pit()
-            .merge_pos_and_car_data()
-            .process_weather_data()
-            .process_corners()
-            .process_team_colors()
-        )
+        self.publish_session()
 
-        self.delete_loading()
-        messenger.send("sessionSelected")
+        if self.timing_report_path is not None:
+            self.write_timing_report()
+
+        return task.done
+
+    def request_car_telemetry(self) -> None:
+        if self.car_telemetry_requested:
+            return
+
+        self.car_telemetry_requested = True
+        self.task_manager.add(self.extract_car_telemetry, "extractCarTelemetry", taskChain="loadingData")
+
+    def extract_car_telemetry(self, task: Task) -> Any:
+        if self.processed_session_cache.has_frame("processed_car_data"):
+            self.processed_car_data = self.processed_session_cache.load_frame("processed_car_data")
+        else:
+            if not self.session_loaded:
+                self.load_session()
+
+            self.parse_telemetry()
+
+            if self.processed_session_cache.exists():
+                self.processed_session_cache.save_frame("processed_car_data", self.processed_car_data)
+
+        self._car_telemetry = {}
+
+        return task.done
+
+    def request_weather_data(self) -> None:
+        if self.weather_requested:
+            return
+
+        self.weather_requested = True
+        self.task_manager.add(self.extract_weather_data, "extractWeatherData", taskChain="loadingData")
+
+    def extract_weather_data(self, task: Task) -> Any:
+        if self.processed_session_cache.has_frame("processed_weather_data"):
+            self.weather_parser.processed_weather_data = self.processed_session_cache.load_frame(
+                "processed_weather_data",
+            )
+        else:
+            self.weather_parser.load_weather_data()
+            self.process_weather_data()
+
+            if self.processed_session_cache.exists():
+                self.processed_session_cache.save_frame(
+                    "processed_weather_data",
+                    self.weather_parser.processed_weather_data,
+                )
+
+        self.weather_ready = True
+        self.task_manager.add(self.publish_weather, "publishWeather", appendTask=True)
+
+        return task.done
+
+    def publish_weather(self, task: Task) -> Any:
+        # Snapshots taken before the weather loaded are dropped on the main thread, where the UI reads them
+        self._snapshot = None
+        messenger.send("weatherLoaded")
 
         return task.done
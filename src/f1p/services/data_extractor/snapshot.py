@@ -0,0 +1,103 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Self
+
+from pandas import Series
+
+
+class TickSnapshot:
+    """
+    Read only view of everything the UI renders for a single session time tick.
+    """
+
+    __slots__ = (
+        "_drivers",
+        "_lap_number",
+        "_playback_tick",
+        "_positions",
+        "_records",
+        "_session_time_tick",
+        "_track_status",
+        "_weather",
+        "_weather_row_id",
+    )
+
+    def __init__(
+        self,
+        session_time_tick: int,
+        records: dict[str, dict[str, object]],
+        lap_number: int,
+        track_status: Series | None,
+        weather_row_id: int | None,
+        weather: Series | None,
+        playback_tick: float | None = None,
+        positions: dict[str, tuple[float, float, float]] | None = None,
+    ):
+        records = MappingProxyType(
+            {driver_number: MappingProxyType(record) for driver_number, record in records.items()},
+        )
+
+        object.__setattr__(self, "_session_time_tick", session_time_tick)
+        object.__setattr__(self, "_records", records)
+        object.__setattr__(self, "_drivers", tuple(sorted(records.values(), key=lambda r: r["PositionIndex"])))
+        object.__setattr__(self, "_lap_number", lap_number)
+        object.__setattr__(self, "_track_status", track_status)
+        object.__setattr__(self, "_weather_row_id", weather_row_id)
+        object.__setattr__(self, "_weather", weather)
+        object.__setattr__(self, "_playback_tick", session_time_tick if playback_tick is None else playback_tick)
+        object.__setattr__(self, "_positions", MappingProxyType(positions or {}))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("TickSnapshot is immutable.")
+
+    @property
+    def session_time_tick(self) -> int:
+        return self._session_time_tick
+
+    @property
+    def playback_tick(self) -> float:
+        return self._playback_tick
+
+    @property
+    def drivers(self) -> tuple[Mapping[str, object], ...]:
+        return self._drivers
+
+    @property
+    def lap_number(self) -> int:
+        return self._lap_number
+
+    @property
+    def track_status(self) -> Series | None:
+        return self._track_status
+
+    @property
+    def weather_row_id(self) -> int | None:
+        return self._weather_row_id
+
+    @property
+    def weather(self) -> Series | None:
+        return self._weather
+
+    def driver(self, driver_number: str) -> Mapping[str, object] | None:
+        return self._records.get(driver_number)
+
+    def position(self, driver_number: str) -> tuple[float, float, float] | None:
+        if driver_number in self._positions:
+            return self._positions[driver_number]
+
+        record = self.driver(driver_number)
+        if record is None:
+            return None
+
+        return record["X"], record["Y"], record["Z"]
+
+    def at_playback_tick(self, playback_tick: float, positions: dict[str, tuple[float, float, float]]) -> Self:
+        snapshot = object.__new__(type(self))
+
+        for name in self.__slots__:
+            object.__setattr__(snapshot, name, getattr(self, name))
+
+        object.__setattr__(snapshot, "_playback_tick", playback_tick)
+        object.__setattr__(snapshot, "_positions", MappingProxyType(positions))
+
+        return snapshot
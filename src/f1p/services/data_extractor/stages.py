@@ -0,0 +1,276 @@
+from typing import Self
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from f1p.utils.performance import TimingReport, instrumented
+from f1p.utils.timedelta import td_series_to_min_n_sec
+
+
+class PosDataStages:
+    """
+    Stages that derive the lap, position and gap columns of processed_pos_data from the processed laps.
+    Shared by the service, which runs them on the whole session, and by the windows of a progressive load.
+    """
+
+    processed_pos_data: DataFrame | None
+    processed_laps: DataFrame
+    end_of_race_milliseconds: int
+    total_laps: int
+    timing_report: TimingReport | None
+
+    def update_loading(self, value: int) -> None:
+        # Only the service has a wait bar, windows do not report progress per stage
+        pass
+
+    @staticmethod
+    def compute_ticks_at(ts_df: DataFrame, milliseconds: np.ndarray) -> np.ndarray:
+        ts_df = ts_df.sort_values("SessionTimeMilliseconds", kind="stable")
+        tick_milliseconds = ts_df["SessionTimeMilliseconds"].to_numpy()
+        latest_ticks = np.maximum.accumulate(ts_df["SessionTimeTick"].to_numpy(dtype="float64"))
+
+        positions = np.searchsorted(tick_milliseconds, milliseconds, side="right") - 1
+
+        return np.where(positions >= 0, latest_ticks[positions.clip(min=0)], np.nan)
+
+    @instrumented("processed_pos_data")
+    def merge_pos_and_laps(self) -> Self:
+        df = self.processed_pos_data
+        ts_df = df[["SessionTimeTick", "SessionTimeMilliseconds"]].drop_duplicates(keep="first")
+        laps_df = self.processed_laps.copy()
+
+        laps_df["SessionTimeTick"] = self.compute_ticks_at(ts_df, laps_df["LapStartTimeMilliseconds"].to_numpy())
+        laps_df.loc[laps_df["LapNumber"] == 1.0, "SessionTimeTick"] = 1
+        laps_df = laps_df.dropna(subset=["SessionTimeTick"])
+        laps_df["SessionTimeTick"] = laps_df["SessionTimeTick"].astype("int64")
+
+        lap_n_tick_df = laps_df[["DriverNumber", "LapNumber", "SessionTimeTick"]]
+
+        # Merge once to get he LapNumber and fill it for all SessionTimeTicks
+        combined_df = df.merge(lap_n_tick_df, on=["DriverNumber", "SessionTimeTick"], how="left")
+        combined_df["LapNumber"] = combined_df.groupby("DriverNumber")["LapNumber"].ffill()
+
+        # Merge second time with full laps_df to get full data per SessionTimeTick
+        combined_df = combined_df.merge(laps_df, on=["DriverNumber", "LapNumber"], how="left")
+        combined_df = combined_df.rename(
+            columns={
+                "Time_x": "Time",
+                "Time_y": "TimeLap",
+                "SessionTimeTick_x": "SessionTimeTick",
+            },
+        )
+        combined_df = combined_df.drop(columns=["SessionTimeTick_y"])
+
+        self.processed_pos_data = combined_df
+
+        # TODO figure out what to do with drivers that have no lap data at all. Should probably zero out everything
+        #      relevant for them and DNS them
+
+        self.update_loading(5)
+
+        return self
+
+    @staticmethod
+    def compute_elapsed_time(df: DataFrame, start_column: str, column_name: str) -> None:
+        df[column_name] = df["SessionTime"] - df[start_column]
+        time_in_milliseconds = df.loc[df[column_name].notna(), column_name].dt.total_seconds() * 1e3
+        df.loc[df[column_name].notna(), f"{column_name}Milliseconds"] = time_in_milliseconds.astype("int64")
+
+    @instrumented("processed_pos_data")
+    def compute_lap_completion(self) -> Self:
+        df = self.processed_pos_data
+
+        self.compute_elapsed_time(df, "LapStartTime", "S1ElapsedLapTime")
+        self.compute_elapsed_time(df, "Sector1SessionTime", "S2ElapsedLapTime")
+        self.compute_elapsed_time(df, "Sector2SessionTime", "S3ElapsedLapTime")
+        self.compute_elapsed_time(df, "LapStartTime", "ElapsedLapTime")
+
+        df["LapStartTimeMilliseconds"] = df.groupby("DriverNumber")["LapStartTimeMilliseconds"].ffill()
+        df["LapEndTimeMilliseconds"] = df.groupby("DriverNumber")["LapEndTimeMilliseconds"].ffill()
+
+        df.loc[
+            (df["LapNumber"] == self.total_laps) & (df["SessionTimeMilliseconds"] > df["LapEndTimeMilliseconds"]),
+            "LapNumber",
+        ] = self.total_laps + 1
+
+        df["ElapsedTimeSinceStartOfLapMilliseconds"] = df["SessionTimeMilliseconds"] - df["LapStartTimeMilliseconds"]
+        df["LapPercentageCompletion"] = df["ElapsedTimeSinceStartOfLapMilliseconds"] / df["LapTimeMilliseconds"]
+        df["LapPercentageCompletion"] = df["LapPercentageCompletion"].replace([np.inf, -np.inf, np.nan], 0)
+        df.loc[df["LapNumber"] > self.total_laps, "LapPercentageCompletion"] = 0
+        df["LapsCompletion"] = (df["LapNumber"] - 1) + df["LapPercentageCompletion"]
+
+        self.processed_pos_data = df
+
+        self.update_loading(5)
+
+        return self
+
+    @instrumented("processed_pos_data")
+    def compute_is_dnf(self) -> Self:
+        df = self.processed_pos_data
+
+        df.loc[df["Position"].notna(), "IsDNF"] = False
+        df.loc[df["Position"].isna(), "IsDNF"] = True
+
+        self.processed_pos_data = df
+
+        self.update_loading(1)
+
+        return self
+
+    @instrumented("processed_pos_data")
+    def compute_is_finished(self) -> Self:
+        df = self.processed_pos_data
+        df.loc[df["LapsCompletion"] == self.total_laps, "IsFinished"] = True
+        df.loc[df["IsFinished"].isna(), "IsFinished"] = False
+        df.loc[df["IsFinished"], "IsDNF"] = False
+
+        self.processed_pos_data = df
+
+        self.update_loading(1)
+
+        return self
+
+    @instrumented("processed_pos_data")
+    def compute_position_index(self) -> Self:
+        df = self.processed_pos_data
+
+        df["PositionIndex"] = (
+            df[["SessionTimeTick", "LapsCompletion"]]
+            .sort_values(by=["SessionTimeTick", "LapsCompletion"], ascending=[True, False])
+            .groupby("SessionTimeTick")
+            .cumcount()
+            .add(1)
+            - 1
+        )
+        df.loc[df["SessionTimeMilliseconds"] >= self.end_of_race_milliseconds, "PositionIndex"] = pd.NA
+        df["PositionIndex"] = df.groupby("DriverNumber")["PositionIndex"].ffill().astype("int64")
+
+        self.processed_pos_data = df
+
+        self.update_loading(2)
+
+        return self
+
+    @instrumented("processed_pos_data")
+    def compute_fastest_lap(self) -> Self:
+        df = self.processed_pos_data
+
+        df["FastestLapTimeMilliseconds"] = (
+            df[["SessionTimeTick", "LapsCompletion", "FastestLapTimeMillisecondsSoFar"]]
+            .sort_values(by=["SessionTimeTick", "LapsCompletion"], ascending=[True, False])
+            .loc[:, "FastestLapTimeMillisecondsSoFar"]
+            .cummin()
+        )
+        df.loc[
+            df["FastestLapTimeMillisecondsSoFar"] == df["FastestLapTimeMilliseconds"],
+            "HasFastestLap",
+        ] = True
+        df.loc[df["HasFastestLap"].isna(), "HasFastestLap"] = False
+        df["HasFastestLap"] = df.groupby("DriverNumber")["HasFastestLap"].ffill()
+
+        self.processed_pos_data = df
+
+        self.update_loading(3)
+
+        return self
+
+    @instrumented("processed_pos_data")
+    def compute_formatted_times(self) -> Self:
+        df = self.processed_pos_data
+
+        df["S1ElapsedLapTimeFormatted"] = td_series_to_min_n_sec(df["S1ElapsedLapTimeMilliseconds"])
+        df["S2ElapsedLapTimeFormatted"] = td_series_to_min_n_sec(df["S2ElapsedLapTimeMilliseconds"])
+        df["S3ElapsedLapTimeFormatted"] = td_series_to_min_n_sec(df["S3ElapsedLapTimeMilliseconds"])
+        df["ElapsedLapTimeFormatted"] = td_series_to_min_n_sec(df["ElapsedLapTimeMilliseconds"])
+
+        self.processed_pos_data = df
+
+        return self
+
+    @instrumented("processed_pos_data")
+    def compute_diff_to_car_in_front(self) -> Self:
+        df = self.processed_pos_data
+        df.loc[
+            (df["SessionTimeMilliseconds"] >= df["Sector1SessionTimeMilliseconds"]),
+            "DiffToCarInFront",
+        ] = df["S1DiffToCarAhead"]
+        df.loc[
+            (df["SessionTimeMilliseconds"] >= df["Sector2SessionTimeMilliseconds"]),
+            "DiffToCarInFront",
+        ] = df["S2DiffToCarAhead"]
+        df.loc[
+            (df["SessionTimeMilliseconds"] >= df["Sector3SessionTimeMilliseconds"]),
+            "DiffToCarInFront",
+        ] = df["S3DiffToCarAhead"]
+        df.loc[df["PositionIndex"] == 0, "DiffToCarInFront"] = 0
+        df["DiffToCarInFront"] = df.groupby("DriverNumber")["DiffToCarInFront"].ffill()
+        df["DiffToCarInFront"] = round(df["DiffToCarInFront"] / 1000, 3)
+
+        self.processed_pos_data = df
+
+        self.update_loading(5)
+
+        return self
+
+    @instrumented("processed_pos_data")
+    def compute_diff_to_leader(self) -> Self:
+        df = self.processed_pos_data
+        df["DiffToLeader"] = (
+            df[["SessionTimeTick", "LapsCompletion", "DiffToCarInFront"]]
+            .sort_values(by=["SessionTimeTick", "LapsCompletion"], ascending=[True, False])
+            .groupby(["SessionTimeTick"])["DiffToCarInFront"]
+            .cumsum()
+        )
+        df["DiffToLeader"] = round(df["DiffToLeader"], 3)
+
+        self.processed_pos_data = df
+
+        self.update_loading(5)
+
+        return self
+
+    @instrumented("processed_pos_data")
+    def compute_in_pit(self) -> Self:
+        df = self.processed_pos_data
+
+        df.loc[
+            (
+                (df["PitInTimeMilliseconds"].notna() & (df["PitInTimeMilliseconds"] <= df["SessionTimeMilliseconds"]))
+                | (
+                    df["PitOutTimeMilliseconds"].notna()
+                    & (df["PitOutTimeMilliseconds"] >= df["SessionTimeMilliseconds"])
+                )
+            ),
+            "InPit",
+        ] = True
+
+        df["InPit"] = df["InPit"].astype("boolean").fillna(False)
+
+        self.processed_pos_data = df
+
+        self.update_loading(5)
+
+        return self
+
+
+class PosDataWindow(PosDataStages):
+    """
+    Context a progressive load window is processed in, holding only what the pos data stages read.
+    Nothing in it is shared with the service but the timing report, so a window can not touch published state.
+    """
+
+    def __init__(
+        self,
+        processed_pos_data: DataFrame,
+        processed_laps: DataFrame,
+        end_of_race_milliseconds: int,
+        total_laps: int,
+        timing_report: TimingReport | None = None,
+    ):
+        self.processed_pos_data = processed_pos_data
+        self.processed_laps = processed_laps
+        self.end_of_race_milliseconds = end_of_race_milliseconds
+        self.total_laps = total_laps
+        self.timing_report = timing_report
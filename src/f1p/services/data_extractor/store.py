@@ -0,0 +1,234 @@
+import json
+import shutil
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_timedelta64_dtype,
+)
+
+
+class TickDriverStore:
+    """
+    Struct of arrays view of the long format position frame, every column is a [tick, driver_index] array.
+    Columns holding strings or other python objects are stored as codes into a per column categories array.
+    """
+
+    def __init__(
+        self,
+        arrays: dict[str, np.ndarray],
+        driver_numbers: list[str],
+        first_tick: int,
+        categories: dict[str, np.ndarray] | None = None,
+    ):
+        self.arrays = arrays
+        self.driver_numbers = driver_numbers
+        self.first_tick = first_tick
+        self.categories = categories or {}
+
+        self.driver_index: dict[str, int] = {
+            driver_number: index for index, driver_number in enumerate(self.driver_numbers)
+        }
+
+    @property
+    def columns(self) -> list[str]:
+        return [column for column in self.arrays if column != "Present"]
+
+    @property
+    def last_tick(self) -> int:
+        return self.first_tick + len(self.arrays["Present"]) - 1
+
+    @property
+    def present(self) -> np.ndarray:
+        return self.arrays["Present"]
+
+    @staticmethod
+    def array_dtype(df: DataFrame, column: str) -> tuple[np.dtype, object] | None:
+        dtype = df[column].dtype
+
+        if is_bool_dtype(dtype):
+            return np.dtype("bool"), False
+
+        # Nullable extension dtypes (Int64, Float64, ...) expose the plain numpy dtype they wrap
+        if is_integer_dtype(dtype):
+            return np.dtype(getattr(dtype, "numpy_dtype", dtype)), 0
+
+        if is_float_dtype(dtype):
+            return np.dtype(getattr(dtype, "numpy_dtype", dtype)), np.nan
+
+        if is_timedelta64_dtype(dtype) or is_datetime64_dtype(dtype):
+            return np.dtype(dtype), np.datetime64("NaT") if is_datetime64_dtype(dtype) else np.timedelta64("NaT")
+
+        return None
+
+    @staticmethod
+    def factorize(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        try:
+            codes, uniques = pd.factorize(values)
+        except TypeError:
+            # Unhashable list cells, compact_dtypes already does the same conversion
+            codes, uniques = pd.factorize(values.map(lambda value: tuple(value) if isinstance(value, list) else value))
+
+        code_dtype = next(dtype for dtype in ("int8", "int16", "int32") if len(uniques) < np.iinfo(dtype).max)
+
+        # The trailing NaN is what missing (-1) codes resolve to
+        return codes.astype(code_dtype), np.append(np.asarray(uniques, dtype=object), np.nan)
+
+    @classmethod
+    def from_frame(cls, df: DataFrame) -> Self:
+        driver_numbers = sorted(df["DriverNumber"].unique().tolist(), key=lambda number: (len(number), number))
+        driver_codes = pd.Categorical(df["DriverNumber"], categories=driver_numbers).codes
+
+        ticks = df["SessionTimeTick"].to_numpy()
+        first_tick = int(ticks.min())
+        rows = ticks - first_tick
+        shape = (int(ticks.max()) - first_tick + 1, len(driver_numbers))
+
+        arrays = {"Present": np.zeros(shape, dtype="bool")}
+        arrays["Present"][rows, driver_codes] = True
+
+        categories = {}
+
+        for column in df.columns:
+            if column == "DriverNumber":
+                continue
+
+            array_dtype = cls.array_dtype(df, column)
+            if array_dtype is None:
+                codes, categories[column] = cls.factorize(df[column])
+                array = np.full(shape, -1, dtype=codes.dtype)
+                array[rows, driver_codes] = codes
+                arrays[column] = array
+                continue
+
+            dtype, fill_value = array_dtype
+            array = np.full(shape, fill_value, dtype=dtype)
+            array[rows, driver_codes] = df[column].to_numpy(dtype=dtype, na_value=fill_value)
+            arrays[column] = array
+
+        return cls(arrays, driver_numbers, first_tick, categories)
+
+    def at(self, tick: int) -> dict[str, np.ndarray]:
+        row = tick - self.first_tick
+
+        return {column: array[row] for column, array in self.arrays.items()}
+
+    def records(self, tick: int) -> dict[str, dict[str, object]]:
+        row = tick - self.first_tick
+        present = self.present[row]
+        driver_numbers = [number for number, is_present in zip(self.driver_numbers, present, strict=True) if is_present]
+
+        columns = ["DriverNumber", *self.columns]
+        values = [driver_numbers]
+        for column in self.columns:
+            column_values = self.arrays[column][row, present]
+
+            if column in self.categories:
+                values.append(self.categories[column][column_values].tolist())
+            elif column_values.dtype.kind in "mM":
+                # tolist() would turn nanosecond precision values into plain integers
+                values.append(list(column_values))
+            else:
+                values.append(column_values.tolist())
+
+        return {
+            driver_number: dict(zip(columns, record, strict=True))
+            for driver_number, record in zip(driver_numbers, zip(*values, strict=True), strict=True)
+        }
+
+    def interpolate(
+        self,
+        playback_tick: float,
+        columns: tuple[str, ...] = ("X", "Y", "Z"),
+        time_column: str = "SessionTimeMilliseconds",
+    ) -> np.ndarray:
+        """
+        Linear [driver_index, column] interpolation between the two ticks around a fractional playback tick.
+        Drivers are blended on their own session time, drivers missing at the lower tick come back as NaN.
+        """
+        lower_row = min(max(int(playback_tick) - self.first_tick, 0), len(self.present) - 1)
+        upper_row = min(lower_row + 1, len(self.present) - 1)
+        fraction = min(max(playback_tick - self.first_tick - lower_row, 0.0), 1.0)
+
+        lower_present = self.present[lower_row]
+        both_present = lower_present & self.present[upper_row]
+
+        weights = np.where(both_present, fraction, 0.0)
+        if time_column in self.arrays and both_present.any():
+            lower_times = self.arrays[time_column][lower_row].astype("float64")
+            upper_times = self.arrays[time_column][upper_row].astype("float64")
+
+            session_time = lower_times[both_present].mean()
+            session_time += fraction * (upper_times[both_present].mean() - session_time)
+
+            durations = upper_times - lower_times
+            with np.errstate(divide="ignore", invalid="ignore"):
+                time_weights = np.clip((session_time - lower_times) / durations, 0.0, 1.0)
+
+            weights = np.where(both_present & (durations > 0), time_weights, weights)
+
+        lower_values = np.stack([self.arrays[column][lower_row] for column in columns], axis=1).astype("float64")
+        upper_values = np.stack([self.arrays[column][upper_row] for column in columns], axis=1).astype("float64")
+        upper_values = np.where(both_present[:, None], upper_values, lower_values)
+
+        values = lower_values + weights[:, None] * (upper_values - lower_values)
+        values[~lower_present] = np.nan
+
+        return values
+
+    def value(self, column: str, tick: int, driver_number: str) -> object:
+        value = self.arrays[column][tick - self.first_tick, self.driver_index[driver_number]]
+
+        if column in self.categories:
+            return self.categories[column][value]
+
+        return value
+
+    def save(self, path: Path) -> None:
+        staging_path = path.with_name(f"{path.name}.tmp")
+
+        if staging_path.exists():
+            shutil.rmtree(staging_path)
+
+        staging_path.mkdir(parents=True)
+
+        for column, array in self.arrays.items():
+            np.save(staging_path / f"{column}.npy", array)
+
+        for column, categories in self.categories.items():
+            pd.to_pickle(categories, staging_path / f"{column}.categories.pkl")
+
+        (staging_path / "metadata.json").write_text(
+            json.dumps(
+                {
+                    "columns": list(self.arrays.keys()),
+                    "categories": list(self.categories.keys()),
+                    "driver_numbers": self.driver_numbers,
+                    "first_tick": self.first_tick,
+                },
+            ),
+        )
+
+        if path.exists():
+            shutil.rmtree(path)
+
+        staging_path.rename(path)
+
+    @classmethod
+    def load(cls, path: Path, mmap: bool = True) -> Self:
+        metadata = json.loads((path / "metadata.json").read_text())
+
+        arrays = {
+            column: np.load(path / f"{column}.npy", mmap_mode="r" if mmap else None) for column in metadata["columns"]
+        }
+
+        categories = {column: pd.read_pickle(path / f"{column}.categories.pkl") for column in metadata["categories"]}
+
+        return cls(arrays, metadata["driver_numbers"], metadata["first_tick"], categories)
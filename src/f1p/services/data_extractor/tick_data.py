@@ -0,0 +1,33 @@
+import numpy as np
+
+from f1p.services.data_extractor.leaderboard import LeaderboardTable
+from f1p.services.data_extractor.store import TickDriverStore
+
+
+class TickData:
+    """
+    Everything the UI reads per tick, built together from one tick store.
+    Published as a whole with a single assignment, so a frame never mixes state of two loaded windows.
+    """
+
+    __slots__ = (
+        "leader_lap_numbers",
+        "leaderboard_table",
+        "processed_ticks",
+        "tick_session_milliseconds",
+        "tick_store",
+    )
+
+    def __init__(
+        self,
+        tick_store: TickDriverStore,
+        leader_lap_numbers: np.ndarray,
+        tick_session_milliseconds: np.ndarray,
+        leaderboard_table: LeaderboardTable,
+        processed_ticks: int | None = None,
+    ):
+        self.tick_store = tick_store
+        self.leader_lap_numbers = leader_lap_numbers
+        self.tick_session_milliseconds = tick_session_milliseconds
+        self.leaderboard_table = leaderboard_table
+        self.processed_ticks = processed_ticks
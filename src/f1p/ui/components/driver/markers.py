@@ -0,0 +1,115 @@
+import numpy as np
+from panda3d.core import (
+    Geom,
+    GeomNode,
+    GeomTriangles,
+    GeomVertexArrayFormat,
+    GeomVertexData,
+    GeomVertexFormat,
+    GeomVertexReader,
+    NodePath,
+    OmniBoundingVolume,
+)
+
+from procedural3d import SphereMaker
+
+
+class CarMarkers:
+    """
+    Draws every car marker as a single Geom, one copy of a shared sphere per car in one dynamic vertex buffer.
+    A frame writes all marker positions in one buffer copy, so the field costs one node and one draw call.
+    """
+
+    position_tolerance: float = 0.001
+
+    def __init__(self, parent: NodePath, colors: list[tuple[float, float, float, float]], radius: float = 0.10):
+        self.parent = parent
+        self.radius = radius
+
+        self.template_vertices, self.template_normals, self.template_indices = self.sphere_template(radius)
+        self.marker_count = len(colors)
+
+        self.vertex_data = GeomVertexData("carMarkers", self.vertex_format(), Geom.UH_dynamic)
+        self.vertex_data.uncleanSetNumRows(self.marker_count * len(self.template_vertices))
+
+        self.vertices = np.empty((self.marker_count, self.template_vertices.size), dtype="float32")
+        # [3, vertex_count * 3] 0/1 matrix, a matmul spreads each position over every vertex of its marker
+        self.position_spread = np.tile(np.eye(3, dtype="float32"), len(self.template_vertices))
+        self.positions: np.ndarray | None = None
+
+        self.write_attributes(colors)
+        self.node_path = self.create_node_path()
+        self.update(np.zeros((self.marker_count, 3)))
+
+    @staticmethod
+    def sphere_template(radius: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        geom = SphereMaker(radius=radius, has_uvs=False).generate().getGeom(0)
+        vertex_data = geom.getVertexData()
+
+        vertex_reader = GeomVertexReader(vertex_data, "vertex")
+        normal_reader = GeomVertexReader(vertex_data, "normal")
+        vertices = np.array([vertex_reader.getData3() for _ in range(vertex_data.getNumRows())], dtype="float32")
+        normals = np.array([normal_reader.getData3() for _ in range(vertex_data.getNumRows())], dtype="float32")
+
+        primitive = geom.getPrimitive(0).decompose()
+        indices = np.array([primitive.getVertex(index) for index in range(primitive.getNumVertices())], dtype="uint32")
+
+        return vertices, normals, indices
+
+    @staticmethod
+    def vertex_format() -> GeomVertexFormat:
+        # Positions get their own array so a frame only rewrites the dynamic part of the buffer
+        position_array = GeomVertexArrayFormat("vertex", 3, Geom.NT_float32, Geom.C_point)
+
+        attribute_array = GeomVertexArrayFormat()
+        attribute_array.addColumn("normal", 3, Geom.NT_float32, Geom.C_normal)
+        attribute_array.addColumn("color", 4, Geom.NT_float32, Geom.C_color)
+
+        vertex_format = GeomVertexFormat()
+        vertex_format.addArray(position_array)
+        vertex_format.addArray(attribute_array)
+
+        return GeomVertexFormat.registerFormat(vertex_format)
+
+    def write_attributes(self, colors: list[tuple[float, float, float, float]]) -> None:
+        vertex_count = len(self.template_vertices)
+
+        attributes = np.hstack(
+            [
+                np.tile(self.template_normals, (self.marker_count, 1)),
+                np.repeat(np.asarray(colors, dtype="float32").reshape(-1, 4), vertex_count, axis=0),
+            ],
+        )
+
+        self.vertex_data.modifyArrayHandle(1).copyDataFrom(np.ascontiguousarray(attributes, dtype="float32"))
+
+    def create_node_path(self) -> NodePath:
+        vertex_count = len(self.template_vertices)
+        marker_offsets = np.arange(self.marker_count, dtype="uint32") * vertex_count
+        indices = (self.template_indices[None, :] + marker_offsets[:, None]).ravel()
+
+        triangles = GeomTriangles(Geom.UH_static)
+        triangles.setIndexType(Geom.NT_uint32)
+        triangles.modifyVertices().modifyHandle().copyDataFrom(indices)
+
+        geom = Geom(self.vertex_data)
+        geom.addPrimitive(triangles)
+
+        node = GeomNode("carMarkers")
+        node.addGeom(geom)
+
+        # The vertices move every frame, the cached bounds of the geometry would go stale and get the markers culled
+        node.setBounds(OmniBoundingVolume())
+        node.setFinal(True)
+
+        return self.parent.attachNewNode(node)
+
+    def update(self, positions: np.ndarray) -> None:
+        if self.positions is not None and not (np.abs(positions - self.positions) >= self.position_tolerance).any():
+            return
+
+        np.matmul(np.asarray(positions, dtype="float32"), self.position_spread, out=self.vertices)
+        np.add(self.vertices, self.template_vertices.reshape(1, -1), out=self.vertices)
+        self.vertex_data.modifyArrayHandle(0).copyDataFrom(self.vertices)
+
+        self.positions = np.array(positions, dtype="float64")
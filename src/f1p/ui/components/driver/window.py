@@ -1,6 +1,7 @@
-from decimal import Decimal
+from collections.abc import Mapping
 from math import ceil
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import requests
@@ -1531,7 +1532,7 @@ class DriverWindow(DirectObject):
         if current_throttle_size != throttle_size:
             self.throttle["frameSize"] = throttle_size
 
-    def update_camera_position(self, x: Decimal, y: Decimal, z: Decimal) -> None:
+    def update_camera_position(self, x: float, y: float, z: float) -> None:
         self.camera_np.setX(x + 5)
         self.camera_np.setY(y + 5)
         self.camera_np.setZ(z + 5)
@@ -1629,22 +1630,19 @@ class DriverWindow(DirectObject):
         if self.current_lap_time["text"] != current_record["ElapsedLapTimeFormatted"]:
             self.current_lap_time["text"] = current_record["ElapsedLapTimeFormatted"]
 
-    def update(self, current_record: dict) -> None:
-        self.update_telemetry(
-            current_record["nGear"],
-            current_record["RPM"],
-            current_record["Brake"],
-            current_record["Speed"],
-            current_record["DRS"],
-            current_record["SpeedMph"],
-            current_record["Throttle"],
-        )
-
-        precision = Decimal("0.001")
-        x = Decimal(current_record["X"]).quantize(precision)
-        y = Decimal(current_record["Y"]).quantize(precision)
-        z = Decimal(current_record["Z"]).quantize(precision)
-        self.update_camera_position(x, y, z)
+    def update(self, current_record: Mapping[str, Any], car_record: dict | None) -> None:
+        if car_record is not None:
+            self.update_telemetry(
+                car_record["nGear"],
+                car_record["RPM"],
+                car_record["Brake"],
+                car_record["Speed"],
+                car_record["DRS"],
+                car_record["SpeedMph"],
+                car_record["Throttle"],
+            )
+
+        self.update_camera_position(current_record["X"], current_record["Y"], current_record["Z"])
         self.update_lap_time_line(current_record["LapsCompletion"])
         self.update_current_lap(current_record)
 
@@ -9,6 +9,7 @@ from fastf1.core import Laps
 from panda3d.core import Point3, StaticTextFont, TextNode, TransparencyAttrib
 
 from f1p.services.data_extractor.service import DataExtractorService
+from f1p.services.data_extractor.snapshot import TickSnapshot
 from f1p.ui.components.driver.component import Driver
 from f1p.ui.components.gui.button import BlackButton
 from f1p.ui.components.gui.drop_down import BlackDropDown
@@ -18,6 +19,7 @@ from f1p.ui.components.leaderboard.processors import (
     LeaderLeaderboardProcessor,
     TiresLeaderboardProcessor,
 )
+from f1p.ui.components.leaderboard.renderer import LeaderboardRenderer
 from f1p.ui.components.map import Map
 
 
@@ -63,6 +65,13 @@ class Leaderboard(DirectObject):
 
         self.drivers: list[Driver] = self.circuit_map.drivers
 
+        self.processors: dict[str, LeaderboardProcessor] = {
+            "interval": IntervalLeaderboardProcessor(self.drivers, self.data_extractor),
+            "leader": LeaderLeaderboardProcessor(self.drivers, self.data_extractor),
+            "tires": TiresLeaderboardProcessor(self.drivers, self.data_extractor),
+        }
+        self.renderer: LeaderboardRenderer | None = None
+
         self._laps: Laps | None = None
         self._total_laps: int | None = None
 
@@ -76,7 +85,7 @@ class Leaderboard(DirectObject):
     @property
     def total_laps(self) -> int:
         if self._total_laps is None:
-            self._total_laps = self.data_extractor.session.total_laps
+            self._total_laps = self.data_extractor.total_laps
 
         return self._total_laps
 
@@ -259,63 +268,26 @@ class Leaderboard(DirectObject):
 
             self.has_fastest_lap.append(has_fastest_lap)
 
-    def update(self, session_time_tick: int) -> None:
-        processor: LeaderboardProcessor | None = None
-
-        match self.mode:
-            case "interval":
-                processor = IntervalLeaderboardProcessor(
-                    self.lap_counter,
-                    self.track_status_frame_top,
-                    self.track_status_frame_left,
-                    self.track_status_frame,
-                    self.track_status,
-                    self.drivers,
-                    self.checkered_flags,
-                    self.team_colors,
-                    self.driver_abbreviations,
-                    self.driver_times,
-                    self.driver_tires,
-                    self.has_fastest_lap,
-                    self.data_extractor,
-                )
-            case "leader":
-                processor = LeaderLeaderboardProcessor(
-                    self.lap_counter,
-                    self.track_status_frame_top,
-                    self.track_status_frame_left,
-                    self.track_status_frame,
-                    self.track_status,
-                    self.drivers,
-                    self.checkered_flags,
-                    self.team_colors,
-                    self.driver_abbreviations,
-                    self.driver_times,
-                    self.driver_tires,
-                    self.has_fastest_lap,
-                    self.data_extractor,
-                )
-            case "tires":
-                processor = TiresLeaderboardProcessor(
-                    self.lap_counter,
-                    self.track_status_frame_top,
-                    self.track_status_frame_left,
-                    self.track_status_frame,
-                    self.track_status,
-                    self.drivers,
-                    self.checkered_flags,
-                    self.team_colors,
-                    self.driver_abbreviations,
-                    self.driver_times,
-                    self.driver_tires,
-                    self.has_fastest_lap,
-                    self.data_extractor,
-                )
-
-        if processor is None:
+    def create_renderer(self) -> None:
+        self.renderer = LeaderboardRenderer(
+            self.lap_counter,
+            [self.track_status_frame_top, self.track_status_frame_left, self.track_status_frame],
+            self.track_status,
+            self.checkered_flags,
+            self.team_colors,
+            self.driver_abbreviations,
+            self.driver_times,
+            self.driver_tires,
+            self.has_fastest_lap,
+        )
+
+    def update(self, snapshot: TickSnapshot) -> None:
+        processor = self.processors.get(self.mode)
+
+        if processor is None or self.renderer is None:
             return
 
-        processor.update(session_time_tick)
+        self.renderer.render(processor.model(snapshot))
 
     def render_task(self) -> None:
         self.task_manager.add(self.render, "renderLeaderboard")
@@ -328,5 +300,6 @@ class Leaderboard(DirectObject):
         self.render_track_status()
         self.render_mode_selector()
         self.render_drivers()
+        self.create_renderer()
 
         return task.done
@@ -1,245 +1,94 @@
-from direct.gui.DirectFrame import DirectFrame
-from direct.gui.OnscreenText import OnscreenText
-from panda3d.core import LVecBase4f
-from pandas import Series
-
+from f1p.services.data_extractor.leaderboard import LeaderboardTable
 from f1p.services.data_extractor.service import DataExtractorService
+from f1p.services.data_extractor.snapshot import TickSnapshot
 from f1p.ui.components.driver.component import Driver
-from f1p.ui.components.gui.button import BlackButton
+from f1p.ui.components.leaderboard.renderer import Color, LeaderboardModel, LeaderboardRow
 
 
 class LeaderboardProcessor:
-    def __init__(
-        self,
-        lap_counter: OnscreenText,
-        track_status_frame_top: DirectFrame,
-        track_status_frame_left: DirectFrame,
-        track_status_frame: DirectFrame,
-        track_status: OnscreenText,
-        drivers: list[Driver],
-        checkered_flags: list[OnscreenText],
-        team_colors: list[OnscreenText],
-        driver_abbreviations: list[BlackButton],
-        driver_times: list[OnscreenText],
-        driver_tires: list[OnscreenText],
-        has_fastest_lap: list[OnscreenText],
-        data_extractor: DataExtractorService,
-    ):
-        self.lap_counter = lap_counter
-        self.track_status_frame_top = track_status_frame_top
-        self.track_status_frame_left = track_status_frame_left
-        self.track_status_frame = track_status_frame
-        self.track_status = track_status
+    """
+    Builds the leaderboard model of a tick from the rows the leaderboard table precomputed for the mode.
+    """
+
+    mode: str
+    default_color: Color = (1.0, 1.0, 1.0, 0.8)
+    dnf_color: Color = (1.0, 1.0, 1.0, 0.5)
+
+    def __init__(self, drivers: list[Driver], data_extractor: DataExtractorService):
         self.drivers = drivers
-        self.checkered_flags = checkered_flags
-        self.team_colors = team_colors
-        self.driver_abbreviations = driver_abbreviations
-        self.driver_times = driver_times
-        self.driver_tires = driver_tires
-        self.has_fastest_lap = has_fastest_lap
         self.data_extractor = data_extractor
 
-    def update_driver(self, driver: Driver, current_record: Series, index: int) -> None: ...
+    def time_color(self, driver: Driver, time_color_code: int) -> Color:
+        if time_color_code == LeaderboardTable.team_color:
+            return tuple(driver.team_color)
 
-    def update(self, session_time_tick: int) -> None:
-        total_laps = self.data_extractor.total_laps
-        current_lap_number = self.data_extractor.get_current_lap_number(session_time_tick)
+        if time_color_code == LeaderboardTable.dnf_color:
+            return self.dnf_color
 
-        if self.lap_counter["text"] != f"LAP {current_lap_number}/{total_laps}":
-            self.lap_counter["text"] = f"LAP {current_lap_number}/{total_laps}"
+        return self.default_color
 
-        track_status = self.data_extractor.get_current_track_status(session_time_tick)
-        gree_flag_color = self.data_extractor.green_flag_track_status_color
-        gree_flag_text_color = self.data_extractor.green_flag_track_status_text_color
-        gree_flag_label = self.data_extractor.green_flag_track_status_label
+    def row(
+        self,
+        driver: Driver,
+        is_dnf: bool,
+        time: str,
+        time_color_code: int,
+        tire: str,
+        tire_color: Color | None,
+    ) -> LeaderboardRow:
+        return LeaderboardRow(
+            checkered_flag="🮕" if driver.is_finished else "",
+            team_color=tuple(driver.team_color),
+            abbreviation=driver.abbreviation,
+            open_driver=driver.open_driver,
+            abbreviation_color=self.dnf_color if is_dnf else self.default_color,
+            time_color=self.time_color(driver, time_color_code),
+            time=time,
+            tire_color=tire_color,
+            tire=tire,
+            fastest_lap="⏱" if driver.has_fastest_lap else "",
+        )
+
+    def model(self, snapshot: TickSnapshot) -> LeaderboardModel:
+        track_status = snapshot.track_status
 
         if track_status is None:
-            if self.track_status_frame_top["frameColor"] != gree_flag_color:
-                self.track_status_frame_top["frameColor"] = gree_flag_color
-
-            if self.track_status_frame_left["frameColor"] != gree_flag_color:
-                self.track_status_frame_left["frameColor"] = gree_flag_color
-
-            if self.track_status_frame["frameColor"] != gree_flag_color:
-                self.track_status_frame["frameColor"] = gree_flag_color
-
-            if self.track_status.textNode.getTextColor() != gree_flag_text_color:
-                self.track_status["fg"] = gree_flag_text_color
-
-            if self.track_status["text"] != gree_flag_label:
-                self.track_status["text"] = gree_flag_label
+            color = self.data_extractor.green_flag_track_status_color
+            text_color = self.data_extractor.green_flag_track_status_text_color
+            label = self.data_extractor.green_flag_track_status_label
         else:
             color = track_status["Color"]
             text_color = track_status["TextColor"]
             label = track_status["Label"]
-            if self.track_status_frame_top["frameColor"] != color:
-                self.track_status_frame_top["frameColor"] = color
-
-            if self.track_status_frame_left["frameColor"] != color:
-                self.track_status_frame_left["frameColor"] = color
-
-            if self.track_status_frame["frameColor"] != color:
-                self.track_status_frame["frameColor"] = color
-
-            if self.track_status.textNode.getTextColor() != text_color:
-                self.track_status["fg"] = text_color
-
-            if self.track_status["text"] != label:
-                self.track_status["text"] = label
 
-        for driver in self.drivers:
-            current_record = driver.ticks[session_time_tick]
+        table = self.data_extractor.leaderboard_table
+        drivers = {driver.number: driver for driver in self.drivers}
+        rows: list[LeaderboardRow | None] = [None] * len(self.drivers)
 
-            index = current_record["PositionIndex"]
+        for position, (driver_index, *cells) in enumerate(table.rows(self.mode, snapshot.session_time_tick)):
+            driver = None if driver_index < 0 else drivers.get(table.driver_numbers[driver_index])
 
-            default_color = LVecBase4f(1, 1, 1, 0.8)
-            dnf_color = LVecBase4f(1, 1, 1, 0.5)
+            if driver is None or position >= len(rows):
+                continue
 
-            color = dnf_color if driver.is_dnf else default_color
+            rows[position] = self.row(driver, *cells)
 
-            if driver.is_finished and self.checkered_flags[index]["text"] != "🮕":
-                self.checkered_flags[index]["text"] = "🮕"
-            elif not driver.is_finished and self.checkered_flags[index]["text"] != "":
-                self.checkered_flags[index]["text"] = ""
-
-            self.driver_abbreviations[index]["text_fg"] = color
-
-            if self.team_colors[index]["frameColor"] != driver.team_color_obj:
-                self.team_colors[index]["frameColor"] = driver.team_color_obj
-
-            if self.driver_abbreviations[index]["text"] != driver.abbreviation:
-                self.driver_abbreviations[index]["text"] = driver.abbreviation
-                self.driver_abbreviations[index]["command"] = driver.open_driver
-
-            if driver.has_fastest_lap:
-                if self.has_fastest_lap[index]["text"] != "⏱":
-                    self.has_fastest_lap[index]["text"] = "⏱"
-            else:
-                if self.has_fastest_lap[index]["text"] != "":
-                    self.has_fastest_lap[index]["text"] = ""
-
-            self.update_driver(driver, current_record, index)
+        return LeaderboardModel(
+            lap_counter=f"LAP {snapshot.lap_number}/{self.data_extractor.total_laps}",
+            track_status_color=tuple(color),
+            track_status_text_color=tuple(text_color),
+            track_status_label=label,
+            rows=tuple(rows),
+        )
 
 
 class IntervalLeaderboardProcessor(LeaderboardProcessor):
-    def update_times(self, driver: Driver, current_record: Series, index: int) -> None:
-        default_color = LVecBase4f(1, 1, 1, 0.8)
-        dnf_color = LVecBase4f(1, 1, 1, 0.5)
-        current_color = self.driver_times[index].textNode.getTextColor()
-
-        if index == 0:
-            if current_color != default_color:
-                self.driver_times[index]["fg"] = default_color
-
-            if self.driver_times[index]["text"] != "Interval":
-                self.driver_times[index]["text"] = "Interval"
-
-            return
-
-        if driver.is_dnf:
-            if current_color != dnf_color:
-                self.driver_times[index]["fg"] = dnf_color
-
-            if self.driver_times[index]["text"] != "OUT":
-                self.driver_times[index]["text"] = "OUT"
-
-            return
-
-        if driver.in_pit:
-            if current_color != driver.team_color_obj:
-                self.driver_times[index]["fg"] = driver.team_color_obj
-
-            if self.driver_times[index]["text"] != "IN PIT":
-                self.driver_times[index]["text"] = "IN PIT"
-
-            return
-
-        if current_color != default_color:
-            self.driver_times[index]["fg"] = default_color
-
-        if self.driver_times[index]["text"] != f"+{current_record['DiffToCarInFront']:.3f}":
-            self.driver_times[index]["text"] = f"+{current_record['DiffToCarInFront']:.3f}"
-
-    def update_tire_compound(self, driver: Driver, current_record: Series, index: int) -> None:
-        if driver.is_dnf:
-            if self.driver_tires[index]["text"] != "":
-                self.driver_tires[index]["text"] = ""
-
-            return
-
-        tire_compound: str = current_record["Compound"]
-        tire_compound_color = current_record["CompoundColor"]
-        current_tire_compound_color = self.driver_tires[index].textNode.getTextColor()
-        if current_tire_compound_color != tire_compound_color:
-            self.driver_tires[index]["fg"] = tire_compound_color
-
-        if self.driver_tires[index]["text"] != tire_compound:
-            self.driver_tires[index]["text"] = tire_compound
-
-    def update_driver(self, driver: Driver, current_record: Series, index: int) -> None:
-        self.update_times(driver, current_record, index)
-        self.update_tire_compound(driver, current_record, index)
-
-
-class LeaderLeaderboardProcessor(IntervalLeaderboardProcessor):
-    def update_times(self, driver: Driver, current_record: Series, index: int) -> None:
-        default_color = LVecBase4f(1, 1, 1, 0.8)
-        dnf_color = LVecBase4f(1, 1, 1, 0.5)
-        current_color = self.driver_times[index].textNode.getTextColor()
-
-        if index == 0:
-            if current_color != default_color:
-                self.driver_times[index]["fg"] = default_color
-
-            if self.driver_times[index]["text"] != "Leader":
-                self.driver_times[index]["text"] = "Leader"
-
-            return
-
-        if driver.is_dnf:
-            if current_color != dnf_color:
-                self.driver_times[index]["fg"] = dnf_color
-
-            if self.driver_times[index]["text"] != "OUT":
-                self.driver_times[index]["text"] = "OUT"
-
-            return
-
-        if driver.in_pit:
-            if current_color != driver.team_color_obj:
-                self.driver_times[index]["fg"] = driver.team_color_obj
-
-            if self.driver_times[index]["text"] != "IN PIT":
-                self.driver_times[index]["text"] = "IN PIT"
-
-            return
-
-        if current_color != default_color:
-            self.driver_times[index]["fg"] = default_color
-
-        if self.driver_times[index]["text"] != f"+{current_record['DiffToLeader']:.3f}":
-            self.driver_times[index]["text"] = f"+{current_record['DiffToLeader']:.3f}"
-
-
-class TiresLeaderboardProcessor(IntervalLeaderboardProcessor):
-    def update_times(self, driver: Driver, current_record: Series, index: int) -> None:
-        default_color = LVecBase4f(1, 1, 1, 0.8)
-        dnf_color = LVecBase4f(1, 1, 1, 0.5)
-        current_color = self.driver_times[index].textNode.getTextColor()
-
-        if driver.is_dnf:
-            if current_color != dnf_color:
-                self.driver_times[index]["fg"] = dnf_color
-
-            if self.driver_times[index]["text"] != "OUT":
-                self.driver_times[index]["text"] = "OUT"
+    mode: str = "interval"
 
-            return
 
-        tire_age = str(int(current_record["TyreLife"]))
+class LeaderLeaderboardProcessor(LeaderboardProcessor):
+    mode: str = "leader"
 
-        if current_color != default_color:
-            self.driver_times[index]["fg"] = default_color
 
-        if self.driver_times[index]["text"] != tire_age:
-            self.driver_times[index]["text"] = tire_age
+class TiresLeaderboardProcessor(LeaderboardProcessor):
+    mode: str = "tires"
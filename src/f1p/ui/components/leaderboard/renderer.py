@@ -0,0 +1,122 @@
+from collections.abc import Callable
+from typing import NamedTuple
+
+from direct.gui.DirectFrame import DirectFrame
+from direct.gui.DirectGuiBase import DirectGuiWidget
+from direct.gui.OnscreenText import OnscreenText
+
+from f1p.ui.components.gui.button import BlackButton
+
+Color = tuple[float, ...]
+
+
+class LeaderboardRow(NamedTuple):
+    checkered_flag: str
+    team_color: Color
+    abbreviation: str
+    open_driver: Callable[[], None]
+    abbreviation_color: Color
+    time_color: Color
+    time: str
+    tire_color: Color | None
+    tire: str
+    fastest_lap: str
+
+
+class LeaderboardModel(NamedTuple):
+    lap_counter: str
+    track_status_color: Color
+    track_status_text_color: Color
+    track_status_label: str
+    rows: tuple[LeaderboardRow | None, ...]
+
+
+class LeaderboardRenderer:
+    """
+    Diffs each leaderboard model against the one rendered before it and writes only the cells that changed in one batch.
+    Widgets are never read back, a row without a record and a None cell keep whatever they show.
+    """
+
+    def __init__(
+        self,
+        lap_counter: OnscreenText,
+        track_status_frames: list[DirectFrame],
+        track_status: OnscreenText,
+        checkered_flags: list[OnscreenText],
+        team_colors: list[DirectFrame],
+        driver_abbreviations: list[BlackButton],
+        driver_times: list[OnscreenText],
+        driver_tires: list[OnscreenText],
+        has_fastest_lap: list[OnscreenText],
+    ):
+        self.lap_counter = lap_counter
+        self.track_status_frames = track_status_frames
+        self.track_status = track_status
+
+        # Widget list and option of every LeaderboardRow field, in field order
+        self.row_cells: tuple[tuple[list[DirectGuiWidget], str], ...] = (
+            (checkered_flags, "text"),
+            (team_colors, "frameColor"),
+            (driver_abbreviations, "text"),
+            (driver_abbreviations, "command"),
+            (driver_abbreviations, "text_fg"),
+            (driver_times, "fg"),
+            (driver_times, "text"),
+            (driver_tires, "fg"),
+            (driver_tires, "text"),
+            (has_fastest_lap, "text"),
+        )
+
+        self.model: LeaderboardModel | None = None
+        self.rows: list[LeaderboardRow | None] = [None] * len(checkered_flags)
+
+    def dirty_rows(self, model: LeaderboardModel) -> list[int]:
+        return [index for index, row in enumerate(model.rows) if row is not None and row != self.rows[index]]
+
+    def header_changes(self, model: LeaderboardModel) -> list[tuple[DirectGuiWidget, str, object]]:
+        previous = self.model
+        changes: list[tuple[DirectGuiWidget, str, object]] = []
+
+        if previous is None or previous.lap_counter != model.lap_counter:
+            changes.append((self.lap_counter, "text", model.lap_counter))
+
+        if previous is None or previous.track_status_color != model.track_status_color:
+            changes.extend((frame, "frameColor", model.track_status_color) for frame in self.track_status_frames)
+
+        if previous is None or previous.track_status_text_color != model.track_status_text_color:
+            changes.append((self.track_status, "fg", model.track_status_text_color))
+
+        if previous is None or previous.track_status_label != model.track_status_label:
+            changes.append((self.track_status, "text", model.track_status_label))
+
+        return changes
+
+    def row_changes(self, index: int, row: LeaderboardRow) -> list[tuple[DirectGuiWidget, str, object]]:
+        previous = self.rows[index]
+
+        return [
+            (widgets[index], option, value)
+            for field, ((widgets, option), value) in enumerate(zip(self.row_cells, row, strict=True))
+            if value is not None and (previous is None or previous[field] != value)
+        ]
+
+    def changes(self, model: LeaderboardModel) -> list[tuple[DirectGuiWidget, str, object]]:
+        changes = self.header_changes(model)
+
+        for index in self.dirty_rows(model):
+            changes.extend(self.row_changes(index, model.rows[index]))
+
+        return changes
+
+    def render(self, model: LeaderboardModel) -> int:
+        changes = self.changes(model)
+
+        for widget, option, value in changes:
+            widget[option] = value
+
+        self.model = model
+        for index, row in enumerate(model.rows):
+            if row is not None:
+                self.rows[index] = row
+
+        return len(changes)
@@ -8,7 +8,10 @@ from panda3d.core import BillboardEffect, LineSegs, NodePath, TextNode
 from pandas import DataFrame
 
 from f1p.services.data_extractor.service import DataExtractorService
+from f1p.services.data_extractor.snapshot import TickSnapshot
 from f1p.ui.components.driver.component import Driver
+from f1p.ui.components.driver.markers import CarMarkers
+from f1p.ui.components.track_geometry import TrackGeometry
 
 
 class Map(DirectObject):
@@ -24,69 +27,25 @@ class Map(DirectObject):
         self.outer_border_node_path: NodePath | None = None
 
         self.drivers: list[Driver] = []
+        self.car_markers: CarMarkers | None = None
         self._pos_data: DataFrame | None = None
         self._map_center_coordinate: list[float] | None = None
 
         self.accept("sessionSelected", self.render_task)
+        self.accept("updateDrivers", self.update_drivers)
 
     def render_map(self) -> None:
-        new_df = self.data_extractor.fastest_lap_telemetry.copy()
-
-        track_width = 0.5
-        track_x = new_df["X"]
-        track_y = new_df["Y"]
-
-        dx = np.gradient(track_x)
-        dy = np.gradient(track_y)
-
-        norm = np.sqrt(dx**2 + dy**2)
-        norm[norm == 0] = 10
-        dx /= norm
-        dy /= norm
-
-        nx = -dy
-        ny = dx
-        x_outer = track_x + nx * (track_width / 2)
-        y_outer = track_y + ny * (track_width / 2)
-        x_inner = track_x - nx * (track_width / 2)
-        y_inner = track_y - ny * (track_width / 2)
-
-        inner_df = new_df.copy()
-        inner_df["X"] = x_inner
-        inner_df["Y"] = y_inner
-        inner_track = inner_df.loc[:, ("X", "Y", "Z")].to_numpy().tolist()
+        track = self.data_extractor.fastest_lap_telemetry.loc[:, ("X", "Y", "Z")].to_numpy(dtype="float64")
+        inner_track, outer_track = TrackGeometry.borders(track, track_width=0.5)
+
         self.inner_border_node_path = self.draw_track(inner_track, (0.9, 0.9, 0.9, 1))
         self.inner_border_node_path.reparentTo(self.parent)
 
-        outer_df = new_df.copy()
-        outer_df["X"] = x_outer
-        outer_df["Y"] = y_outer
-        outer_track = outer_df.loc[:, ("X", "Y", "Z")].to_numpy().tolist()
         self.outer_border_node_path = self.draw_track(outer_track, (0.9, 0.9, 0.9, 1))
         self.outer_border_node_path.reparentTo(self.parent)
 
-    def draw_track(self, track: list[list[float]], color: tuple[float, float, float, float]):
-        line_segments = LineSegs("map")
-        line_segments.setThickness(1)
-        line_segments.setColor(*color)
-
-        first_point = None
-        previous_point = None
-        for point in track:
-            if first_point is None:
-                first_point = point
-
-            if previous_point is not None:
-                line_segments.drawTo(point[0], point[1], point[2])
-
-            previous_point = point
-            line_segments.moveTo(previous_point[0], previous_point[1], previous_point[2])
-
-        line_segments.drawTo(first_point[0], first_point[1], first_point[2])
-
-        line_node = line_segments.create(False)
-
-        return NodePath(line_node)
+    def draw_track(self, track: np.ndarray, color: tuple[float, float, float, float]) -> NodePath:
+        return NodePath(TrackGeometry.line_loop("map", track, color))
 
     def render_corners(self) -> None:
         line_segments = LineSegs("corners")
@@ -114,7 +73,16 @@ class Map(DirectObject):
 
     def initialize_drivers(self) -> None:
         for _, driver_sr in self.data_extractor.session_results.iterrows():
-            self.drivers.append(Driver.from_df(self.app, self.parent, self.data_extractor, driver_sr))
+            self.drivers.append(Driver.from_df(self.app, self.data_extractor, driver_sr))
+
+        self.car_markers = CarMarkers(self.parent, [driver.team_color for driver in self.drivers])
+
+    def update_drivers(self, snapshot: TickSnapshot) -> None:
+        for driver in self.drivers:
+            driver.update(snapshot)
+
+        if self.car_markers is not None:
+            self.car_markers.update(np.array([driver.position for driver in self.drivers]))
 
     def render_task(self) -> None:
         self.task_manager.add(self.render, "renderMap")
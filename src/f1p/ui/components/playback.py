@@ -10,12 +10,16 @@ from direct.task.Task import Task, TaskManager
 from panda3d.core import Point3, StaticTextFont, TextNode
 
 from f1p.services.data_extractor.service import DataExtractorService
+from f1p.services.data_extractor.snapshot import TickSnapshot
 from f1p.ui.components.camera.enums import CameraType
 from f1p.ui.components.gui.button import BlackButton
 from f1p.ui.components.gui.drop_down import BlackDropDown
+from f1p.ui.components.playback_clock import PlaybackClock
 
 
 class PlaybackControls(DirectObject):
+    scrub_settle_seconds: float = 0.2
+
     def __init__(
         self,
         pixel2d,
@@ -39,6 +43,8 @@ class PlaybackControls(DirectObject):
         self.data_extractor = data_extractor
 
         self.accept("sessionSelected", self.render_task)
+        self.accept("sessionExtended", self.extend_clock)
+        self.accept("weatherLoaded", self.refresh_snapshot)
 
         self.frame: DirectFrame | None = None
         self.play_button: DirectButton | None = None
@@ -47,10 +53,19 @@ class PlaybackControls(DirectObject):
         self.timeline_statuses: list[DirectFrame] = []
         self.playback_speed_button: DirectOptionMenu | None = None
         self.camera_button: DirectOptionMenu | None = None
+        self.clock: PlaybackClock | None = None
 
         self.orbiting_camera: bool = True
         self.playing: bool = False
-        self.playback_speed: float = 0.3
+        self.playback_speeds: list[str] = ["0.25x", "0.5x", "1x", "2x", "4x", "10x", "25x", "50x", "100x"]
+        self.playback_speed: float = 4.0
+        self.last_frame_time: float = 0.0
+
+        self.requested_tick: float | None = None
+        self.latest_snapshot: TickSnapshot | None = None
+        self.panels_stale: bool = False
+        self.scrubbing: bool = False
+        self.last_scrub_time: float = 0.0
 
     def render_frame(self) -> None:
         self.frame = DirectFrame(
@@ -60,21 +75,72 @@ class PlaybackControls(DirectObject):
             pos=Point3(0, 0, self.height - self.window_height),
         )
 
+    @property
+    def effective_speed(self) -> float:
+        if self.clock is None:
+            return 0.0
+
+        return self.clock.effective_speed
+
+    def create_clock(self) -> None:
+        self.clock = PlaybackClock(
+            self.data_extractor.tick_session_milliseconds,
+            self.data_extractor.tick_store.first_tick,
+            self.playback_speed,
+        )
+
+    def extend_clock(self, _processed_ticks: int) -> None:
+        if self.clock is None:
+            return
+
+        self.clock.set_ticks(self.data_extractor.tick_session_milliseconds, self.data_extractor.tick_store.first_tick)
+
+    def refresh_snapshot(self) -> None:
+        # Rebuild the shown tick even while paused, its snapshot was taken before the weather loaded
+        if self.latest_snapshot is not None and self.requested_tick is None:
+            self.requested_tick = self.latest_snapshot.playback_tick
+
     def move_timeline(self, task):
-        if not self.playing:
-            return task.cont
+        frame_seconds = task.time - self.last_frame_time
+        self.last_frame_time = task.time
 
-        current_value = self.timeline["value"]
-        new_value = current_value + self.playback_speed
+        if self.playing and self.clock is not None:
+            # Hold at the edge of the processed data until the next window arrives
+            playback_tick = self.clock.advance(frame_seconds, self.data_extractor.processed_ticks)
 
-        if new_value > self.timeline["range"][1]:
-            self.playing = False
-            return task.cont
+            if playback_tick >= self.timeline["range"][1]:
+                self.playing = False
+
+            self.timeline["value"] = playback_tick
 
-        self.timeline["value"] = new_value
+        self.apply_requested_tick(task.time)
 
         return task.cont
 
+    def apply_requested_tick(self, frame_time: float) -> None:
+        if self.requested_tick is not None:
+            self.latest_snapshot = self.data_extractor.snapshot(self.requested_tick)
+            self.requested_tick = None
+            self.panels_stale = True
+
+            messenger.send("updateDrivers", sentArgs=[self.latest_snapshot])
+
+        if not self.panels_stale:
+            return
+
+        # While the thumb is being dragged only the cars follow, the panels catch up once it settles
+        if self.scrubbing and frame_time - self.last_scrub_time < self.scrub_settle_seconds:
+            return
+
+        self.scrubbing = False
+        self.panels_stale = False
+        self.update_panels(self.latest_snapshot)
+
+    @staticmethod
+    def update_panels(snapshot: TickSnapshot) -> None:
+        messenger.send("updateLeaderboard", sentArgs=[snapshot])
+        messenger.send("updateWeather", sentArgs=[snapshot])
+
     def play_pause(self) -> None:
         if not self.playing:
             self.playing = True
@@ -95,10 +161,20 @@ class PlaybackControls(DirectObject):
         )
 
     def update_components(self) -> None:
-        session_time_tick = int(self.timeline["value"])
-        messenger.send("updateDrivers", sentArgs=[session_time_tick])
-        messenger.send("updateLeaderboard", sentArgs=[session_time_tick])
-        messenger.send("updateWeather", sentArgs=[session_time_tick])
+        playback_tick = self.timeline["value"]
+
+        if int(playback_tick) > self.data_extractor.processed_ticks:
+            self.timeline["value"] = self.data_extractor.processed_ticks
+            return
+
+        # The slider was moved by hand, continue playback from there
+        if self.clock is not None and abs(playback_tick - self.clock.playback_tick) > 0.01:
+            self.clock.seek(playback_tick)
+            self.scrubbing = True
+            self.last_scrub_time = self.last_frame_time
+
+        # Only the latest value is applied, once per frame by move_timeline
+        self.requested_tick = playback_tick
 
     def render_timeline(self) -> None:
         self.timeline_all_clear = DirectFrame(
@@ -139,13 +215,10 @@ class PlaybackControls(DirectObject):
         )
 
     def change_playback_speed(self, playback_speed: str) -> None:
-        match playback_speed:
-            case "x3":
-                self.playback_speed = 0.3
-            case "x5":
-                self.playback_speed = 0.5
-            case "x10":
-                self.playback_speed = 1.0
+        self.playback_speed = float(playback_speed.removesuffix("x"))
+
+        if self.clock is not None:
+            self.clock.speed = self.playback_speed
 
     def render_playback_speed_button(self) -> None:
         self.playback_speed_button = BlackDropDown(
@@ -160,9 +233,9 @@ class PlaybackControls(DirectObject):
             text_pos=(23.5, (-self.height / 2) + 10),
             text_align=TextNode.ACenter,
             item_text_align=TextNode.ACenter,
-            items=["x3", "x5", "x10"],
+            items=self.playback_speeds,
             item_scale=1.0,
-            initialitem=0,
+            initialitem=self.playback_speeds.index("4x"),
             pos=Point3(self.width - 87, 0, -self.height / 2),
         )
 
@@ -200,6 +273,7 @@ class PlaybackControls(DirectObject):
         self.render_frame()
         self.render_play_button()
         self.render_timeline()
+        self.create_clock()
         self.render_playback_speed_button()
         self.render_camera_button()
 
@@ -0,0 +1,99 @@
+from collections import deque
+
+import numpy as np
+
+
+class PlaybackClock:
+    """
+    Advances session time by elapsed wall time times the playback speed and maps it back to a fractional tick.
+    Slow frames jump straight to the tick the session should be at instead of stepping through every tick.
+    """
+
+    min_speed: float = 0.25
+    max_speed: float = 100.0
+    max_frame_seconds: float = 1.0
+
+    def __init__(self, tick_milliseconds: np.ndarray, first_tick: int, speed: float = 1.0, window_frames: int = 120):
+        self.tick_milliseconds = tick_milliseconds
+        self.first_tick = first_tick
+
+        self.frames: deque[tuple[float, float]] = deque(maxlen=window_frames)
+
+        self._speed: float = 1.0
+        self.speed = speed
+
+        self.session_milliseconds: float = float(tick_milliseconds[0])
+        self.playback_tick: float = float(first_tick)
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        if not self.min_speed <= value <= self.max_speed:
+            raise ValueError(f"Playback speed must be between {self.min_speed}x and {self.max_speed}x.")
+
+        self._speed = value
+        self.frames.clear()
+
+    @property
+    def last_tick(self) -> int:
+        return self.first_tick + len(self.tick_milliseconds) - 1
+
+    @property
+    def effective_speed(self) -> float:
+        wall_seconds = sum(frame_seconds for frame_seconds, _ in self.frames)
+
+        if wall_seconds == 0:
+            return 0.0
+
+        return sum(session_seconds for _, session_seconds in self.frames) / wall_seconds
+
+    def set_ticks(self, tick_milliseconds: np.ndarray, first_tick: int) -> None:
+        self.tick_milliseconds = tick_milliseconds
+        self.first_tick = first_tick
+
+    def tick_to_milliseconds(self, playback_tick: float) -> float:
+        position = min(max(playback_tick - self.first_tick, 0.0), len(self.tick_milliseconds) - 1.0)
+        row = min(int(position), len(self.tick_milliseconds) - 2) if len(self.tick_milliseconds) > 1 else 0
+
+        if row == len(self.tick_milliseconds) - 1:
+            return float(self.tick_milliseconds[row])
+
+        lower_milliseconds = float(self.tick_milliseconds[row])
+        upper_milliseconds = float(self.tick_milliseconds[row + 1])
+
+        return lower_milliseconds + (position - row) * (upper_milliseconds - lower_milliseconds)
+
+    def milliseconds_to_tick(self, session_milliseconds: float) -> float:
+        # Several ticks can share a session time, searchsorted picks the last of them
+        row = int(np.searchsorted(self.tick_milliseconds, session_milliseconds, side="right")) - 1
+        row = min(max(row, 0), len(self.tick_milliseconds) - 1)
+
+        if row == len(self.tick_milliseconds) - 1:
+            return float(self.last_tick)
+
+        lower_milliseconds = float(self.tick_milliseconds[row])
+        duration = float(self.tick_milliseconds[row + 1]) - lower_milliseconds
+        fraction = 0.0 if duration <= 0 else (session_milliseconds - lower_milliseconds) / duration
+
+        return self.first_tick + row + min(max(fraction, 0.0), 1.0)
+
+    def seek(self, playback_tick: float) -> None:
+        self.playback_tick = float(playback_tick)
+        self.session_milliseconds = self.tick_to_milliseconds(playback_tick)
+
+    def advance(self, frame_seconds: float, max_tick: float | None = None) -> float:
+        frame_seconds = min(max(frame_seconds, 0.0), self.max_frame_seconds)
+        max_tick = self.last_tick if max_tick is None else min(max_tick, self.last_tick)
+
+        previous_milliseconds = self.session_milliseconds
+        session_milliseconds = previous_milliseconds + frame_seconds * 1000 * self.speed
+        session_milliseconds = min(session_milliseconds, self.tick_to_milliseconds(max_tick))
+
+        self.session_milliseconds = max(session_milliseconds, previous_milliseconds)
+        self.playback_tick = min(self.milliseconds_to_tick(self.session_milliseconds), max_tick)
+        self.frames.append((frame_seconds, (self.session_milliseconds - previous_milliseconds) / 1000))
+
+        return self.playback_tick
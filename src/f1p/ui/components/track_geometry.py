@@ -0,0 +1,92 @@
+import numpy as np
+from panda3d.core import (
+    Geom,
+    GeomLinestrips,
+    GeomNode,
+    GeomPrimitive,
+    GeomTristrips,
+    GeomVertexArrayFormat,
+    GeomVertexData,
+    GeomVertexFormat,
+)
+
+
+class TrackGeometry:
+    """
+    Builds track geometry straight from [point, xyz] arrays, every vertex buffer is filled with one bulk copy.
+    """
+
+    @staticmethod
+    def vertex_format() -> GeomVertexFormat:
+        array_format = GeomVertexArrayFormat()
+        array_format.addColumn("vertex", 3, Geom.NT_float32, Geom.C_point)
+        array_format.addColumn("color", 4, Geom.NT_float32, Geom.C_color)
+
+        return GeomVertexFormat.registerFormat(array_format)
+
+    @staticmethod
+    def borders(track: np.ndarray, track_width: float) -> tuple[np.ndarray, np.ndarray]:
+        track = np.asarray(track, dtype="float64")
+
+        dx = np.gradient(track[:, 0])
+        dy = np.gradient(track[:, 1])
+
+        norm = np.sqrt(dx**2 + dy**2)
+        norm[norm == 0] = 10
+        dx /= norm
+        dy /= norm
+
+        offsets = np.column_stack([-dy, dx, np.zeros(len(track))]) * (track_width / 2)
+
+        return track - offsets, track + offsets
+
+    @classmethod
+    def vertex_data(cls, name: str, points: np.ndarray, color: tuple[float, float, float, float]) -> GeomVertexData:
+        rows = np.empty((len(points), 7), dtype="float32")
+        rows[:, :3] = points
+        rows[:, 3:] = color
+
+        vertex_data = GeomVertexData(name, cls.vertex_format(), Geom.UH_static)
+        vertex_data.uncleanSetNumRows(len(points))
+        vertex_data.modifyArrayHandle(0).copyDataFrom(rows)
+
+        return vertex_data
+
+    @staticmethod
+    def geom_node(name: str, vertex_data: GeomVertexData, primitive: GeomPrimitive, indices: np.ndarray) -> GeomNode:
+        primitive.setIndexType(Geom.NT_uint32)
+        primitive.modifyVertices().modifyHandle().copyDataFrom(indices.astype("uint32"))
+        primitive.closePrimitive()
+
+        geom = Geom(vertex_data)
+        geom.addPrimitive(primitive)
+
+        node = GeomNode(name)
+        node.addGeom(geom)
+
+        return node
+
+    @classmethod
+    def line_loop(cls, name: str, track: np.ndarray, color: tuple[float, float, float, float]) -> GeomNode:
+        vertex_data = cls.vertex_data(name, track, color)
+        indices = np.append(np.arange(len(track)), 0)
+
+        return cls.geom_node(name, vertex_data, GeomLinestrips(Geom.UH_static), indices)
+
+    @classmethod
+    def ribbon(
+        cls,
+        name: str,
+        inner: np.ndarray,
+        outer: np.ndarray,
+        color: tuple[float, float, float, float],
+    ) -> GeomNode:
+        # Inner and outer points alternate, a single strip over them closed back onto the first pair fills the track
+        points = np.empty((len(inner) * 2, 3), dtype="float64")
+        points[0::2] = inner
+        points[1::2] = outer
+
+        vertex_data = cls.vertex_data(name, points, color)
+        indices = np.append(np.arange(len(points)), (0, 1))
+
+        return cls.geom_node(name, vertex_data, GeomTristrips(Geom.UH_static), indices)
@@ -7,6 +7,7 @@ from direct.task.Task import Task, TaskManager
 from panda3d.core import Point3, StaticTextFont, TextNode
 
 from f1p.services.data_extractor.service import DataExtractorService
+from f1p.services.data_extractor.snapshot import TickSnapshot
 
 
 class WeatherBoard(DirectObject):
@@ -57,6 +58,8 @@ class WeatherBoard(DirectObject):
 
         self.highlighter_yellow_color = (0.8, 1, 0, 1)
 
+        self.weather_row_id: int | None = None
+
     def render_frame(self) -> None:
         self.frame = DirectFrame(
             parent=self.pixel2d,
@@ -267,9 +270,12 @@ class WeatherBoard(DirectObject):
         )
 
     def render_weather_board(self) -> None:
+        self.data_extractor.request_weather_data()
         self.task_manager.add(self.render, "renderLeaderboard")
 
     def render(self, task: Task) -> Any:
+        self.weather_row_id = None
+
         self.render_frame()
         self.render_title()
         self.render_weather()
@@ -280,12 +286,15 @@ class WeatherBoard(DirectObject):
 
         return task.done
 
-    def update(self, session_time_tick: int) -> None:
-        weather_data = self.data_extractor.get_current_weather_data(session_time_tick)
+    def update(self, snapshot: TickSnapshot) -> None:
+        weather_row_id = snapshot.weather_row_id
+        weather_data = snapshot.weather
 
-        if weather_data is None:
+        if weather_data is None or weather_row_id == self.weather_row_id:
             return
 
+        self.weather_row_id = weather_row_id
+
         if self.weather_symbol["text"] != weather_data["WeatherSymbol"]:
             self.weather_symbol["text"] = weather_data["WeatherSymbol"]
         if self.weather_text["text"] != weather_data["WeatherText"]:
@@ -1,5 +1,6 @@
 import numpy as np
 from pandas import DataFrame
+from pandas.api.types import is_object_dtype
 
 
 def merge_in_session_time_ticks(
@@ -8,7 +9,7 @@ def merge_in_session_time_ticks(
     target_df_comparison_column: str = "SessionTime",
     target_df_result_column: str = "SessionTimeTick",
 ) -> DataFrame:
-    df = target_df.copy()
+    df = target_df.copy(deep=False)
 
     ticks_df_sorted = (
         session_time_ticks_df.groupby("SessionTime", sort=True)["SessionTimeTick"]
@@ -33,3 +34,46 @@ def merge_in_session_time_ticks(
     df[target_df_result_column] = df[target_df_result_column].astype("int64")
 
     return df
+
+
+def compact_dtypes(df: DataFrame, dtypes: dict[str, str], max_category_ratio: float = 0.5) -> DataFrame:
+    df = df.copy(deep=False)
+
+    for column, dtype in dtypes.items():
+        if column in df.columns:
+            df[column] = df[column].astype(dtype)
+
+    # select_dtypes consolidates the blocks into a full copy of the frame, the dtypes are enough here
+    object_columns = [column for column, dtype in df.dtypes.items() if is_object_dtype(dtype)]
+
+    for column in object_columns:
+        values = df[column]
+        non_null_values = values.dropna()
+
+        if non_null_values.empty:
+            continue
+
+        if isinstance(non_null_values.iloc[0], list):
+            # Lists are not hashable, tuples work the same as colors and can be categories
+            values = values.map(lambda value: tuple(value) if isinstance(value, list) else value)
+
+        if len(non_null_values) == len(values) and values.isin([True, False]).all():
+            df[column] = values.astype("bool")
+        elif values.nunique(dropna=False) <= len(values) * max_category_ratio:
+            df[column] = values.astype("category")
+
+    return df
+
+
+def memory_usage_report(before_df: DataFrame, after_df: DataFrame) -> DataFrame:
+    report_df = DataFrame(
+        {
+            "DtypeBefore": before_df.dtypes.astype(str),
+            "DtypeAfter": after_df.dtypes.astype(str),
+            "BytesBefore": before_df.memory_usage(index=False, deep=True),
+            "BytesAfter": after_df.memory_usage(index=False, deep=True),
+        },
+    )
+    report_df.loc["Total"] = ["", "", report_df["BytesBefore"].sum(), report_df["BytesAfter"].sum()]
+
+    return report_df.rename_axis("Column").reset_index()
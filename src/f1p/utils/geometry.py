@@ -2,22 +2,6 @@ import numpy as np
 from pandas import DataFrame
 
 
-def scale(df: DataFrame, factor: float) -> DataFrame:
-    new_df = df.copy()
-    new_df["X"] = new_df["X"] * factor
-    new_df["Y"] = new_df["Y"] * factor
-    new_df["Z"] = new_df["Z"] * factor
-
-    return new_df
-
-
-def shift(df: DataFrame, direction: str, amount: float) -> DataFrame:
-    new_df = df.copy()
-    new_df[direction] = new_df[direction] + amount
-
-    return new_df
-
-
 def rotate_in_df(df: DataFrame) -> DataFrame:
     new_df = df.copy()
 
@@ -65,30 +49,22 @@ def find_center(df: DataFrame) -> tuple[float, float, float]:
 
 
 def resize_pos_data(rotation: float, pos_data_df: DataFrame) -> DataFrame:
-    df = pos_data_df.copy()
-
-    coordinates_cols_only_df = df[["X", "Y", "Z"]]
-    rotated_coordinates_df = rotate(coordinates_cols_only_df, rotation)
+    df = pos_data_df.copy(deep=False)
 
-    scaled_coordinates_df = scale(rotated_coordinates_df, 1 / 600)
+    rotated_coordinates_df = rotate(df, rotation)
 
-    df["X"] = scaled_coordinates_df["X"].to_numpy()
-    df["Y"] = scaled_coordinates_df["Y"].to_numpy()
-    df["Z"] = scaled_coordinates_df["Z"].to_numpy()
+    df["X"] = rotated_coordinates_df["X"].to_numpy() * (1 / 600)
+    df["Y"] = rotated_coordinates_df["Y"].to_numpy() * (1 / 600)
+    df["Z"] = rotated_coordinates_df["Z"].to_numpy() * (1 / 600)
 
     return df
 
 
 def center_pos_data(map_center_coordinate: tuple[float, float, float], df: DataFrame) -> DataFrame:
-    combined_pos_data_df = df.copy()
-    coordinates_cols_only_df = combined_pos_data_df[["X", "Y", "Z"]]
-
-    shifted_x_coordinates_df = shift(coordinates_cols_only_df, direction="X", amount=-map_center_coordinate[0])
-    shifted_y_coordinates_df = shift(coordinates_cols_only_df, direction="Y", amount=-map_center_coordinate[1])
-    shifted_z_coordinates_df = shift(coordinates_cols_only_df, direction="Z", amount=-map_center_coordinate[2])
+    combined_pos_data_df = df.copy(deep=False)
 
-    combined_pos_data_df["X"] = shifted_x_coordinates_df["X"].to_numpy()
-    combined_pos_data_df["Y"] = shifted_y_coordinates_df["Y"].to_numpy()
-    combined_pos_data_df["Z"] = shifted_z_coordinates_df["Z"].to_numpy()
+    combined_pos_data_df["X"] = df["X"].to_numpy() - map_center_coordinate[0]
+    combined_pos_data_df["Y"] = df["Y"].to_numpy() - map_center_coordinate[1]
+    combined_pos_data_df["Z"] = df["Z"].to_numpy() - map_center_coordinate[2]
 
     return combined_pos_data_df
@@ -1,5 +1,15 @@
+import ctypes
+import json
+import sys
+import threading
 import time
+from collections.abc import Callable
 from functools import wraps
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+from pandas import DataFrame
 
 
 def timeit(func):
@@ -17,3 +27,175 @@ def timeit(func):
         return result
 
     return wrapper
+
+
+class ProcessMemoryCounters(ctypes.Structure):
+    _fields_ = [
+        ("cb", ctypes.c_ulong),
+        ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+def max_rss_bytes() -> int:
+    """
+    Peak resident set size of the current process, in bytes.
+    """
+    if sys.platform == "win32":
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(
+            ctypes.windll.kernel32.GetCurrentProcess(),
+            ctypes.byref(counters),
+            counters.cb,
+        )
+
+        return counters.PeakWorkingSetSize
+
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # macOS reports bytes, Linux reports kilobytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class StageTiming:
+    def __init__(
+        self,
+        name: str,
+        wall_time: float,
+        cpu_time: float,
+        rows_in: int,
+        rows_out: int,
+        columns: int,
+        memory_delta: int,
+        process_peak_rss: int,
+    ):
+        self.name = name
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.rows_in = rows_in
+        self.rows_out = rows_out
+        self.columns = columns
+        self.memory_delta = memory_delta
+        # Stages run in parallel, so the process wide peak can not be attributed to a single stage
+        self.process_peak_rss = process_peak_rss
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "columns": self.columns,
+            "memory_delta": self.memory_delta,
+            "process_peak_rss": self.process_peak_rss,
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name.split('.')[-1]} {self.wall_time * 1e3:.0f}/{self.cpu_time * 1e3:.0f}ms "
+            f"{self.rows_out} rows {self.columns} cols {self.memory_delta / 2**20:+.1f}MiB"
+        )
+
+
+class TimingReport:
+    """
+    Thread safe collection of stage timings, filled in by the instrumented decorator.
+    """
+
+    def __init__(self, on_record: Callable[[StageTiming], None] | None = None):
+        self.on_record = on_record
+
+        self.timings: list[StageTiming] = []
+        self.lock = threading.Lock()
+
+    def record(self, timing: StageTiming) -> None:
+        with self.lock:
+            self.timings.append(timing)
+
+        if self.on_record is not None:
+            self.on_record(timing)
+
+    def summary(self, limit: int) -> str:
+        with self.lock:
+            timings = self.timings[-limit:]
+
+        return "\n".join(str(timing) for timing in timings)
+
+    def to_dict(self) -> list[dict[str, Any]]:
+        with self.lock:
+            return [timing.to_dict() for timing in self.timings]
+
+    def write_json(self, path: Path, metadata: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({**metadata, "stages": self.to_dict()}, indent=2))
+
+
+def frame_stats(frame: Any) -> tuple[int, int, int]:
+    if not isinstance(frame, DataFrame):
+        return 0, 0, 0
+
+    return len(frame), len(frame.columns), int(frame.memory_usage(index=True, deep=False).sum())
+
+
+def instrumented(frame_attribute: str | None = None):
+    """
+    Decorator to record a stage into the timing_report of its instance, if it has one.
+    The frame_attribute (dotted path on the instance) is read before and after the stage for rows, columns and memory.
+    """
+    get_frame = attrgetter(frame_attribute) if frame_attribute is not None else None
+
+    def read_frame(instance: Any) -> Any:
+        if get_frame is None:
+            return None
+
+        try:
+            return get_frame(instance)
+        except (AttributeError, ValueError):
+            return None
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            timing_report = getattr(self, "timing_report", None)
+            if timing_report is None:
+                return func(self, *args, **kwargs)
+
+            rows_in, _, memory_in = frame_stats(read_frame(self))
+            start_time = time.perf_counter()
+            start_cpu_time = time.thread_time()
+
+            result = func(self, *args, **kwargs)
+
+            cpu_time = time.thread_time() - start_cpu_time
+            wall_time = time.perf_counter() - start_time
+            rows_out, columns, memory_out = frame_stats(read_frame(self))
+
+            timing_report.record(
+                StageTiming(
+                    f"{type(self).__name__}.{func.__name__}",
+                    wall_time,
+                    cpu_time,
+                    rows_in,
+                    rows_out,
+                    columns,
+                    memory_out - memory_in,
+                    max_rss_bytes(),
+                ),
+            )
+
+            return result
+
+        return wrapper
+
+    return decorator
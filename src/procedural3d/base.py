@@ -5,10 +5,56 @@
 # creation of all 3D primitives.
 
 from panda3d.core import *
+import hashlib
+import json
+import numpy as np
+
+
+def _freeze(value):
+    """
+    Turn a parameter value into something hashable with a stable repr, so it
+    can be part of a geometry cache key.
+
+    """
+
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+
+    if isinstance(value, str):
+        return value
+
+    try:
+        return tuple(_freeze(val) for val in value)
+    except TypeError:
+        return value
 
 
 class ModelMaker:
 
+    _geometry_cache = {}
+    _cache_path = None
+
+    @classmethod
+    def set_cache_path(cls, cache_path):
+        """
+        Set the directory that generated geometry is stored in as .bam files,
+        so it can be reused across runs; None (the default) disables the
+        on-disk store and only keeps geometry in memory.
+
+        """
+
+        ModelMaker._cache_path = cache_path
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Forget all geometry generated so far in this run; .bam files in the
+        cache path are kept.
+
+        """
+
+        ModelMaker._geometry_cache.clear()
+
     @property
     def segments(self):
         return self._segments
@@ -150,6 +196,258 @@ class ModelMaker:
         self._tex_scale = None
         self._vert_ranges = {s_id: () for s_id in self._surface_ids}
 
+    def _get_cache_key(self):
+
+        params = tuple(sorted(
+            (name, _freeze(value)) for name, value in vars(self).items()
+            if name != "_vert_ranges"
+        ))
+
+        return (type(self).__name__, params)
+
+    def _get_cache_file(self, cache_key):
+
+        digest = hashlib.sha1(repr(cache_key).encode("utf-8")).hexdigest()
+
+        return Filename.from_os_specific(str(ModelMaker._cache_path)) / f"{digest}.bam"
+
+    def _load_cached_geometry(self, cache_key):
+
+        if ModelMaker._cache_path is None:
+            return None
+
+        cache_file = self._get_cache_file(cache_key)
+
+        if not cache_file.exists():
+            return None
+
+        with open(cache_file.to_os_specific(), "rb") as bam_file:
+            node = PandaNode.decode_from_bam_stream(bam_file.read())
+
+        if node is None or not node.has_tag("vertex_ranges"):
+            return None
+
+        vert_ranges = json.loads(node.get_tag("vertex_ranges"))
+        node.clear_tag("vertex_ranges")
+
+        return node, {s_id: tuple(vert_range) for s_id, vert_range in vert_ranges.items()}
+
+    def _save_cached_geometry(self, cache_key, node, vert_ranges):
+
+        if ModelMaker._cache_path is None:
+            return
+
+        cache_file = self._get_cache_file(cache_key)
+        cache_file.make_dir()
+
+        bam_node = node.make_copy()
+        bam_node.set_tag("vertex_ranges", json.dumps(vert_ranges))
+
+        with open(cache_file.to_os_specific(), "wb") as bam_file:
+            bam_file.write(bam_node.encode_to_bam_stream())
+
+    def generate(self):
+        """
+        Return a GeomNode with the geometry for the current parameters.
+
+        Geometry is cached per set of parameters (and, if a cache path is set,
+        stored on disk), so repeated calls with the same parameters return a
+        copy of the node that shares the already generated Geoms instead of
+        building them again. The shared Geoms are copied on write, so calling
+        modify_geom() on the returned node leaves the cached geometry intact.
+
+        """
+
+        cache_key = self._get_cache_key()
+        cached = ModelMaker._geometry_cache.get(cache_key)
+
+        if cached is None:
+            cached = self._load_cached_geometry(cache_key)
+
+        if cached is None:
+            node = self._generate()
+            cached = (node, dict(self._vert_ranges))
+            self._save_cached_geometry(cache_key, *cached)
+
+        ModelMaker._geometry_cache[cache_key] = cached
+        node, vert_ranges = cached
+        self._vert_ranges = dict(vert_ranges)
+
+        return node.make_copy()
+
+    def _generate(self):
+        """
+        Build the geometry with NumPy when the current parameters allow it;
+        the result is identical to that of the per-vertex Python code, which
+        remains in use for all other parameters.
+
+        """
+
+        if self._supports_numpy():
+            return self._generate_numpy()
+
+        return self._generate_python()
+
+    def _supports_numpy(self):
+
+        return False
+
+    def _generate_numpy(self):
+
+        raise NotImplementedError
+
+    def _generate_python(self):
+
+        raise NotImplementedError
+
+    @staticmethod
+    def _normalize(vecs, out, scale=1.):
+        """
+        Write the given vectors to out, normalized the way Vec3.normalized()
+        does it (so in single precision and by multiplying with the reciprocal
+        of the length, leaving a zero vector zero) and multiplied by scale.
+
+        """
+
+        vecs = np.asarray(vecs, dtype=np.float32)
+        x, y, z = vecs[..., 0], vecs[..., 1], vecs[..., 2]
+        l2 = x * x + (y * y + z * z)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            recip = np.float32(1.) / np.sqrt(l2) * np.float32(scale)
+            np.multiply(vecs, recip[..., None], out=out)
+
+        out[l2 == 0.] = np.float32(0. * scale)
+
+    @staticmethod
+    def _index_array(count):
+
+        return np.empty(count, dtype=np.uint16 if count < 2 ** 16 else np.uint32)
+
+    @staticmethod
+    def _define_triangles(indices, corners, triangles):
+        """
+        Write the vertex indices of a series of polygons to indices, in the
+        order in which the loops would define them; the corners of the
+        polygons are given as arrays of vertex indices (or a single index
+        shared by all polygons) and each triangle of a polygon as a tuple of
+        corner positions.
+
+        """
+
+        corners = [np.ravel(corner) for corner in corners]
+        tri_corners = [i for tri in triangles for i in tri]
+        columns = indices.reshape(-1, len(tri_corners))
+
+        for column, i in enumerate(tri_corners):
+            columns[:, column] = corners[i]
+
+    def _define_grid_quads(self, indices, vi1, n):
+        """
+        Write the vertex indices of the quads between consecutive rows of n
+        vertices to indices; vi1 holds the index of the vertex in the upper
+        row at the start of each quad.
+
+        """
+
+        corners = (vi1, vi1 - n, vi1 - n + 1, vi1 + 1)
+        triangles = ((0, 1, 3), (1, 2, 3)) if self._inverted else ((0, 1, 2), (0, 2, 3))
+        self._define_triangles(indices, corners, triangles)
+
+    def _define_cap_vertices(self, rows, radius, segs, z, normal, v_sign, c, s):
+        """
+        Write the vertices of a circular cap to rows: a center vertex followed
+        by segs rings of vertices at the angles whose cosines and (signed)
+        sines are given by c and s.
+
+        """
+
+        rows[0, :3] = (0., 0., z)
+        rows[:, 3:6] = normal
+        rings = rows[1:].reshape(segs, len(c), -1)
+        radii = np.array([radius / segs] + [radius * (i + 1) / segs for i in range(1, segs)])
+        rings[..., 0] = radii[:, None] * c
+        rings[..., 1] = radii[:, None] * s
+        rings[..., 2] = z
+
+        if self._has_uvs:
+            rows[0, 6:] = (.5, .5)
+            rings[0, :, 6] = .5 + .5 * c / segs
+            rings[0, :, 7] = .5 + .5 * s * v_sign / segs
+            r = (radii[1:] / radius)[:, None]
+            rings[1:, :, 6] = .5 + .5 * c * r
+            rings[1:, :, 7] = .5 + .5 * s * v_sign * r
+
+    def _define_cap_indices(self, indices, start, segs, segs_c, top):
+        """
+        Write the vertex indices of the triangles around the center vertex
+        and of the quads between the rings of a circular cap to indices.
+
+        """
+
+        i = np.arange(start + 1, start + 1 + segs_c)
+        fan_size = segs_c * 3
+        triangles = ((0, 1, 2),) if top else ((0, 2, 1),)
+        self._define_triangles(indices[:fan_size], (start, i, i + 1), triangles)
+
+        n = segs_c + 1
+        vi1 = start + 1 + np.arange(1, segs)[:, None] * n + np.arange(segs_c)
+        corners = (vi1, vi1 - n, vi1 - n + 1, vi1 + 1)
+        triangles = ((0, 2, 1), (0, 3, 2)) if top else ((0, 1, 2), (0, 2, 3))
+        self._define_triangles(indices[fan_size:], corners, triangles)
+
+    def _vertex_rows(self, count):
+        """
+        Return an uninitialized array for the data of the given number of
+        vertices, one row of position, normal and (optional) uv values per
+        vertex.
+
+        """
+
+        return np.empty((count, 8 if self._has_uvs else 6), dtype=np.float32)
+
+    def _create_vertex_data(self, name, rows):
+
+        if self._has_uvs:
+            vertex_format = GeomVertexFormat.get_v3n3t2()
+        else:
+            vertex_format = GeomVertexFormat.get_v3n3()
+
+        vertex_data = GeomVertexData(name, vertex_format, Geom.UH_static)
+        vertex_data.unclean_set_num_rows(len(rows))
+        memview = memoryview(vertex_data.modify_array(0)).cast("B").cast("f")
+        memview[:] = rows.ravel()
+
+        return vertex_data
+
+    def _create_geom_node(self, name, vertex_data, indices, set_format=False):
+
+        if self._vertex_color:
+            if set_format:
+                if self._has_uvs:
+                    vertex_format = GeomVertexFormat.get_v3n3c4t2()
+                else:
+                    vertex_format = GeomVertexFormat.get_v3n3c4()
+                vertex_data.set_format(vertex_format)
+            vertex_data = vertex_data.set_color(self._vertex_color)
+
+        tris_prim = GeomTriangles(Geom.UH_static)
+
+        if indices.dtype == np.uint32:
+            tris_prim.set_index_type(Geom.NT_uint32)
+
+        tris_array = tris_prim.modify_vertices()
+        tris_array.unclean_set_num_rows(len(indices))
+        memview = memoryview(tris_array).cast("B").cast(indices.dtype.char)
+        memview[:] = indices
+
+        geom = Geom(vertex_data)
+        geom.add_primitive(tris_prim)
+        node = GeomNode(name)
+        node.add_geom(geom)
+
+        return node
+
     def _make_flat_shaded(self, indices, verts):
 
         points = [Point3(verts[i]["pos"]) for i in indices[:3]]
@@ -5,6 +5,7 @@
 
 from .base import *
 import array
+import numpy as np
 
 class BoxMaker(ModelMaker):
 
@@ -265,7 +266,95 @@ class BoxMaker(ModelMaker):
 
         self.__define_quads(indices, index_offset, direction, segs)
 
-    def generate(self):
+    def _supports_numpy(self):
+
+        return (self._thickness is None
+                and not (self._tex_units or self._tex_offset or self._tex_rotation
+                         or self._tex_scale))
+
+    def _generate_numpy(self):
+
+        center = (0., 0., 0.) if self._center is None else self._center
+        width = max(.001, self._width)
+        depth = max(.001, self._depth)
+        height = max(.001, self._height)
+        dims = (width, depth, height)
+        side_ids = self._side_ids
+        side_names = self._side_names
+        open_side_ids = [side_ids[name] for name in self._open_sides]
+        segs = {} if self._segments is None else self._segments
+        segs_w = max(1, segs.get("width", 1))
+        segs_d = max(1, segs.get("depth", 1))
+        segs_h = max(1, segs.get("height", 1))
+        segs = {"x": segs_w, "y": segs_d, "z": segs_h}
+        inverted = self._inverted
+        self._vert_ranges = vert_ranges = {
+            "left": (), "right": (), "back": (), "front": (), "bottom": (),
+            "top": (), "inner_left": (), "inner_right": (), "inner_back": (),
+            "inner_front": (), "inner_bottom": (), "inner_top": ()
+        }
+        sides = []
+
+        for (axis1_id, axis2_id, axis3_id) in ("xyz", "zxy", "yzx"):
+            for direction in (-1, 1):
+                side_id = "-" if direction == -1 else ""
+                side_id += axis1_id + axis2_id
+                if side_id not in open_side_ids:
+                    sides.append((axis1_id, axis2_id, axis3_id, direction, side_id))
+
+        vert_count = sum((segs[side[0]] + 1) * (segs[side[1]] + 1) for side in sides)
+        quad_count = sum(segs[side[0]] * segs[side[1]] for side in sides)
+        rows = self._vertex_rows(vert_count)
+        indices = self._index_array(quad_count * 6)
+        index_offset = 0
+        quad_offset = 0
+
+        # Define the vertices for each side of the box
+
+        for axis1_id, axis2_id, axis3_id, direction, side_id in sides:
+
+            plane_id = axis1_id + axis2_id
+            axis1_index = "xyz".index(axis1_id)
+            axis2_index = "xyz".index(axis2_id)
+            axis3_index = "xyz".index(axis3_id)
+            segs1 = segs[axis1_id]
+            segs2 = segs[axis2_id]
+            end = index_offset + (segs1 + 1) * (segs2 + 1)
+            side = rows[index_offset:end].reshape(segs2 + 1, segs1 + 1, -1)
+            a = np.arange(segs1 + 1) / segs1
+            b = (np.arange(segs2 + 1) / segs2)[:, None]
+            side[..., axis1_index] = (-.5 + a) * dims[axis1_index] + center[axis1_index]
+            side[..., axis2_index] = (-.5 + b) * dims[axis2_index] + center[axis2_index]
+            side[..., axis3_index] = .5 * dims[axis3_index] * direction + center[axis3_index]
+            normal = [0., 0., 0.]
+            normal[axis3_index] = direction * (-1. if inverted else 1.)
+            side[..., 3:6] = normal
+
+            if self._has_uvs:
+                u = (-b if plane_id == "zx" else a) * direction
+                u = u + (1. if (direction > 0 if plane_id == "zx" else direction < 0) else 0.)
+                if inverted:
+                    u = 1. - u
+                side[..., 6] = u
+                side[..., 7] = a if plane_id == "zx" else b
+
+            # Define the vertex order of the side quads
+
+            quad_end = quad_offset + segs1 * segs2 * 6
+            vi1 = index_offset + np.arange(segs2)[:, None] * (segs1 + 1) + np.arange(segs1)
+            corners = (vi1, vi1 + 1, vi1 + segs1 + 1, vi1 + segs1 + 2)
+            triangles = ((0, 3, 1), (0, 2, 3)) if inverted == (direction == 1) \
+                        else ((0, 1, 3), (0, 3, 2))
+            self._define_triangles(indices[quad_offset:quad_end], corners, triangles)
+            vert_ranges[side_names[side_id]] = (index_offset, end)
+            index_offset = end
+            quad_offset = quad_end
+
+        vertex_data = self._create_vertex_data("box_data", rows)
+
+        return self._create_geom_node("box_node", vertex_data, indices, set_format=True)
+
+    def _generate_python(self):
 
         center = (0., 0., 0.) if self._center is None else self._center
         width = max(.001, self._width)
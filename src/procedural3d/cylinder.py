@@ -6,6 +6,7 @@
 from .base import *
 from math import pi, sin, cos
 import array
+import numpy as np
 
 
 class CylinderMaker(ModelMaker):
@@ -194,7 +195,93 @@ class CylinderMaker(ModelMaker):
 
         vertex_data.transform_vertices(mat)
 
-    def generate(self):
+    def _supports_numpy(self):
+
+        radius = max(.001, self._radius)
+
+        return (self._smooth and self._slice <= 0.
+                and (self._thickness is None or self._thickness >= radius)
+                and not (self._tex_units or self._tex_offset or self._tex_rotation
+                         or self._tex_scale))
+
+    def _generate_numpy(self):
+
+        bottom_center = (0., 0., 0.) if self._bottom_center is None else self._bottom_center
+        top_center = (0., 0., 1.) if self._top_center is None else self._top_center
+        axis_vec = Point3(*top_center) - Point3(*bottom_center)
+        height = axis_vec.length()
+        radius = max(.001, self._radius)
+        segs = {} if self._segments is None else self._segments
+        segs_c = max(3, segs.get("circular", 20))
+        segs_a = max(1, segs.get("axial", 1))
+        segs_bc = max(0, segs.get("bottom_cap", 1))
+        segs_tc = max(0, segs.get("top_cap", 1))
+        slice = max(0., min(360., self._slice))
+        slice_radians = pi * slice / 180.
+        delta_angle = pi * ((360. - slice) / 180.) / segs_c
+        inverted = self._inverted
+        sign = -1. if inverted else 1.
+        self._vert_ranges = vert_ranges = {
+            "main": (), "bottom_cap": (), "top_cap": (), "slice_start_cap": (),
+            "slice_end_cap": (), "inner_main": ()
+        }
+
+        # The trigonometry is done per angle with the math module, exactly as
+        # in the per-vertex code; only the products are computed in bulk
+
+        angles = [delta_angle * i + (0. if inverted else slice_radians) for i in range(segs_c + 1)]
+        c = np.array([cos(angle) for angle in angles])
+        s = np.array([sin(angle) for angle in angles]) * sign
+
+        n = segs_c + 1
+        bottom_count = segs_bc * n + 1 if segs_bc else 0
+        main_end = bottom_count + (segs_a + 1) * n
+        top_count = segs_tc * n + 1 if segs_tc else 0
+        rows = self._vertex_rows(main_end + top_count)
+        bottom_index_count = segs_c * 3 * (segs_bc * 2 - 1) if segs_bc else 0
+        main_index_end = bottom_index_count + segs_a * segs_c * 6
+        top_index_count = segs_c * 3 * (segs_tc * 2 - 1) if segs_tc else 0
+        indices = self._index_array(main_index_end + top_index_count)
+
+        if segs_bc:
+            self._define_cap_vertices(rows[:bottom_count], radius, segs_bc, 0.,
+                                      (0., 0., 1. if inverted else -1.),
+                                      1. if inverted else -1., c, s)
+            self._define_cap_indices(indices[:bottom_index_count], 0, segs_bc, segs_c, False)
+            vert_ranges["bottom_cap"] = (0, bottom_count)
+
+        # Define the mantle quad vertices; their normals are normalized in place
+
+        main = rows[bottom_count:main_end].reshape(segs_a + 1, n, -1)
+        main[..., 0] = radius * c
+        main[..., 1] = radius * s
+        main[..., 2] = np.array([height * i / segs_a for i in range(segs_a + 1)])[:, None]
+        main[..., 3:5] = main[..., :2]
+        main[..., 5] = 0.
+        self._normalize(main[..., 3:6], main[..., 3:6], sign)
+
+        if self._has_uvs:
+            main[..., 6] = np.arange(n) / segs_c
+            main[..., 7] = (np.arange(segs_a + 1) / segs_a)[:, None]
+
+        vi1 = bottom_count + np.arange(1, segs_a + 1)[:, None] * n + np.arange(segs_c)
+        self._define_grid_quads(indices[bottom_index_count:main_index_end], vi1, n)
+        vert_ranges["main"] = (bottom_count, main_end)
+
+        if segs_tc:
+            self._define_cap_vertices(rows[main_end:], radius, segs_tc, height,
+                                      (0., 0., -1. if inverted else 1.),
+                                      -1. if inverted else 1., c, s)
+            self._define_cap_indices(indices[main_index_end:], main_end, segs_tc, segs_c, True)
+
+        vert_ranges["top_cap"] = (main_end, len(rows))
+
+        vertex_data = self._create_vertex_data("cone_data", rows)
+        self.__transform_vertices(vertex_data, axis_vec, bottom_center)
+
+        return self._create_geom_node("cylinder", vertex_data, indices, set_format=True)
+
+    def _generate_python(self):
 
         bottom_center = (0., 0., 0.) if self._bottom_center is None else self._bottom_center
         top_center = (0., 0., 1.) if self._top_center is None else self._top_center
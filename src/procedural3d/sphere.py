@@ -6,6 +6,7 @@
 from .base import *
 from math import pi, sin, cos, acos, sqrt
 import array
+import numpy as np
 
 
 class SphereMaker(ModelMaker):
@@ -168,7 +169,97 @@ class SphereMaker(ModelMaker):
         self._slice = 0.
         self._thickness = None
 
-    def generate(self):
+    def _supports_numpy(self):
+
+        return (self._smooth and self._bottom_clip <= -1. and self._top_clip >= 1.
+                and self._slice <= 0. and self._thickness is None
+                and not (self._tex_units or self._tex_offset or self._tex_rotation
+                         or self._tex_scale))
+
+    def _generate_numpy(self):
+
+        center = (0., 0., 0.) if self._center is None else self._center
+        radius = max(.001, self._radius)
+        segs = {} if self._segments is None else self._segments
+        segs_h = max(3, segs.get("horizontal", 20))
+        segs_v = max(2, segs.get("vertical", 10))
+        bottom_clip = max(-1., min(1., self._bottom_clip))
+        bottom_height = radius * bottom_clip
+        top_clip = max(bottom_clip, min(1., self._top_clip))
+        top_height = radius * top_clip
+        slice = max(0., min(360., self._slice))
+        slice_radians = pi * slice / 180.
+        delta_angle_h = pi * ((360. - slice) / 180.) / segs_h
+        bottom_angle = pi - acos(bottom_height / radius)
+        top_angle = acos(top_height / radius)
+        delta_angle_v = (pi - bottom_angle - top_angle) / segs_v
+        inverted = self._inverted
+        sign = -1. if inverted else 1.
+        self._vert_ranges = vert_ranges = {
+            "main": (), "bottom_cap": (), "top_cap": (), "slice_start_cap": (),
+            "slice_end_cap": (), "inner_main": (), "inner_bottom_cap": (),
+            "inner_top_cap": ()
+        }
+
+        # The trigonometry is done per angle with the math module, exactly as
+        # in the per-vertex code; only the products are computed in bulk
+
+        angles_h = [delta_angle_h * i + (0. if inverted else slice_radians)
+                    for i in range(segs_h + 1)]
+        cos_h = np.array([cos(angle_h) for angle_h in angles_h])
+        sin_h = np.array([sin(angle_h) for angle_h in angles_h])
+        angles_v = [bottom_angle + delta_angle_v * i for i in range(1, segs_v)]
+        z = np.array([radius * -cos(angle_v) for angle_v in angles_v])
+        radius_h = np.array([radius * sin(angle_v) for angle_v in angles_v])
+        u = np.arange(segs_h + 1) / segs_h
+
+        # Define the bottom pole, main and top pole vertices, in that order
+
+        rows = self._vertex_rows(segs_h * 2 + (segs_v - 1) * (segs_h + 1))
+        bottom_pole = rows[:segs_h]
+        main = rows[segs_h:-segs_h].reshape(segs_v - 1, segs_h + 1, -1)
+        top_pole = rows[-segs_h:]
+        bottom_pole[:, :3] = (0., 0., -radius)
+        bottom_pole[:, 3:6] = (0., 0., 1. if inverted else -1.)
+        main[..., 0] = radius_h[:, None] * cos_h
+        main[..., 1] = radius_h[:, None] * sin_h * sign
+        main[..., 2] = z[:, None]
+        self._normalize(main[..., :3], main[..., 3:6], sign)
+        top_pole[:, :3] = (0., 0., radius)
+        top_pole[:, 3:6] = (0., 0., -1. if inverted else 1.)
+
+        if self._has_uvs:
+            bottom_pole[:, 6] = u[:-1]
+            bottom_pole[:, 7] = 0.
+            main[..., 6] = u
+            main[..., 7] = (np.array(angles_v) / pi)[:, None]
+            top_pole[:, 6] = u[:-1]
+            top_pole[:, 7] = 1.
+
+        vert_ranges["main"] = (0, len(rows))
+
+        # Define the vertex order of the bottom pole triangles, the main quads
+        # and the top pole triangles
+
+        n = segs_h + 1
+        j = np.arange(segs_h)
+        indices = self._index_array(segs_h * 6 * (segs_v - 1))
+        main_end = len(indices) - segs_h * 3
+        self._define_triangles(indices[:segs_h * 3], (j, j + n, j + segs_h), ((0, 1, 2),))
+        vi1 = np.arange(1, segs_v - 1)[:, None] * n + j + segs_h
+        self._define_grid_quads(indices[segs_h * 3:main_end], vi1, n)
+        vi1 = len(rows) - 1 - j
+        self._define_triangles(indices[main_end:], (vi1, vi1 - n, vi1 - segs_h), ((0, 1, 2),))
+
+        vertex_data = self._create_vertex_data("sphere_data", rows)
+        x, y, z = center
+
+        if x or y or z:
+            vertex_data.transform_vertices(Mat4.translate_mat(x, y, z))
+
+        return self._create_geom_node("sphere", vertex_data, indices)
+
+    def _generate_python(self):
 
         center = (0., 0., 0.) if self._center is None else self._center
         radius = max(.001, self._radius)
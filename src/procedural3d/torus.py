@@ -6,6 +6,7 @@
 from .base import *
 from math import pi, sin, cos, atan2
 import array
+import numpy as np
 
 
 class TorusMaker(ModelMaker):
@@ -250,7 +251,86 @@ class TorusMaker(ModelMaker):
 
             uvs.append((u, v))
 
-    def generate(self):
+    def _supports_numpy(self):
+
+        section_radius = max(.001, self._section_radius)
+
+        return (self._smooth_ring and self._smooth_section and self._ring_slice <= 0.
+                and self._section_slice <= 0. and not self._twist
+                and (self._thickness is None or self._thickness >= section_radius)
+                and not (self._tex_units or self._tex_offset or self._tex_rotation
+                         or self._tex_scale))
+
+    def _generate_numpy(self):
+
+        center = (0., 0., 0.) if self._center is None else self._center
+        ring_radius = max(0., self._ring_radius)
+        section_radius = max(.001, self._section_radius)
+        segs = {} if self._segments is None else self._segments
+        segs_r = max(3, segs.get("ring", 20))
+        segs_s = max(3, segs.get("section", 10))
+        ring_slice = max(0., min(360., self._ring_slice))
+        ring_slice_radians = pi * ring_slice / 180.
+        section_slice = max(0., min(360., self._section_slice))
+        section_slice_radians = pi * section_slice / 180.
+        rot = pi * self._rotation / 180.
+        inverted = self._inverted
+        sign = -1. if inverted else 1.
+        tw = pi * self._twist / (180. * segs_r) * (-1 if inverted else 1.)
+        twist_angle = -tw * segs_r if inverted else 0.
+        delta_angle_h = pi * ((360. - ring_slice) / 180.) / segs_r
+        delta_angle_v = pi * ((360. - section_slice) / 180.) / segs_s
+        self._vert_ranges = vert_ranges = {
+            "main": (), "ring_slice_start_cap": (), "ring_slice_end_cap": (),
+            "section_slice_start_cap": (), "section_slice_end_cap": (), "inner_main": ()
+        }
+
+        # The trigonometry is done per angle with the math module, exactly as
+        # in the per-vertex code; only the products are computed in bulk
+
+        angles_h = [delta_angle_h * i + (0. if inverted else ring_slice_radians)
+                    for i in range(segs_r + 1)]
+        c = np.array([cos(angle_h) for angle_h in angles_h])[:, None]
+        s = np.array([sin(angle_h) for angle_h in angles_h])[:, None] * sign
+        angles_v = [rot + twist_angle + delta_angle_v * j + section_slice_radians
+                    for j in range(segs_s + 1)]
+        r = np.array([ring_radius - section_radius * cos(angle_v) for angle_v in angles_v])
+        z = np.array([section_radius * sin(angle_v) for angle_v in angles_v])
+
+        # Define the main quad vertices; the unnormalized normals are written
+        # to the normal columns first and then normalized in place
+
+        rows = self._vertex_rows((segs_r + 1) * (segs_s + 1))
+        main = rows.reshape(segs_r + 1, segs_s + 1, -1)
+        x = r * c
+        y = r * s
+        main[..., 0] = x
+        main[..., 1] = y
+        main[..., 2] = z
+        main[..., 3] = x - ring_radius * c
+        main[..., 4] = y - ring_radius * s
+        main[..., 5] = z
+        self._normalize(main[..., 3:6], main[..., 3:6], sign)
+
+        if self._has_uvs:
+            main[..., 6] = (np.arange(segs_r + 1) / segs_r)[:, None]
+            main[..., 7] = 1. - np.arange(segs_s + 1) / segs_s
+
+        n = segs_s + 1
+        indices = self._index_array(segs_r * segs_s * 6)
+        vi1 = np.arange(1, segs_r + 1)[:, None] * n + np.arange(segs_s)
+        self._define_grid_quads(indices, vi1, n)
+        vert_ranges["main"] = (0, len(rows))
+
+        vertex_data = self._create_vertex_data("torus_data", rows)
+        x, y, z = center
+
+        if x or y or z:
+            vertex_data.transform_vertices(Mat4.translate_mat(x, y, z))
+
+        return self._create_geom_node("torus", vertex_data, indices)
+
+    def _generate_python(self):
 
         center = (0., 0., 0.) if self._center is None else self._center
         ring_radius = max(0., self._ring_radius)
@@ -0,0 +1,18 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from f1p.services.data_extractor.service import DataExtractorService
+
+
+@pytest.fixture()
+def data_extractor_service(mocker: MockerFixture) -> DataExtractorService:
+    mocker.patch.object(DataExtractorService, "accept")
+    mocker.patch("f1p.services.data_extractor.service.fastf1.Cache.enable_cache")
+
+    return DataExtractorService(
+        parent=mocker.MagicMock(),
+        task_manager=mocker.MagicMock(),
+        window_width=1920,
+        window_height=1080,
+        text_font=mocker.MagicMock(),
+    )
@@ -0,0 +1,60 @@
+from collections.abc import Callable
+from timeit import timeit
+
+import numpy as np
+from panda3d.core import NodePath
+
+from f1p.ui.components.driver.markers import CarMarkers
+from procedural3d import SphereMaker
+from procedural3d.base import ModelMaker
+
+
+def test_car_markers_scale_with_marker_count(record_property: Callable[[str, object], None]) -> None:
+    rng = np.random.default_rng(0)
+    frames = 200
+
+    for marker_count in (20, 60):
+        positions = rng.uniform(-10, 10, size=(frames, marker_count, 3))
+        colors = [(1.0, 0.0, 0.0, 1.0)] * marker_count
+
+        render = NodePath("render")
+        node_paths: list[NodePath] = []
+
+        def node_per_marker_startup() -> None:
+            for _ in range(marker_count):
+                # Every marker used to build its own sphere, bypass the geometry cache to measure that
+                node_path = render.attachNewNode(SphereMaker(radius=0.10)._generate_python())
+                node_path.setColor(1.0, 0.0, 0.0, 1.0)
+                node_paths.append(node_path)
+
+        def node_per_marker_frames() -> None:
+            for frame in positions.tolist():
+                for node_path, (x, y, z) in zip(node_paths, frame, strict=True):
+                    node_path.setPos(x, y, z)
+
+        car_markers: list[CarMarkers] = []
+
+        def car_markers_startup() -> None:
+            ModelMaker.clear_cache()
+            car_markers.append(CarMarkers(render, colors))
+
+        def car_markers_frames() -> None:
+            for frame in positions:
+                car_markers[0].update(frame)
+
+        node_per_marker_startup_seconds = timeit(node_per_marker_startup, number=1)
+        car_markers_startup_seconds = timeit(car_markers_startup, number=1)
+        node_per_marker_seconds = timeit(node_per_marker_frames, number=1) / frames
+        car_markers_seconds = timeit(car_markers_frames, number=1) / frames
+
+        measurements = {
+            "node_per_marker_startup_milliseconds": node_per_marker_startup_seconds * 1e3,
+            "car_markers_startup_milliseconds": car_markers_startup_seconds * 1e3,
+            "node_per_marker_microseconds_per_frame": node_per_marker_seconds * 1e6,
+            "car_markers_microseconds_per_frame": car_markers_seconds * 1e6,
+        }
+        for name, value in measurements.items():
+            record_property(f"{name}_{marker_count}", round(value, 3))
+
+        assert 1 == render.getNumChildren() - marker_count
+        assert car_markers_startup_seconds < node_per_marker_startup_seconds
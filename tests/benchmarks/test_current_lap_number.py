@@ -0,0 +1,47 @@
+import math
+from collections.abc import Callable
+from timeit import timeit
+
+import numpy as np
+from pandas import DataFrame
+
+from f1p.services.data_extractor.service import DataExtractorService
+from f1p.services.data_extractor.store import TickDriverStore
+
+
+def synthetic_pos_data(drivers: int = 20, ticks: int = 60_000) -> DataFrame:
+    session_time_ticks = np.arange(1, ticks + 1)
+    laps_completion = np.concatenate(
+        [session_time_ticks / 1_000 - driver_index * 0.01 for driver_index in range(drivers)],
+    )
+
+    return DataFrame(
+        {
+            "DriverNumber": np.repeat([str(driver_number) for driver_number in range(1, drivers + 1)], ticks),
+            "SessionTimeTick": np.tile(session_time_ticks, drivers),
+            "LapsCompletion": laps_completion.clip(0),
+        },
+    )
+
+
+def test_current_lap_number_lookup_latency(record_property: Callable[[str, object], None]) -> None:
+    pos_df = synthetic_pos_data()
+    tick_store = TickDriverStore.from_frame(pos_df)
+    leader_lap_numbers = DataExtractorService.compute_leader_lap_numbers(tick_store)
+    session_time_ticks = np.random.default_rng(0).integers(1, tick_store.last_tick + 1, 200)
+
+    def filtered_lookup() -> None:
+        for session_time_tick in session_time_ticks:
+            math.ceil(pos_df[pos_df["SessionTimeTick"] == session_time_tick]["LapsCompletion"].max())
+
+    def array_lookup() -> None:
+        for session_time_tick in session_time_ticks:
+            int(leader_lap_numbers[session_time_tick - tick_store.first_tick])
+
+    filtered_seconds = timeit(filtered_lookup, number=1) / session_time_ticks.size
+    array_seconds = timeit(array_lookup, number=20) / (20 * session_time_ticks.size)
+
+    record_property("filtered_microseconds_per_call", round(filtered_seconds * 1e6, 3))
+    record_property("array_microseconds_per_call", round(array_seconds * 1e6, 3))
+
+    assert array_seconds * 100 < filtered_seconds
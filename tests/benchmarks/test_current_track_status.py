@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from timeit import timeit
+
+import numpy as np
+from pandas import DataFrame
+
+from f1p.services.data_extractor.service import DataExtractorService
+
+
+def synthetic_track_statuses(ticks: int = 60_000, statuses: int = 40) -> DataFrame:
+    boundaries = np.linspace(1, ticks, statuses + 1).astype("int64")
+
+    return DataFrame(
+        {
+            "Status": np.tile([1, 2, 4, 6], statuses // 4),
+            "SessionTimeTick": boundaries[:-1],
+            "SessionTimeTickEnd": boundaries[1:],
+        },
+    )
+
+
+def test_full_playback_track_status_resolution(
+    data_extractor_service: DataExtractorService,
+    record_property: Callable[[str, object], None],
+) -> None:
+    ts_df = synthetic_track_statuses()
+    data_extractor_service._session_ticks = 60_000
+    data_extractor_service._track_statuses = ts_df
+    data_extractor_service.index_track_statuses()
+    session_time_ticks = range(1, 60_001)
+
+    def filtered_lookup(session_time_tick: int) -> None:
+        filtered_df = ts_df[ts_df["SessionTimeTick"] <= session_time_tick]
+        filtered_df = filtered_df[filtered_df["SessionTimeTickEnd"] >= session_time_tick]
+        filtered_df.iloc[0]
+
+    def indexed_playback() -> None:
+        for session_time_tick in session_time_ticks:
+            data_extractor_service.get_current_track_status(session_time_tick)
+
+    filtered_seconds = timeit(lambda: filtered_lookup(30_000), number=200) / 200
+    indexed_seconds = timeit(indexed_playback, number=1)
+
+    record_property("filtered_full_playback_seconds", round(filtered_seconds * len(session_time_ticks), 3))
+    record_property("indexed_full_playback_seconds", round(indexed_seconds, 3))
+
+    assert indexed_seconds * 100 < filtered_seconds * len(session_time_ticks)
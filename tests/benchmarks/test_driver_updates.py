@@ -0,0 +1,38 @@
+from collections.abc import Callable
+from timeit import timeit
+
+from direct.task.Task import TaskManager
+from panda3d.core import NodePath
+
+
+def test_batched_driver_update_overhead(record_property: Callable[[str, object], None]) -> None:
+    task_manager = TaskManager()
+    task_manager.setupTaskChain("updating", numThreads=7)
+    node_paths = [NodePath(f"driver{index}") for index in range(20)]
+    frames = 300
+
+    def update(node_path: NodePath, frame: int) -> None:
+        node_path.setPos(frame, frame, 0)
+
+    def task_per_driver() -> None:
+        for frame in range(frames):
+            for node_path in node_paths:
+                task_manager.add(update, "updateDriver", extraArgs=[node_path, frame], taskChain="updating")
+
+            task_manager.step()
+
+    def batched() -> None:
+        for frame in range(frames):
+            for node_path in node_paths:
+                update(node_path, frame)
+
+            task_manager.step()
+
+    task_per_driver_seconds = timeit(task_per_driver, number=1) / frames
+    batched_seconds = timeit(batched, number=1) / frames
+    task_manager.destroy()
+
+    record_property("task_per_driver_microseconds_per_frame", round(task_per_driver_seconds * 1e6, 3))
+    record_property("batched_microseconds_per_frame", round(batched_seconds * 1e6, 3))
+
+    assert batched_seconds < task_per_driver_seconds
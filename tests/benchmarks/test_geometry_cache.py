@@ -0,0 +1,27 @@
+from collections.abc import Callable
+from timeit import timeit
+
+from procedural3d import SphereMaker
+from procedural3d.base import ModelMaker
+
+
+def test_geometry_cache(record_property: Callable[[str, object], None]) -> None:
+    markers = 60
+    ModelMaker.clear_cache()
+
+    def uncached() -> None:
+        for _ in range(markers):
+            SphereMaker(radius=0.10)._generate()
+
+    def cached() -> None:
+        for _ in range(markers):
+            SphereMaker(radius=0.10).generate()
+
+    uncached_seconds = timeit(uncached, number=1)
+    cached_seconds = timeit(cached, number=1)
+    ModelMaker.clear_cache()
+
+    record_property("uncached_milliseconds", round(uncached_seconds * 1e3, 3))
+    record_property("cached_milliseconds", round(cached_seconds * 1e3, 3))
+
+    assert cached_seconds < uncached_seconds
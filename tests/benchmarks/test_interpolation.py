@@ -0,0 +1,28 @@
+from collections.abc import Callable
+from timeit import timeit
+
+import numpy as np
+
+from f1p.services.data_extractor.store import TickDriverStore
+from tests.benchmarks.test_current_lap_number import synthetic_pos_data
+
+
+def test_field_interpolation_latency(record_property: Callable[[str, object], None]) -> None:
+    rng = np.random.default_rng(0)
+    pos_df = synthetic_pos_data()
+    pos_df["X"] = rng.random(len(pos_df))
+    pos_df["Y"] = rng.random(len(pos_df))
+    pos_df["Z"] = 0.0
+    pos_df["SessionTimeMilliseconds"] = pos_df["SessionTimeTick"] * 250 + rng.integers(0, 30, len(pos_df))
+    tick_store = TickDriverStore.from_frame(pos_df)
+    playback_ticks = (rng.random(1_000) * (tick_store.last_tick - 1) + 1).tolist()
+
+    def interpolate_frames() -> None:
+        for playback_tick in playback_ticks:
+            tick_store.interpolate(playback_tick)
+
+    frame_seconds = timeit(interpolate_frames, number=5) / (5 * len(playback_ticks))
+
+    record_property("interpolation_microseconds_per_frame", round(frame_seconds * 1e6, 3))
+
+    assert frame_seconds < 1e-3
@@ -0,0 +1,81 @@
+from collections.abc import Callable
+from timeit import timeit
+
+import numpy as np
+
+from f1p.ui.components.leaderboard.renderer import LeaderboardModel, LeaderboardRenderer, LeaderboardRow
+
+
+class CountingWidget:
+    def __init__(self):
+        self.writes = 0
+
+    def __setitem__(self, option: str, value: object) -> None:
+        self.writes += 1
+
+
+def open_driver() -> None: ...
+
+
+def steady_models(driver_count: int, ticks: int) -> list[LeaderboardModel]:
+    # Green flag running, the order holds and one gap moves every few ticks
+    rng = np.random.default_rng(0)
+    gaps = rng.uniform(0.1, 3.0, size=driver_count)
+    models = []
+
+    for tick in range(ticks):
+        if tick % 4 == 0:
+            gaps[rng.integers(1, driver_count)] += 0.001
+
+        rows = tuple(
+            LeaderboardRow(
+                checkered_flag="",
+                team_color=(0.2, 0.4, 0.6, 1.0),
+                abbreviation=f"D{index:02d}",
+                open_driver=open_driver,
+                abbreviation_color=(1.0, 1.0, 1.0, 0.8),
+                time_color=(1.0, 1.0, 1.0, 0.8),
+                time="Interval" if index == 0 else f"+{gaps[index]:.3f}",
+                tire_color=(1.0, 0.0, 0.0, 1.0),
+                tire="S",
+                fastest_lap="",
+            )
+            for index in range(driver_count)
+        )
+        models.append(LeaderboardModel("LAP 12/50", (0.0, 1.0, 0.0, 1.0), (0.0, 0.0, 0.0, 1.0), "Green", rows))
+
+    return models
+
+
+def test_leaderboard_renderer_touches_only_dirty_rows(record_property: Callable[[str, object], None]) -> None:
+    driver_count = 20
+    ticks = 400
+    models = steady_models(driver_count, ticks)
+
+    def widgets() -> list[CountingWidget]:
+        return [CountingWidget() for _ in range(driver_count)]
+
+    cells = [widgets() for _ in range(6)]
+    header = [CountingWidget() for _ in range(5)]
+    renderer = LeaderboardRenderer(header[0], header[1:4], header[4], *cells)
+    renderer.render(models[0])
+    first_render_writes = sum(widget.writes for widget in header + sum(cells, []))
+
+    dirty_rows_per_tick = []
+
+    def render_ticks() -> None:
+        for model in models[1:]:
+            dirty_rows_per_tick.append(len(renderer.dirty_rows(model)))
+            renderer.render(model)
+
+    seconds = timeit(render_ticks, number=1) / (ticks - 1)
+    steady_writes = sum(widget.writes for widget in header + sum(cells, [])) - first_render_writes
+
+    record_property("first_render_writes", first_render_writes)
+    record_property("every_cell_writes_per_tick", 6 + driver_count * len(LeaderboardRow._fields))
+    record_property("dirty_writes_per_tick", round(steady_writes / (ticks - 1), 3))
+    record_property("renderer_microseconds_per_tick", round(seconds * 1e6, 3))
+
+    assert 6 + driver_count * len(LeaderboardRow._fields) == first_render_writes
+    assert max(dirty_rows_per_tick) <= 1
+    assert steady_writes < ticks
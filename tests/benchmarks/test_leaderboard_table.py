@@ -0,0 +1,94 @@
+from collections.abc import Callable
+from timeit import timeit
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from f1p.services.data_extractor.leaderboard import LeaderboardTable
+from f1p.services.data_extractor.store import TickDriverStore
+
+
+def race_frame(ticks: int, driver_count: int) -> DataFrame:
+    rng = np.random.default_rng(0)
+    shape = (ticks, driver_count)
+
+    # Gaps drift by a few milliseconds a tick, the order is reshuffled now and then
+    gaps = np.round(np.abs(rng.uniform(0.1, 3.0, size=driver_count) + rng.normal(0, 0.002, shape).cumsum(axis=0)), 3)
+    positions = np.tile(np.arange(driver_count), (ticks, 1))
+    for tick in range(0, ticks, 500):
+        positions[tick:] = rng.permutation(positions[tick])
+
+    return DataFrame(
+        {
+            "DriverNumber": pd.Categorical(np.tile([str(number) for number in range(driver_count)], ticks)),
+            "SessionTimeTick": np.repeat(np.arange(1, ticks + 1), driver_count).astype("int32"),
+            "PositionIndex": positions.ravel().astype("int8"),
+            "DiffToCarInFront": gaps.ravel(),
+            "DiffToLeader": gaps.cumsum(axis=1).ravel(),
+            "TyreLife": (np.arange(ticks) // 400).repeat(driver_count).astype("float64"),
+            "IsDNF": np.zeros(ticks * driver_count, dtype="bool"),
+            "InPit": rng.random(ticks * driver_count) < 0.01,
+            "Compound": np.where(np.arange(ticks * driver_count) % 3, "S", "M"),
+            "CompoundColor": [[1.0, 0.0, 0.0, 1.0]] * (ticks * driver_count),
+        },
+    )
+
+
+def format_records(records: dict[str, dict[str, object]], gap_column: str) -> list[tuple[str, str, tuple]]:
+    # Per tick formatting the interval and leader processors did before the table
+    cells = []
+    for record in records.values():
+        if record["PositionIndex"] == 0:
+            time = "Interval"
+        elif record["IsDNF"]:
+            time = "OUT"
+        elif record["InPit"]:
+            time = "IN PIT"
+        else:
+            time = f"+{record[gap_column]:.3f}"
+
+        cells.append((time, record["Compound"], tuple(record["CompoundColor"])))
+
+    return cells
+
+
+def test_leaderboard_table_trades_memory_for_formatting(record_property: Callable[[str, object], None]) -> None:
+    ticks = 20_000
+    driver_count = 20
+    tick_store = TickDriverStore.from_frame(race_frame(ticks, driver_count))
+    sample_ticks = range(1, ticks + 1, 10)
+    sample_records = [tick_store.records(tick) for tick in sample_ticks]
+
+    tables: list[LeaderboardTable] = []
+    build_seconds = timeit(lambda: tables.append(LeaderboardTable.from_store(tick_store)), number=1)
+    table = tables[0]
+
+    def formatted_ticks() -> None:
+        for records in sample_records:
+            for gap_column in ("DiffToCarInFront", "DiffToLeader"):
+                format_records(records, gap_column)
+
+    def table_ticks() -> None:
+        for tick in sample_ticks:
+            for mode in ("interval", "leader"):
+                table.rows(mode, tick)
+
+    formatted_seconds = timeit(formatted_ticks, number=1) / (len(sample_ticks) * 2)
+    table_seconds = timeit(table_ticks, number=1) / (len(sample_ticks) * 2)
+    saved_seconds = formatted_seconds - table_seconds
+
+    measurements = {
+        "table_build_milliseconds": build_seconds * 1e3,
+        "table_megabytes": table.nbytes / 2**20,
+        "table_strings": len(table.strings),
+        "formatted_microseconds_per_tick": formatted_seconds * 1e6,
+        "table_microseconds_per_tick": table_seconds * 1e6,
+        # Ticks of playback before the saved formatting pays back the build
+        "break_even_ticks": build_seconds / saved_seconds if saved_seconds > 0 else float("inf"),
+    }
+    for name, value in measurements.items():
+        record_property(name, round(value, 3))
+
+    assert table.nbytes < 10 * 2**20
+    assert table_seconds < formatted_seconds
@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from decimal import Decimal
+from timeit import timeit
+
+import numpy as np
+from panda3d.core import NodePath
+
+from f1p.ui.components.driver.markers import CarMarkers
+
+
+def test_position_change_detection(record_property: Callable[[str, object], None]) -> None:
+    rng = np.random.default_rng(0)
+    frames = 300
+    positions = rng.uniform(-10, 10, size=(frames, 20, 3)).tolist()
+
+    decimal_node_paths = [NodePath(f"decimal{index}") for index in range(20)]
+    car_markers = CarMarkers(NodePath("render"), [(1.0, 1.0, 1.0, 1.0)] * 20)
+    position_arrays = [np.array(frame) for frame in positions]
+
+    def decimal_update() -> None:
+        precision = Decimal("0.001")
+
+        for frame in positions:
+            for node_path, (position_x, position_y, position_z) in zip(decimal_node_paths, frame, strict=True):
+                x = Decimal(position_x).quantize(precision)
+                y = Decimal(position_y).quantize(precision)
+                z = Decimal(position_z).quantize(precision)
+
+                current_pos = node_path.getPos()
+                current_x = Decimal(current_pos.x).quantize(precision)
+                current_y = Decimal(current_pos.y).quantize(precision)
+                current_z = Decimal(current_pos.z).quantize(precision)
+
+                if (current_x, current_y, current_z) != (x, y, z):
+                    node_path.setPos(x, y, z)
+
+    def float_update() -> None:
+        for frame in position_arrays:
+            car_markers.update(frame)
+
+    decimal_seconds = timeit(decimal_update, number=1) / frames
+    float_seconds = timeit(float_update, number=1) / frames
+
+    record_property("decimal_microseconds_per_frame", round(decimal_seconds * 1e6, 3))
+    record_property("float_microseconds_per_frame", round(float_seconds * 1e6, 3))
+
+    assert float_seconds < decimal_seconds
@@ -0,0 +1,40 @@
+from collections.abc import Callable
+from timeit import timeit
+
+import numpy as np
+from panda3d.core import LineSegs
+
+from f1p.ui.components.track_geometry import TrackGeometry
+
+
+def test_track_geometry_build_time(record_property: Callable[[str, object], None]) -> None:
+    angles = np.linspace(0, 2 * np.pi, 20_000, endpoint=False)
+    track = np.column_stack([np.cos(angles) * 40, np.sin(angles) * 25, np.sin(angles * 3)])
+    color = (0.9, 0.9, 0.9, 1)
+
+    def line_segs() -> None:
+        for border in TrackGeometry.borders(track, track_width=0.5):
+            line_segments = LineSegs("map")
+            line_segments.setThickness(1)
+            line_segments.setColor(*color)
+
+            points = border.tolist()
+            line_segments.moveTo(*points[0])
+            for point in points[1:]:
+                line_segments.drawTo(*point)
+                line_segments.moveTo(*point)
+
+            line_segments.drawTo(*points[0])
+            line_segments.create(False)
+
+    def bulk_copy() -> None:
+        for border in TrackGeometry.borders(track, track_width=0.5):
+            TrackGeometry.line_loop("map", border, color)
+
+    line_segs_seconds = timeit(line_segs, number=1)
+    bulk_copy_seconds = timeit(bulk_copy, number=1)
+
+    record_property("line_segs_milliseconds", round(line_segs_seconds * 1e3, 3))
+    record_property("bulk_copy_milliseconds", round(bulk_copy_seconds * 1e3, 3))
+
+    assert bulk_copy_seconds < line_segs_seconds
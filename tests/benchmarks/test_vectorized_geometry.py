@@ -0,0 +1,24 @@
+from collections.abc import Callable
+from timeit import timeit
+
+from procedural3d import BoxMaker, ConeMaker, CylinderMaker, SphereMaker, TorusMaker
+
+
+def test_vectorized_geometry(record_property: Callable[[str, object], None]) -> None:
+    makers = {
+        "sphere": SphereMaker(segments={"horizontal": 256, "vertical": 128}),
+        "cylinder": CylinderMaker(segments={"circular": 256, "axial": 128, "bottom_cap": 8, "top_cap": 8}),
+        "cone": ConeMaker(top_radius=0.5, segments={"circular": 256, "axial": 128, "bottom_cap": 8, "top_cap": 8}),
+        "torus": TorusMaker(segments={"ring": 128, "section": 64}),
+        "box": BoxMaker(segments={"width": 50, "depth": 50, "height": 20}),
+    }
+
+    for name, maker in makers.items():
+        python_seconds = timeit(maker._generate_python, number=3) / 3
+        numpy_seconds = timeit(maker._generate_numpy, number=3) / 3
+
+        record_property(f"{name}_python_milliseconds", round(python_seconds * 1e3, 3))
+        record_property(f"{name}_numpy_milliseconds", round(numpy_seconds * 1e3, 3))
+        record_property(f"{name}_speedup", round(python_seconds / numpy_seconds, 1))
+
+        assert numpy_seconds < python_seconds
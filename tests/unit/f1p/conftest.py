@@ -5406,6 +5406,7 @@ def data_extractor_service(
     session_parser.event_name = "Australian Grand Prix"
     session_parser.session_id = "Race"
     session_parser._session = mock_session
+    session_parser._weather_session = mock_session
 
     service.session_parser = session_parser
 
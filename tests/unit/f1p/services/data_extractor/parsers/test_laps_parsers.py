@@ -59,6 +59,12 @@ def test_processed_laps_data_property_raises_value_error_when_not_set(parser: La
         assert parser.processed_laps is None
 
 
+def test_processed_laps_setter(parser: LapsParser, processed_laps: DataFrame) -> None:
+    parser.processed_laps = processed_laps
+
+    assert_frame_equal(processed_laps, parser._processed_laps)
+
+
 def test_add_total_laps(
     parser: LapsParser,
     laps: DataFrame,
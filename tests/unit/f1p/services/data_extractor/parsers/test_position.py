@@ -1,7 +1,9 @@
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, Timedelta
 from pandas._testing import assert_frame_equal
 
 from f1p.services.data_extractor.parsers.position import PositionParser
@@ -16,6 +18,7 @@ def test_initialization(mock_session: MagicMock) -> None:
     parser = PositionParser(mock_session)
 
     assert mock_session == parser.session
+    assert parser.workers is None
     assert parser._pos_data is None
     assert parser._processed_pos_data is None
 
@@ -48,3 +51,36 @@ def test_processed_pos_data_property_raises_value_error_when_none(parser: Positi
 
     with pytest.raises(ValueError, match="Position data not processed yet."):
         assert parser.processed_pos_data is None
+
+
+def driver_pos_data(seed: int) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    session_time = pd.to_timedelta(np.arange(50) * 220 + 500, unit="ms")
+
+    return DataFrame(
+        {
+            "Date": pd.Timestamp("2026-03-08 04:00:00") + session_time,
+            "Status": "OnTrack",
+            "X": rng.random(50) * 10000,
+            "Y": rng.random(50) * 10000,
+            "Z": rng.random(50) * 100,
+            "Source": "pos",
+            "Time": session_time,
+            "SessionTime": session_time,
+        },
+    )
+
+
+def test_parse_in_processes_matches_serial_parse(mock_session: MagicMock) -> None:
+    pos_data = {driver_number: driver_pos_data(seed) for seed, driver_number in enumerate(["1", "16", "44"])}
+
+    serial_parser = PositionParser(mock_session)
+    serial_parser._pos_data = {driver_number: df.copy() for driver_number, df in pos_data.items()}
+    expected = serial_parser.parse(Timedelta(milliseconds=3000), 0.3, (1.0, 2.0, 0.5))
+
+    parallel_parser = PositionParser(mock_session, workers=2)
+    parallel_parser._pos_data = {driver_number: df.copy() for driver_number, df in pos_data.items()}
+    actual = parallel_parser.parse(Timedelta(milliseconds=3000), 0.3, (1.0, 2.0, 0.5))
+
+    assert_frame_equal(expected, actual)
+    assert_frame_equal(expected, parallel_parser.processed_pos_data)
@@ -403,6 +403,47 @@ def test_total_laps_property_caches(parser: SessionParser, mock_session: MagicMo
     assert parser._total_laps is not None
 
 
+def test_session_start_time_setter(parser: SessionParser) -> None:
+    session_start_time = Timedelta(milliseconds=1000)
+    parser.session_start_time = session_start_time
+
+    assert session_start_time == parser._session_start_time
+
+
+def test_session_end_time_setter(parser: SessionParser) -> None:
+    session_end_time = Timedelta(milliseconds=5000)
+    parser.session_end_time = session_end_time
+
+    assert session_end_time == parser._session_end_time
+
+
+def test_total_laps_setter(parser: SessionParser) -> None:
+    parser.total_laps = 57
+
+    assert 57 == parser._total_laps
+
+
+def test_weather_session_property_is_separate_from_session(
+    parser: SessionParser,
+    mock_session: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    parser._year = 2026
+    parser._event_name = "Australian Grand Prix"
+    parser._session_id = "Race"
+    parser._session = mock_session
+
+    mock_weather_session = mocker.MagicMock()
+    mock_get_session = mocker.MagicMock(return_value=mock_weather_session)
+    mocker.patch("f1p.services.data_extractor.parsers.session.fastf1.get_session", mock_get_session)
+
+    assert mock_weather_session == parser.weather_session
+    assert mock_weather_session == parser.weather_session
+    assert mock_session == parser.session
+
+    mock_get_session.assert_called_once_with(2026, "Australian Grand Prix", "Race")
+
+
 def test_reset_from_year(parser: SessionParser, event_schedule: DataFrame, mock_session: MagicMock) -> None:
     parser._event_schedule = event_schedule
     parser._event_name = "Australian Grand Prix"
@@ -433,10 +474,12 @@ def test_reset_from_event_name(parser: SessionParser, event_schedule: DataFrame,
 
 def test_reset_from_session_id(parser: SessionParser, mock_session: MagicMock) -> None:
     parser._session = mock_session
+    parser._weather_session = mock_session
 
     parser.reset_from_session_id()
 
     assert parser._session is None
+    assert parser._weather_session is None
 
 
 def test_process_team_colors(
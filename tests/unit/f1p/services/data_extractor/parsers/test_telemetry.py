@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame, Timedelta
+from pandas._testing import assert_frame_equal
+
+from f1p.services.data_extractor.parsers.telemetry import TelemetryParser
+
+
+def driver_car_data(seed: int) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    session_time = pd.to_timedelta(np.arange(40) * 270 + 700, unit="ms")
+
+    return DataFrame(
+        {
+            "Date": pd.Timestamp("2026-03-08 04:00:00") + session_time,
+            "RPM": rng.integers(9000, 12000, size=40).astype("float64"),
+            "Speed": rng.integers(80, 330, size=40).astype("float64"),
+            "nGear": rng.integers(0, 9, size=40),
+            "Throttle": rng.integers(0, 100, size=40).astype("float64"),
+            "Brake": rng.random(40) > 0.8,
+            "DRS": rng.integers(0, 14, size=40),
+            "Source": "car",
+            "Time": session_time,
+            "SessionTime": session_time,
+        },
+    )
+
+
+@pytest.fixture()
+def session_time_ticks() -> DataFrame:
+    return DataFrame(
+        {
+            "SessionTimeTick": np.arange(1, 51),
+            "SessionTime": pd.to_timedelta(np.arange(50) * 220 + 500, unit="ms"),
+        },
+    )
+
+
+def test_initialization(mock_session: MagicMock) -> None:
+    parser = TelemetryParser(mock_session, workers=4)
+
+    assert mock_session == parser.session
+    assert 4 == parser.workers
+    assert parser._car_data is None
+    assert parser._processed_car_data is None
+
+
+def test_processed_car_data_property_raises_value_error_when_none(mock_session: MagicMock) -> None:
+    with pytest.raises(ValueError, match="Car data not processed yet."):
+        assert TelemetryParser(mock_session).processed_car_data is None
+
+
+def test_parse_in_processes_matches_serial_parse(mock_session: MagicMock, session_time_ticks: DataFrame) -> None:
+    car_data = {driver_number: driver_car_data(seed) for seed, driver_number in enumerate(["1", "16", "44"])}
+
+    serial_parser = TelemetryParser(mock_session)
+    serial_parser._car_data = {driver_number: df.copy() for driver_number, df in car_data.items()}
+    expected = serial_parser.parse(Timedelta(milliseconds=2000), Timedelta(milliseconds=9000), session_time_ticks)
+
+    parallel_parser = TelemetryParser(mock_session, workers=2)
+    parallel_parser._car_data = {driver_number: df.copy() for driver_number, df in car_data.items()}
+    actual = parallel_parser.parse(Timedelta(milliseconds=2000), Timedelta(milliseconds=9000), session_time_ticks)
+
+    assert_frame_equal(expected, actual)
+    assert_frame_equal(expected, parallel_parser.processed_car_data)
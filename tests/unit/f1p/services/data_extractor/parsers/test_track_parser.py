@@ -86,6 +86,12 @@ def test_track_status_property_caches(parser: TrackParser, track_status: DataFra
     assert track_status.equals(parser.track_status), "Second time caches"
 
 
+def test_track_status_setter(parser: TrackParser, track_status: DataFrame) -> None:
+    parser.track_status = track_status
+
+    assert track_status.equals(parser._track_status)
+
+
 def test_track_status_colors_property_fetches(parser: TrackParser, track_status_colors: DataFrame) -> None:
     assert parser._track_status_colors is None
 
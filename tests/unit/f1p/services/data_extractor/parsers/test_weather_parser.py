@@ -22,21 +22,17 @@ def test_initialization(mock_session: MagicMock) -> None:
     assert parser._processed_weather_data is None
 
 
-def test_weather_data_property_fetches(parser: WeatherParser, weather_data: DataFrame) -> None:
-    assert parser._weather_data is None
+def test_weather_data_property_is_none_until_loaded(parser: WeatherParser) -> None:
+    assert parser.weather_data is None
 
-    assert_frame_equal(weather_data, parser.weather_data)
-    assert parser._weather_data is not None
-    assert_frame_equal(weather_data, parser._weather_data)
+    parser.session.load.assert_not_called()
 
 
-def test_weather_data_property_caches(parser: WeatherParser, weather_data: DataFrame) -> None:
-    assert parser._weather_data is None
+def test_load_weather_data(parser: WeatherParser, weather_data: DataFrame) -> None:
+    assert parser == parser.load_weather_data()
 
-    assert_frame_equal(weather_data, parser.weather_data), "First time computes"
-    assert_frame_equal(weather_data, parser.weather_data), "Second time caches"
-
-    assert parser._weather_data is not None
+    assert_frame_equal(weather_data, parser.weather_data)
+    parser.session.load.assert_called_once_with(laps=False, telemetry=False, weather=True, messages=False)
 
 
 def test_processed_weather_data_property_fetches(parser: WeatherParser, processed_weather_data: DataFrame) -> None:
@@ -52,6 +48,21 @@ def test_processed_weather_data_property_raises_value_error_when_not_set(parser:
         assert parser.processed_weather_data is None
 
 
+def test_processed_weather_data_setter(parser: WeatherParser, processed_weather_data: DataFrame) -> None:
+    parser.processed_weather_data = processed_weather_data
+
+    assert_frame_equal(processed_weather_data, parser._processed_weather_data)
+
+
+def test_trim_to_session_time_raises_value_error_when_not_loaded(
+    parser: WeatherParser,
+    session_start_time: Timedelta,
+    session_end_time: Timedelta,
+) -> None:
+    with pytest.raises(ValueError, match="Weather data is not loaded yet."):
+        parser._trim_to_session_time(session_start_time, session_end_time)
+
+
 def test_trim_to_session_time(
     parser: WeatherParser,
     weather_data: DataFrame,
@@ -258,6 +269,7 @@ def test_process_weather_data_unit(
     mock_awt = mocker.patch.object(parser, "_add_weather_text", return_value=parser)
     mock_awds = mocker.patch.object(parser, "_add_wind_direction_symbol", return_value=parser)
     mock_awdt = mocker.patch.object(parser, "_add_wind_direction_text", return_value=parser)
+    mock_iwd = mocker.patch.object(parser, "_index_weather_data", return_value=parser)
 
     parser.parse(session_time_ticks_df, session_start_time, session_end_time)
 
@@ -271,6 +283,7 @@ def test_process_weather_data_unit(
     mock_awt.assert_called_once()
     mock_awds.assert_called_once()
     mock_awdt.assert_called_once()
+    mock_iwd.assert_called_once()
 
 
 def test_get_current_weather_data(
@@ -296,3 +309,49 @@ def test_get_current_weather_data_returns_none(
     result = parser.get_current_weather_data(1)
 
     assert result is None
+
+
+def test_index_weather_data(parser: WeatherParser, processed_weather_data: DataFrame) -> None:
+    parser._processed_weather_data = processed_weather_data.sample(frac=1, random_state=0)
+
+    instance = parser._index_weather_data()
+
+    assert isinstance(instance, WeatherParser)
+    assert sorted(processed_weather_data["SessionTimeTick"].tolist()) == parser._weather_ticks.tolist()
+    assert len(processed_weather_data) == len(parser._weather_rows)
+
+
+def test_processed_weather_data_setter_resets_index(parser: WeatherParser, processed_weather_data: DataFrame) -> None:
+    parser._processed_weather_data = processed_weather_data
+    parser._index_weather_data()
+
+    parser.processed_weather_data = processed_weather_data
+
+    assert parser._weather_ticks is None
+
+
+@pytest.mark.parametrize("session_time_tick", [0, 1, 2, 3, 5, 100])
+def test_get_current_weather_data_matches_filter_and_sort(
+    parser: WeatherParser,
+    processed_weather_data: DataFrame,
+    session_time_tick: int,
+) -> None:
+    parser._processed_weather_data = processed_weather_data
+
+    df = processed_weather_data[processed_weather_data["SessionTimeTick"] <= session_time_tick]
+    df = df.sort_values(by="SessionTimeTick", ascending=False)
+
+    result = parser.get_current_weather_data(session_time_tick)
+
+    if df.empty:
+        assert result is None
+    else:
+        assert_series_equal(df.iloc[0], result)
+
+
+def test_get_current_weather_row_id(parser: WeatherParser, processed_weather_data: DataFrame) -> None:
+    parser._processed_weather_data = processed_weather_data
+
+    assert parser.get_current_weather_row_id(1) is None
+    assert 0 == parser.get_current_weather_row_id(2)
+    assert parser.get_current_weather_row_id(2) == parser.get_current_weather_row_id(2)
@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import pytest
+from pandas import DataFrame, Timedelta
+from pandas._testing import assert_frame_equal
+from pytest_mock import MockerFixture
+
+from f1p.services.data_extractor.cache import ProcessedSessionCache
+
+
+@pytest.fixture()
+def cache(tmp_path: Path) -> ProcessedSessionCache:
+    return ProcessedSessionCache(tmp_path, 2026, "Australian Grand Prix", "Race")
+
+
+@pytest.fixture()
+def frame() -> DataFrame:
+    return DataFrame(
+        {
+            "DriverNumber": ["1", "44"],
+            "SessionTime": [Timedelta(milliseconds=1000), Timedelta(milliseconds=2000)],
+            "X": [0.5, 1.5],
+            "CompoundColor": [[1, 0, 0, 0.8], [1, 1, 0, 0.8]],
+        },
+    )
+
+
+def test_initialization(tmp_path: Path) -> None:
+    cache = ProcessedSessionCache(tmp_path, 2026, "Australian Grand Prix", "Race")
+
+    assert tmp_path == cache.cache_path
+    assert 2026 == cache.year
+    assert "Australian Grand Prix" == cache.event_name
+    assert "Race" == cache.session_id
+    assert cache._pipeline_version is None
+
+
+def test_pipeline_version_caches(cache: ProcessedSessionCache) -> None:
+    pipeline_version = cache.pipeline_version
+
+    assert 16 == len(pipeline_version)
+    assert pipeline_version == cache._pipeline_version
+    assert pipeline_version == cache.pipeline_version
+
+
+def test_pipeline_version_changes_with_pandas_version(tmp_path: Path, mocker: MockerFixture) -> None:
+    pipeline_version = ProcessedSessionCache(tmp_path, 2026, "Australian Grand Prix", "Race").pipeline_version
+
+    mocker.patch("f1p.services.data_extractor.cache.pd.__version__", "0.0.0")
+
+    assert pipeline_version != ProcessedSessionCache(tmp_path, 2026, "Australian Grand Prix", "Race").pipeline_version
+
+
+def test_pipeline_version_changes_with_stages_source(tmp_path: Path, mocker: MockerFixture) -> None:
+    source_path = tmp_path / "f1p"
+    stages_path = source_path / "services" / "data_extractor" / "stages.py"
+    stages_path.parent.mkdir(parents=True)
+    stages_path.write_text("class PosDataStages: ...\n")
+    mocker.patch.object(ProcessedSessionCache, "source_path", source_path)
+
+    pipeline_version = ProcessedSessionCache(tmp_path, 2026, "Australian Grand Prix", "Race").pipeline_version
+    stages_path.write_text("class PosDataStages:\n    pass\n")
+
+    assert pipeline_version != ProcessedSessionCache(tmp_path, 2026, "Australian Grand Prix", "Race").pipeline_version
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Race", "race"),
+        ("Australian Grand Prix", "australian_grand_prix"),
+        ("São Paulo Grand Prix", "s_o_paulo_grand_prix"),
+    ],
+)
+def test_slugify(value: str, expected: str) -> None:
+    assert expected == ProcessedSessionCache.slugify(value)
+
+
+def test_entry_path(cache: ProcessedSessionCache, tmp_path: Path) -> None:
+    expected = tmp_path / "2026" / "australian_grand_prix" / "race" / cache.pipeline_version
+
+    assert expected == cache.entry_path
+
+
+def test_exists_is_false_before_save(cache: ProcessedSessionCache) -> None:
+    assert cache.exists() is False
+
+
+def test_save(cache: ProcessedSessionCache, frame: DataFrame) -> None:
+    cache.save({"processed_pos_data": frame}, {"total_laps": 58})
+
+    assert cache.exists() is True
+    assert (cache.entry_path / "processed_pos_data.pkl").exists() is True
+    assert cache.entry_path.with_name(f"{cache.pipeline_version}.tmp").exists() is False
+
+
+def test_save_replaces_existing_entry(cache: ProcessedSessionCache, frame: DataFrame) -> None:
+    cache.save({"processed_pos_data": frame, "processed_laps": frame}, {"total_laps": 58})
+    cache.save({"processed_pos_data": frame}, {"total_laps": 57})
+
+    assert (cache.entry_path / "processed_laps.pkl").exists() is False
+    assert {"total_laps": 57} == cache.load_metadata()
+
+
+def test_load_frame(cache: ProcessedSessionCache, frame: DataFrame) -> None:
+    cache.save({"processed_pos_data": frame}, {})
+
+    assert_frame_equal(frame, cache.load_frame("processed_pos_data"))
+
+
+def test_save_frame_adds_to_existing_entry(cache: ProcessedSessionCache, frame: DataFrame) -> None:
+    cache.save({"processed_pos_data": frame}, {"total_laps": 58})
+
+    assert cache.has_frame("processed_car_data") is False
+
+    cache.save_frame("processed_car_data", frame)
+
+    assert cache.has_frame("processed_car_data") is True
+    assert cache.frame_path("processed_car_data").with_suffix(".tmp").exists() is False
+    assert_frame_equal(frame, cache.load_frame("processed_car_data"))
+    assert {"total_laps": 58} == cache.load_metadata()
+
+
+def test_load_metadata(cache: ProcessedSessionCache) -> None:
+    metadata = {
+        "total_laps": 58,
+        "session_start_time": Timedelta(milliseconds=1000).value,
+        "map_center_coordinate": [0.5, 1.5, 0.0],
+    }
+    cache.save({}, metadata)
+
+    assert metadata == cache.load_metadata()
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from f1p.services.data_extractor.leaderboard import LeaderboardTable
+from f1p.services.data_extractor.store import TickDriverStore
+
+SOFT = (1.0, 0.0, 0.0, 1.0)
+HARD = (1.0, 1.0, 1.0, 1.0)
+
+
+@pytest.fixture()
+def pos_df() -> DataFrame:
+    return DataFrame(
+        {
+            "DriverNumber": pd.Categorical(["1", "4", "16", "44", "1", "4", "16"]),
+            "SessionTimeTick": np.array([1, 1, 1, 1, 2, 2, 2], dtype="int32"),
+            "PositionIndex": np.array([0, 2, 1, 3, 1, 0, 2], dtype="int8"),
+            "DiffToCarInFront": np.array([0.0, 0.5, 1.5, 0.0, 0.25, 0.0, 1.5], dtype="float32"),
+            "DiffToLeader": np.array([0.0, 2.0, 1.5, 0.0, 0.25, 0.0, 1.75], dtype="float32"),
+            "TyreLife": [12.0, 3.0, 12.0, np.nan, 13.0, 4.0, 13.0],
+            "IsDNF": [False, False, False, True, False, False, False],
+            "InPit": pd.array([False, True, False, False, False, False, None], dtype="boolean"),
+            "Compound": ["S", "H", "S", "S", "S", "H", None],
+            "CompoundColor": [list(SOFT), list(HARD), list(SOFT), list(SOFT), list(SOFT), list(HARD), None],
+        },
+    )
+
+
+@pytest.fixture()
+def table(pos_df: DataFrame) -> LeaderboardTable:
+    return LeaderboardTable.from_store(TickDriverStore.from_frame(pos_df))
+
+
+@pytest.mark.parametrize(
+    ("mode", "expected"),
+    [
+        ("interval", [("Interval", 0), ("+1.500", 0), ("IN PIT", 2), ("OUT", 1)]),
+        ("leader", [("Leader", 0), ("+1.500", 0), ("IN PIT", 2), ("OUT", 1)]),
+        ("tires", [("12", 0), ("12", 0), ("3", 0), ("OUT", 1)]),
+    ],
+)
+def test_rows_times(table: LeaderboardTable, mode: str, expected: list[tuple[str, int]]) -> None:
+    actual = [(time, time_color) for _, _, time, time_color, _, _ in table.rows(mode, 1)]
+
+    assert expected == actual
+
+
+def test_rows(table: LeaderboardTable) -> None:
+    expected = [
+        (0, False, "Interval", 0, "S", SOFT),
+        (2, False, "+1.500", 0, "S", SOFT),
+        (1, False, "IN PIT", 2, "H", HARD),
+        (3, True, "OUT", 1, "", None),
+    ]
+
+    assert ["1", "4", "16", "44"] == table.driver_numbers
+    assert expected == table.rows("interval", 1)
+
+
+def test_rows_follow_position_changes(table: LeaderboardTable) -> None:
+    expected = [
+        (1, False, "Leader", 0, "H", HARD),
+        (0, False, "+0.250", 0, "S", SOFT),
+        (2, False, "+1.750", 0, "", None),
+    ]
+
+    actual = table.rows("leader", 2)
+
+    assert expected == actual[:3]
+    assert -1 == actual[3][0]
+
+
+def test_strings_are_shared_between_modes(table: LeaderboardTable) -> None:
+    strings = table.strings.tolist()
+
+    assert len(set(strings)) == len(strings)
+    assert table.rows("interval", 1)[1][2] is table.rows("leader", 1)[1][2]
+    assert np.dtype("int8") == table.times["interval"].dtype
+    assert (2, 4) == table.times["tires"].shape
+
+
+def test_nbytes(table: LeaderboardTable) -> None:
+    arrays = [*table.arrays.values(), *table.times.values(), *table.time_colors.values()]
+
+    assert sum(array.nbytes for array in arrays) < table.nbytes
+
+
+@pytest.mark.parametrize(
+    ("count", "expected"),
+    [(10, "int8"), (127, "int16"), (40_000, "int32")],
+)
+def test_code_dtype(count: int, expected: str) -> None:
+    assert expected == LeaderboardTable.code_dtype(count)
+
+
+def test_format_codes_formats_each_value_once() -> None:
+    codes = {"OUT": 0}
+    values = np.array([[0.5, 1.25], [0.5, np.nan]], dtype="float32")
+
+    actual = LeaderboardTable.format_codes(values, LeaderboardTable.format_gap, codes)
+
+    np.testing.assert_array_equal(np.array([[1, 2], [1, 3]]), actual)
+    assert {"OUT": 0, "+0.500": 1, "+1.250": 2, "+nan": 3} == codes
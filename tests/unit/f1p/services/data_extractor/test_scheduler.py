@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+
+from f1p.services.data_extractor.scheduler import StageScheduler
+
+
+def test_initialization() -> None:
+    scheduler = StageScheduler(4)
+
+    assert 4 == scheduler.max_workers
+    assert {} == scheduler.stages
+    assert {} == scheduler.dependencies
+
+
+def test_add() -> None:
+    def stage() -> None:
+        pass
+
+    scheduler = StageScheduler(2)
+
+    assert scheduler == scheduler.add("first", stage)
+    assert scheduler == scheduler.add("second", stage, ["first"])
+
+    assert {"first": stage, "second": stage} == scheduler.stages
+    assert {"first": [], "second": ["first"]} == scheduler.dependencies
+
+
+def test_add_duplicate_stage() -> None:
+    scheduler = StageScheduler(2).add("first", lambda: None)
+
+    with pytest.raises(ValueError, match="Stage first already added."):
+        scheduler.add("first", lambda: None)
+
+
+def test_add_unknown_dependency() -> None:
+    with pytest.raises(ValueError, match="Stage second depends on unknown stage first."):
+        StageScheduler(2).add("second", lambda: None, ["first"])
+
+
+def test_ready_stages() -> None:
+    scheduler = (
+        StageScheduler(2)
+        .add("first", lambda: None)
+        .add("second", lambda: None)
+        .add("third", lambda: None, ["first", "second"])
+    )
+
+    assert ["first", "second"] == scheduler.ready_stages(set(), set())
+    assert ["second"] == scheduler.ready_stages(set(), {"first"})
+    assert [] == scheduler.ready_stages({"first"}, {"first", "second"})
+    assert ["third"] == scheduler.ready_stages({"first", "second"}, {"first", "second"})
+
+
+def test_run_respects_dependencies() -> None:
+    order = []
+    scheduler = (
+        StageScheduler(4)
+        .add("parse", lambda: order.append("parse"))
+        .add("merge", lambda: order.append("merge"), ["parse"])
+        .add("compute", lambda: order.append("compute"), ["merge"])
+    )
+
+    scheduler.run()
+
+    assert ["parse", "merge", "compute"] == order
+
+
+def test_run_executes_independent_stages_concurrently() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    order = []
+    scheduler = (
+        StageScheduler(2)
+        .add("weather", lambda: order.append(barrier.wait()))
+        .add("telemetry", lambda: order.append(barrier.wait()))
+        .add("merge", lambda: order.append("merge"), ["weather", "telemetry"])
+    )
+
+    scheduler.run()
+
+    assert [0, 1] == sorted(order[:2])
+    assert "merge" == order[2]
+
+
+def test_run_raises_stage_exception() -> None:
+    order = []
+
+    def failing_stage() -> None:
+        raise RuntimeError("Stage failed.")
+
+    scheduler = (
+        StageScheduler(2).add("failing", failing_stage).add("dependent", lambda: order.append("dependent"), ["failing"])
+    )
+
+    with pytest.raises(RuntimeError, match="Stage failed."):
+        scheduler.run()
+
+    assert [] == order
@@ -1,9 +1,21 @@
+import json
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame, Series, Timedelta
+from pandas._testing import assert_frame_equal
 from pytest_mock import MockerFixture
 
+from f1p.services.data_extractor.cache import ProcessedSessionCache
+from f1p.services.data_extractor.leaderboard import LeaderboardTable
 from f1p.services.data_extractor.service import DataExtractorService
+from f1p.services.data_extractor.snapshot import TickSnapshot
+from f1p.services.data_extractor.store import TickDriverStore
+from f1p.services.data_extractor.tick_data import TickData
+from f1p.utils.performance import StageTiming
 
 
 def test_init(
@@ -31,14 +43,38 @@ def test_init(
     assert service.window_width == 1920
     assert service.window_height == 1080
     assert service.text_font == mock_text_font
+    assert service.parse_workers is None
 
     assert service._session_results is None
-    assert service._car_data is None
+    assert service._car_telemetry is None
+    assert service.weather_ready is False
 
     mock_accept.assert_called_once_with("loadData", service.load_data)
     mock_enable_cache.assert_called_once()
 
 
+@pytest.mark.parametrize("progressive_window_laps", [0, -2])
+def test_init_rejects_progressive_window_laps_below_one(
+    mock_parent: MagicMock,
+    mock_task_manager: MagicMock,
+    mock_text_font: MagicMock,
+    progressive_window_laps: int,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(DataExtractorService, "accept")
+    mocker.patch("f1p.services.data_extractor.service.fastf1.Cache.enable_cache")
+
+    with pytest.raises(ValueError, match="Progressive window laps must be at least 1."):
+        DataExtractorService(
+            parent=mock_parent,
+            task_manager=mock_task_manager,
+            window_width=1920,
+            window_height=1080,
+            text_font=mock_text_font,
+            progressive_window_laps=progressive_window_laps,
+        )
+
+
 def test_init_and_create_cache_dir(
     mock_parent: MagicMock,
     mock_task_manager: MagicMock,
@@ -70,10 +106,1074 @@ def test_init_and_create_cache_dir(
     assert service.text_font == mock_text_font
 
     assert service._session_results is None
-    assert service._car_data is None
+    assert service._car_telemetry is None
+    assert service.weather_ready is False
 
     mock_accept.assert_called_once_with("loadData", service.load_data)
     mock_enable_cache.assert_called_once()
 
     mock_path.exists.assert_called_once()
     mock_path.mkdir.assert_called_once_with(parents=True)
+
+
+def test_processed_session_cache_property(data_extractor_service: DataExtractorService) -> None:
+    assert data_extractor_service._processed_session_cache is None
+
+    cache = data_extractor_service.processed_session_cache
+
+    assert isinstance(cache, ProcessedSessionCache)
+    assert DataExtractorService.processed_cache_path == cache.cache_path
+    assert 2026 == cache.year
+    assert "Australian Grand Prix" == cache.event_name
+    assert "Race" == cache.session_id
+    assert cache is data_extractor_service.processed_session_cache
+
+
+def test_store_processed_session(
+    data_extractor_service: DataExtractorService,
+    processed_laps: DataFrame,
+    track_status: DataFrame,
+    processed_corners: DataFrame,
+    session_results: DataFrame,
+    session_start_time: Timedelta,
+    session_end_time: Timedelta,
+    mocker: MockerFixture,
+) -> None:
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    data_extractor_service._processed_session_cache = mock_cache
+
+    pos_data = DataFrame({"X": [1.0]})
+    fastest_lap_telemetry = DataFrame({"X": [2.0]})
+    data_extractor_service.processed_pos_data = pos_data
+    data_extractor_service.laps_parser.processed_laps = processed_laps
+    data_extractor_service._processed_corners = processed_corners
+    data_extractor_service._session_results = session_results
+    data_extractor_service.fastest_lap_telemetry = fastest_lap_telemetry
+    data_extractor_service.map_center_coordinate = (np.float64(0.5), np.float64(1.5), np.float64(0.0))
+
+    assert data_extractor_service == data_extractor_service.store_processed_session()
+
+    mock_cache.save.assert_called_once_with(
+        {
+            "processed_pos_data": pos_data,
+            "processed_laps": processed_laps,
+            "track_status": track_status,
+            "processed_corners": processed_corners,
+            "session_results": session_results,
+            "fastest_lap_telemetry": fastest_lap_telemetry,
+        },
+        {
+            "total_laps": 53,
+            "session_start_time": session_start_time.value,
+            "session_end_time": session_end_time.value,
+            "map_center_coordinate": [0.5, 1.5, 0.0],
+        },
+    )
+
+
+def test_load_processed_session(
+    data_extractor_service: DataExtractorService,
+    processed_laps: DataFrame,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    frames = {
+        "processed_pos_data": DataFrame({"X": [1.0]}),
+        "processed_laps": processed_laps,
+        "track_status": DataFrame({"Status": ["1"]}),
+        "processed_corners": DataFrame({"Label": ["1"]}),
+        "session_results": DataFrame({"DriverNumber": ["1"]}),
+        "fastest_lap_telemetry": DataFrame({"X": [2.0]}),
+    }
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.load_metadata.return_value = {
+        "total_laps": 58,
+        "session_start_time": Timedelta(milliseconds=2000).value,
+        "session_end_time": Timedelta(milliseconds=9000).value,
+        "map_center_coordinate": [0.5, 1.5, 0.0],
+    }
+    mock_cache.load_frame.side_effect = lambda name: frames[name]
+    mock_cache.store_path.return_value = tmp_path / "tick_store"
+    data_extractor_service._processed_session_cache = mock_cache
+    mock_update_loading = mocker.patch.object(data_extractor_service, "update_loading")
+
+    assert data_extractor_service == data_extractor_service.load_processed_session()
+    assert data_extractor_service._built_tick_data is None
+
+    assert 58 == data_extractor_service.total_laps
+    assert Timedelta(milliseconds=2000) == data_extractor_service.session_start_time
+    assert Timedelta(milliseconds=9000) == data_extractor_service.session_end_time
+    assert (0.5, 1.5, 0.0) == data_extractor_service.map_center_coordinate
+
+    assert frames["processed_pos_data"] is data_extractor_service.processed_pos_data
+    assert frames["processed_laps"] is data_extractor_service.laps_parser.processed_laps
+    assert data_extractor_service.weather_ready is False
+    assert frames["track_status"] is data_extractor_service.track_parser.track_status
+    assert frames["processed_corners"] is data_extractor_service.processed_corners
+    assert frames["session_results"] is data_extractor_service.session_results
+    assert frames["fastest_lap_telemetry"] is data_extractor_service.fastest_lap_telemetry
+
+    assert 100 == sum(call.args[0] for call in mock_update_loading.call_args_list)
+
+
+def test_extract_loads_processed_session_from_cache(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.exists.return_value = True
+    data_extractor_service._processed_session_cache = mock_cache
+
+    mock_load_processed_session = mocker.patch.object(data_extractor_service, "load_processed_session")
+    mock_process_session = mocker.patch.object(data_extractor_service, "process_session")
+    mock_delete_loading = mocker.patch.object(data_extractor_service, "delete_loading")
+    mock_messenger = mocker.patch("f1p.services.data_extractor.service.messenger")
+    mock_task = mocker.MagicMock()
+
+    assert mock_task.done == data_extractor_service.extract(mock_task)
+
+    mock_load_processed_session.assert_called_once()
+    mock_process_session.assert_not_called()
+    mock_delete_loading.assert_called_once()
+    mock_messenger.send.assert_called_once_with("sessionSelected")
+
+
+def test_extract_processes_and_stores_session_when_not_cached(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.exists.return_value = False
+    data_extractor_service._processed_session_cache = mock_cache
+
+    mock_load_processed_session = mocker.patch.object(data_extractor_service, "load_processed_session")
+    mock_process_session = mocker.patch.object(data_extractor_service, "process_session")
+    mocker.patch.object(data_extractor_service, "delete_loading")
+    mocker.patch("f1p.services.data_extractor.service.messenger")
+
+    data_extractor_service.extract(mocker.MagicMock())
+
+    mock_load_processed_session.assert_not_called()
+    mock_process_session.assert_called_once()
+    processed_session = mock_process_session.return_value.compact_processed_pos_data.return_value
+    processed_session.build_tick_store.return_value.store_processed_session.assert_called_once()
+
+
+def legacy_merge_pos_and_laps(pos_df: DataFrame, laps_df: DataFrame) -> DataFrame:
+    ts_df = pos_df[["SessionTimeTick", "SessionTimeMilliseconds"]].drop_duplicates(keep="first").copy()
+    laps_df = laps_df.copy()
+
+    for record in laps_df.itertuples():
+        laps_df.loc[
+            (laps_df["LapNumber"] == record.LapNumber) & (laps_df["DriverNumber"] == record.DriverNumber),
+            "SessionTimeTick",
+        ] = ts_df.loc[
+            ts_df["SessionTimeMilliseconds"] <= record.LapStartTimeMilliseconds,
+            "SessionTimeTick",
+        ].max()
+
+    laps_df.loc[laps_df["LapNumber"] == 1.0, "SessionTimeTick"] = 1
+    laps_df = laps_df.dropna(subset=["SessionTimeTick"])
+    laps_df["SessionTimeTick"] = laps_df["SessionTimeTick"].astype("int64")
+
+    combined_df = pos_df.merge(
+        laps_df[["DriverNumber", "LapNumber", "SessionTimeTick"]],
+        on=["DriverNumber", "SessionTimeTick"],
+        how="left",
+    )
+    combined_df["LapNumber"] = combined_df.groupby("DriverNumber")["LapNumber"].ffill()
+    combined_df = combined_df.merge(laps_df, on=["DriverNumber", "LapNumber"], how="left")
+    combined_df = combined_df.rename(
+        columns={"Time_x": "Time", "Time_y": "TimeLap", "SessionTimeTick_x": "SessionTimeTick"},
+    )
+
+    return combined_df.drop(columns=["SessionTimeTick_y"])
+
+
+def random_pos_and_laps(seed: int) -> tuple[DataFrame, DataFrame]:
+    rng = np.random.default_rng(seed)
+    driver_numbers = ["1", "16", "44", "81"]
+    ticks = np.arange(1, 401)
+    milliseconds = np.cumsum(rng.integers(200, 300, size=ticks.size))
+
+    pos_df = DataFrame(
+        {
+            "DriverNumber": np.repeat(driver_numbers, ticks.size),
+            "SessionTimeTick": np.tile(ticks, len(driver_numbers)),
+            "SessionTimeMilliseconds": np.tile(milliseconds, len(driver_numbers)),
+            "Time": pd.to_timedelta(np.tile(milliseconds, len(driver_numbers)), unit="ms"),
+            "X": rng.random(ticks.size * len(driver_numbers)),
+        },
+    )
+
+    laps = []
+    for driver_number in driver_numbers:
+        lap_starts = np.sort(rng.integers(-500, milliseconds[-1] + 500, size=8))
+        for lap_number, lap_start in enumerate(lap_starts, start=1):
+            laps.append(
+                {
+                    "DriverNumber": driver_number,
+                    "LapNumber": float(lap_number),
+                    "LapStartTimeMilliseconds": int(lap_start),
+                    "Time": pd.Timedelta(milliseconds=int(lap_start) + 90000),
+                },
+            )
+
+    return pos_df, DataFrame(laps)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_compute_ticks_at_matches_legacy_loop(seed: int) -> None:
+    pos_df, laps_df = random_pos_and_laps(seed)
+    ts_df = pos_df[["SessionTimeTick", "SessionTimeMilliseconds"]].drop_duplicates(keep="first")
+
+    expected = [
+        ts_df.loc[ts_df["SessionTimeMilliseconds"] <= lap_start, "SessionTimeTick"].max()
+        for lap_start in laps_df["LapStartTimeMilliseconds"]
+    ]
+
+    np.testing.assert_array_equal(
+        expected,
+        DataExtractorService.compute_ticks_at(ts_df, laps_df["LapStartTimeMilliseconds"].to_numpy()),
+    )
+
+
+def test_compute_ticks_at_before_first_tick_is_nan() -> None:
+    ts_df = DataFrame({"SessionTimeTick": [1, 2, 3], "SessionTimeMilliseconds": [1000, 2000, 3000]})
+
+    np.testing.assert_array_equal(
+        [np.nan, 1.0, 2.0, 3.0],
+        DataExtractorService.compute_ticks_at(ts_df, np.array([999, 1000, 2500, 5000])),
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_merge_pos_and_laps_matches_legacy_loop(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+    seed: int,
+) -> None:
+    pos_df, laps_df = random_pos_and_laps(seed)
+    expected = legacy_merge_pos_and_laps(pos_df, laps_df)
+
+    mocker.patch.object(data_extractor_service, "update_loading")
+    data_extractor_service.processed_pos_data = pos_df
+    data_extractor_service.laps_parser.processed_laps = laps_df
+
+    assert data_extractor_service == data_extractor_service.merge_pos_and_laps()
+
+    assert_frame_equal(expected, data_extractor_service.processed_pos_data)
+
+
+def test_process_session_runs_stages_in_dependency_order(
+    data_extractor_service: DataExtractorService,
+    mock_session: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    stages = [
+        "parse_laps",
+        "process_team_colors",
+        "process_fastest_lap",
+        "process_corners",
+        "parse_pos_data",
+        "merge_pos_and_laps",
+        "compute_lap_completion",
+        "compute_is_dnf",
+        "compute_is_finished",
+        "compute_position_index",
+        "compute_fastest_lap",
+        "compute_formatted_times",
+        "compute_diff_to_car_in_front",
+        "compute_diff_to_leader",
+        "compute_in_pit",
+    ]
+    order = []
+    for stage in stages:
+        mocker.patch.object(data_extractor_service, stage, side_effect=lambda stage=stage: order.append(stage))
+    mocker.patch.object(data_extractor_service, "update_loading")
+
+    assert data_extractor_service == data_extractor_service.process_session()
+
+    mock_session.load.assert_called_once_with(laps=True, telemetry=True, weather=False, messages=False)
+    assert data_extractor_service.session_loaded is True
+    assert sorted(stages) == sorted(order)
+    assert order.index("parse_laps") < order.index("process_fastest_lap") < order.index("parse_pos_data")
+    assert order.index("process_fastest_lap") < order.index("process_corners")
+    assert order.index("parse_pos_data") < order.index("merge_pos_and_laps") < order.index("compute_lap_completion")
+
+
+def test_parsers_receive_parse_workers(data_extractor_service: DataExtractorService) -> None:
+    data_extractor_service.parse_workers = 4
+
+    assert 4 == data_extractor_service.pos_parser.workers
+    assert 4 == data_extractor_service.telemetry_parser.workers
+
+
+def random_session(seed: int, total_laps: int = 8) -> tuple[DataFrame, DataFrame, DataFrame]:
+    rng = np.random.default_rng(seed)
+    driver_numbers = ["1", "16", "44"]
+    ticks = np.arange(1, 601)
+    milliseconds = 1000 + ticks * 220
+    lap_time = int(milliseconds[-1] / (total_laps + 0.5))
+
+    pos_df = DataFrame(
+        {
+            "DriverNumber": np.repeat(driver_numbers, ticks.size),
+            "SessionTimeTick": np.tile(ticks, len(driver_numbers)),
+            "SessionTimeMilliseconds": np.tile(milliseconds, len(driver_numbers)),
+            "SessionTime": pd.to_timedelta(np.tile(milliseconds, len(driver_numbers)), unit="ms"),
+            "Time": pd.to_timedelta(np.tile(milliseconds, len(driver_numbers)), unit="ms"),
+            "X": rng.random(ticks.size * len(driver_numbers)),
+        },
+    )
+
+    laps = []
+    for driver_index, driver_number in enumerate(driver_numbers):
+        for lap_number in range(1, total_laps + 1):
+            lap_start = 1000 + (lap_number - 1) * lap_time + driver_index * 300
+            laps.append(
+                {
+                    "DriverNumber": driver_number,
+                    "LapNumber": float(lap_number),
+                    "TotalLaps": total_laps,
+                    "Time": pd.Timedelta(milliseconds=lap_start + lap_time),
+                    "LapStartTime": pd.Timedelta(milliseconds=lap_start),
+                    "Sector1SessionTime": pd.Timedelta(milliseconds=lap_start + lap_time // 3),
+                    "Sector2SessionTime": pd.Timedelta(milliseconds=lap_start + 2 * lap_time // 3),
+                    "LapStartTimeMilliseconds": lap_start,
+                    "LapTimeMilliseconds": lap_time,
+                    "LapEndTimeMilliseconds": lap_start + lap_time,
+                    "Sector1SessionTimeMilliseconds": lap_start + lap_time // 3,
+                    "Sector2SessionTimeMilliseconds": lap_start + 2 * lap_time // 3,
+                    "Sector3SessionTimeMilliseconds": lap_start + lap_time,
+                    "S1DiffToCarAhead": float(rng.integers(0, 500)),
+                    "S2DiffToCarAhead": float(rng.integers(0, 500)),
+                    "S3DiffToCarAhead": float(rng.integers(0, 500)),
+                    "Position": float(driver_index + 1),
+                    "FastestLapTimeMillisecondsSoFar": float(lap_time - rng.integers(0, 1000)),
+                    "PitInTimeMilliseconds": np.nan,
+                    "PitOutTimeMilliseconds": np.nan,
+                    "Compound": "SOFT" if lap_number <= total_laps // 2 else "MEDIUM",
+                    "CompoundColor": [1.0, 0.0, 0.0, 1.0] if lap_number <= total_laps // 2 else [1.0, 1.0, 0.0, 1.0],
+                    "TyreLife": float(lap_number),
+                },
+            )
+
+    car_df = DataFrame(
+        {
+            "DriverNumber": np.repeat(driver_numbers, ticks.size),
+            "SessionTimeTick": np.tile(ticks, len(driver_numbers)),
+            "RPM": rng.integers(9000, 12000, size=ticks.size * len(driver_numbers)).astype("float64"),
+            "Speed": rng.integers(80, 330, size=ticks.size * len(driver_numbers)).astype("float64"),
+            "SpeedMph": rng.random(ticks.size * len(driver_numbers)) * 200,
+            "nGear": "5",
+            "Throttle": rng.integers(0, 100, size=ticks.size * len(driver_numbers)).astype("float64"),
+            "Brake": False,
+            "DRS": 0,
+        },
+    )
+
+    return pos_df, DataFrame(laps), car_df
+
+
+@pytest.fixture()
+def windowed_data_extractor_service(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> DataExtractorService:
+    pos_df, laps_df, car_df = random_session(0)
+
+    mocker.patch.object(data_extractor_service, "update_loading")
+    data_extractor_service.session_parser.total_laps = 8
+    data_extractor_service.progressive_window_laps = 2
+    data_extractor_service.processed_pos_data = pos_df
+    data_extractor_service.laps_parser.processed_laps = laps_df
+    data_extractor_service.processed_car_data = car_df
+
+    return data_extractor_service
+
+
+def test_processed_ticks_defaults_to_session_ticks(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    data_extractor_service._session_ticks = 600
+
+    assert 600 == data_extractor_service.processed_ticks
+
+    data_extractor_service._processed_ticks = 120
+
+    assert 600 == data_extractor_service.processed_ticks
+
+    data_extractor_service._tick_data = TickData(
+        mocker.MagicMock(spec=TickDriverStore),
+        np.array([1]),
+        np.array([1000.0]),
+        mocker.MagicMock(spec=LeaderboardTable),
+        120,
+    )
+
+    assert 120 == data_extractor_service.processed_ticks
+
+
+def test_session_ticks_caches(data_extractor_service: DataExtractorService) -> None:
+    data_extractor_service.processed_pos_data = DataFrame(
+        {"DriverNumber": ["1", "1", "1", "16", "16"], "SessionTimeTick": [1, 2, 3, 1, 2]},
+    )
+
+    assert 2 == data_extractor_service.session_ticks
+
+    data_extractor_service.processed_pos_data = DataFrame({"DriverNumber": ["1"], "SessionTimeTick": [1]})
+
+    assert 2 == data_extractor_service.session_ticks
+
+
+def test_compute_window_end_ticks(windowed_data_extractor_service: DataExtractorService) -> None:
+    pos_df = windowed_data_extractor_service.processed_pos_data
+    laps_df = windowed_data_extractor_service.laps_parser.processed_laps
+
+    window_end_ticks = windowed_data_extractor_service.compute_window_end_ticks(pos_df)
+
+    expected = []
+    for lap_number in [2, 4]:
+        lap_end = laps_df.loc[laps_df["LapNumber"] == lap_number, "LapEndTimeMilliseconds"].min()
+        expected.append(int(pos_df.loc[pos_df["SessionTimeMilliseconds"] <= lap_end, "SessionTimeTick"].max()))
+
+    assert [*expected, 600] == window_end_ticks
+
+
+@pytest.mark.parametrize("end_tick", [75, 150, 333, 599])
+def test_process_pos_data_window_matches_full_session_prefix(
+    windowed_data_extractor_service: DataExtractorService,
+    end_tick: int,
+) -> None:
+    pos_df = windowed_data_extractor_service.processed_pos_data
+
+    full_df = windowed_data_extractor_service.process_pos_data_window(pos_df, 600)
+    window_df = windowed_data_extractor_service.process_pos_data_window(pos_df, end_tick)
+
+    assert pos_df is windowed_data_extractor_service.processed_pos_data
+    assert end_tick == window_df["SessionTimeTick"].max()
+    assert_frame_equal(full_df[full_df["SessionTimeTick"] <= end_tick].reset_index(drop=True), window_df)
+
+
+def test_process_pos_data_window_runs_in_own_context(
+    windowed_data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    mock_record = mocker.patch.object(windowed_data_extractor_service.timing_report, "record")
+    laps_df = windowed_data_extractor_service.laps_parser.processed_laps.copy()
+
+    windowed_data_extractor_service.process_pos_data_window(windowed_data_extractor_service.processed_pos_data, 150)
+
+    windowed_data_extractor_service.update_loading.assert_not_called()
+    assert_frame_equal(laps_df, windowed_data_extractor_service.laps_parser.processed_laps)
+    assert "PosDataWindow.merge_pos_and_laps" == mock_record.call_args_list[0].args[0].name
+
+
+def test_process_session_in_windows(
+    windowed_data_extractor_service: DataExtractorService,
+    mock_session: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    mock_run = mocker.patch("f1p.services.data_extractor.service.StageScheduler.run")
+    mocker.patch.object(windowed_data_extractor_service, "compute_window_end_ticks", return_value=[150, 600])
+    window_frames = [DataFrame({"SessionTimeTick": [150]}), DataFrame({"SessionTimeTick": [600]})]
+    mock_process_pos_data_window = mocker.patch.object(
+        windowed_data_extractor_service,
+        "process_pos_data_window",
+        side_effect=window_frames,
+    )
+    published = []
+    mock_build_tick_store = mocker.patch.object(
+        windowed_data_extractor_service,
+        "build_tick_store",
+        return_value=windowed_data_extractor_service,
+    )
+    mocker.patch.object(
+        windowed_data_extractor_service,
+        "publish_session",
+        side_effect=lambda: published.append(
+            (windowed_data_extractor_service.processed_pos_data, windowed_data_extractor_service._processed_ticks),
+        ),
+    )
+    pos_df = windowed_data_extractor_service.processed_pos_data
+
+    assert windowed_data_extractor_service == windowed_data_extractor_service.process_session_in_windows()
+
+    mock_session.load.assert_called_once()
+    mock_run.assert_called_once()
+    mock_process_pos_data_window.assert_has_calls([mocker.call(pos_df, 150), mocker.call(pos_df, 600)])
+    assert 2 == mock_build_tick_store.call_count
+    assert [(window_frames[0], 150), (window_frames[1], 600)] == published
+
+
+def test_publish_session(
+    data_extractor_service: DataExtractorService,
+    mock_task_manager: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    mock_delete_loading = mocker.patch.object(data_extractor_service, "delete_loading")
+    mock_messenger = mocker.patch("f1p.services.data_extractor.service.messenger")
+    first_tick_data = mocker.MagicMock(spec=TickData)
+    data_extractor_service._built_tick_data = first_tick_data
+
+    data_extractor_service.publish_session()
+
+    assert data_extractor_service.session_ready is True
+    assert first_tick_data is data_extractor_service._tick_data
+    mock_delete_loading.assert_called_once()
+    mock_messenger.send.assert_called_once_with("sessionSelected")
+
+    extended_tick_data = mocker.MagicMock(spec=TickData)
+    data_extractor_service._built_tick_data = extended_tick_data
+    data_extractor_service.publish_session()
+
+    # Extensions only reach the UI from the main thread task
+    assert first_tick_data is data_extractor_service._tick_data
+    mock_delete_loading.assert_called_once()
+    mock_messenger.send.assert_called_once_with("sessionSelected")
+    mock_task_manager.add.assert_called_once_with(
+        data_extractor_service.extend_session,
+        "extendSession",
+        extraArgs=[extended_tick_data],
+        appendTask=True,
+    )
+
+
+def test_extend_session(data_extractor_service: DataExtractorService, mocker: MockerFixture) -> None:
+    mock_messenger = mocker.patch("f1p.services.data_extractor.service.messenger")
+    tick_data = mocker.MagicMock(spec=TickData)
+    tick_data.processed_ticks = 600
+    data_extractor_service._snapshot = mocker.MagicMock(spec=TickSnapshot)
+    mock_task = mocker.MagicMock()
+
+    assert mock_task.done == data_extractor_service.extend_session(tick_data, mock_task)
+
+    assert tick_data is data_extractor_service._tick_data
+    assert data_extractor_service._snapshot is None
+    mock_messenger.send.assert_called_once_with("sessionExtended", sentArgs=[600])
+
+
+def test_update_loading_after_loading_deleted(data_extractor_service: DataExtractorService) -> None:
+    assert data_extractor_service.wait_bar is None
+
+    data_extractor_service.update_loading(5)
+
+
+def test_extract_processes_session_in_windows(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.exists.return_value = False
+    data_extractor_service._processed_session_cache = mock_cache
+    data_extractor_service.progressive_window_laps = 5
+
+    def process_session_in_windows() -> MagicMock:
+        data_extractor_service.session_ready = True
+        return mock_windowed_session
+
+    mock_windowed_session = mocker.MagicMock()
+    mocker.patch.object(data_extractor_service, "process_session_in_windows", side_effect=process_session_in_windows)
+    mock_process_session = mocker.patch.object(data_extractor_service, "process_session")
+    mock_publish_session = mocker.patch.object(data_extractor_service, "publish_session")
+
+    data_extractor_service.extract(mocker.MagicMock())
+
+    mock_process_session.assert_not_called()
+    processed_session = mock_windowed_session.compact_processed_pos_data.return_value
+    processed_session.build_tick_store.return_value.store_processed_session.assert_called_once()
+    mock_publish_session.assert_called_once()
+
+
+def test_request_car_telemetry_adds_task_once(
+    data_extractor_service: DataExtractorService,
+    mock_task_manager: MagicMock,
+) -> None:
+    data_extractor_service.request_car_telemetry()
+    data_extractor_service.request_car_telemetry()
+
+    mock_task_manager.add.assert_called_once_with(
+        data_extractor_service.extract_car_telemetry,
+        "extractCarTelemetry",
+        taskChain="loadingData",
+    )
+
+
+def test_get_car_record_requests_car_telemetry_until_indexed(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    mock_request_car_telemetry = mocker.patch.object(data_extractor_service, "request_car_telemetry")
+
+    assert data_extractor_service.get_car_record("1", 10) is None
+
+    mock_request_car_telemetry.assert_called_once()
+
+
+def test_get_car_record_matches_merged_car_data(windowed_data_extractor_service: DataExtractorService) -> None:
+    pos_df = windowed_data_extractor_service.processed_pos_data
+    _, _, car_df = random_session(0)
+    car_df = car_df.sample(frac=0.5, random_state=0)
+    car_columns = ["RPM", "Speed", "SpeedMph", "nGear", "Throttle", "Brake", "DRS"]
+
+    merged_df = pos_df[["DriverNumber", "SessionTimeTick"]].merge(
+        car_df,
+        on=["DriverNumber", "SessionTimeTick"],
+        how="left",
+    )
+    merged_df[car_columns] = merged_df.groupby("DriverNumber")[car_columns].ffill()
+
+    windowed_data_extractor_service.processed_car_data = car_df
+    windowed_data_extractor_service._car_telemetry = {}
+
+    for record in merged_df.sample(n=200, random_state=1).to_dict(orient="records"):
+        car_record = windowed_data_extractor_service.get_car_record(record["DriverNumber"], record["SessionTimeTick"])
+
+        if pd.isna(record["RPM"]):
+            assert car_record is None
+        else:
+            assert {column: record[column] for column in car_columns} == {
+                column: car_record[column] for column in car_columns
+            }
+
+    assert {"1", "16", "44"} == set(windowed_data_extractor_service._car_telemetry.keys())
+    assert windowed_data_extractor_service.get_car_record("99", 10) is None
+
+
+def test_extract_car_telemetry_parses_and_stores(
+    data_extractor_service: DataExtractorService,
+    mock_session: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.has_frame.return_value = False
+    mock_cache.exists.return_value = True
+    data_extractor_service._processed_session_cache = mock_cache
+
+    car_df = DataFrame({"DriverNumber": ["1"], "SessionTimeTick": [1], "RPM": [10000.0]})
+
+    def parse_telemetry() -> DataExtractorService:
+        data_extractor_service.processed_car_data = car_df
+        return data_extractor_service
+
+    mocker.patch.object(data_extractor_service, "parse_telemetry", side_effect=parse_telemetry)
+    mock_task = mocker.MagicMock()
+
+    assert mock_task.done == data_extractor_service.extract_car_telemetry(mock_task)
+
+    mock_session.load.assert_called_once_with(laps=True, telemetry=True, weather=False, messages=False)
+    mock_cache.save_frame.assert_called_once_with("processed_car_data", car_df)
+    assert {"DriverNumber": "1", "SessionTimeTick": 1, "RPM": 10000.0} == data_extractor_service.get_car_record("1", 5)
+
+
+def test_extract_car_telemetry_loads_from_cache(
+    data_extractor_service: DataExtractorService,
+    mock_session: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    car_df = DataFrame({"DriverNumber": ["1"], "SessionTimeTick": [1], "RPM": [10000.0]})
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.has_frame.return_value = True
+    mock_cache.load_frame.return_value = car_df
+    data_extractor_service._processed_session_cache = mock_cache
+    mock_parse_telemetry = mocker.patch.object(data_extractor_service, "parse_telemetry")
+
+    data_extractor_service.extract_car_telemetry(mocker.MagicMock())
+
+    mock_session.load.assert_not_called()
+    mock_parse_telemetry.assert_not_called()
+    mock_cache.load_frame.assert_called_once_with("processed_car_data")
+    assert car_df is data_extractor_service.processed_car_data
+
+
+def test_get_current_weather_data_requests_weather_until_ready(
+    data_extractor_service: DataExtractorService,
+    processed_weather_data: DataFrame,
+    mock_task_manager: MagicMock,
+) -> None:
+    assert data_extractor_service.get_current_weather_data(2) is None
+    assert data_extractor_service.get_current_weather_data(2) is None
+
+    mock_task_manager.add.assert_called_once_with(
+        data_extractor_service.extract_weather_data,
+        "extractWeatherData",
+        taskChain="loadingData",
+    )
+
+    data_extractor_service.weather_parser.processed_weather_data = processed_weather_data
+    data_extractor_service.weather_ready = True
+
+    assert 2 == data_extractor_service.get_current_weather_data(2)["SessionTimeTick"]
+
+
+def test_get_current_weather_row_id_requests_weather_until_ready(
+    data_extractor_service: DataExtractorService,
+    processed_weather_data: DataFrame,
+    mock_task_manager: MagicMock,
+) -> None:
+    assert data_extractor_service.get_current_weather_row_id(2) is None
+
+    mock_task_manager.add.assert_called_once()
+
+    data_extractor_service.weather_parser.processed_weather_data = processed_weather_data
+    data_extractor_service.weather_ready = True
+
+    assert 0 == data_extractor_service.get_current_weather_row_id(2)
+
+
+def test_extract_weather_data_processes_and_stores(
+    data_extractor_service: DataExtractorService,
+    processed_weather_data: DataFrame,
+    mock_task_manager: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.has_frame.return_value = False
+    mock_cache.exists.return_value = True
+    data_extractor_service._processed_session_cache = mock_cache
+
+    def process_weather_data() -> DataExtractorService:
+        data_extractor_service.weather_parser.processed_weather_data = processed_weather_data
+        return data_extractor_service
+
+    mock_load_weather_data = mocker.patch.object(data_extractor_service.weather_parser, "load_weather_data")
+    mocker.patch.object(data_extractor_service, "process_weather_data", side_effect=process_weather_data)
+    mock_task = mocker.MagicMock()
+
+    assert mock_task.done == data_extractor_service.extract_weather_data(mock_task)
+
+    mock_load_weather_data.assert_called_once_with()
+    assert data_extractor_service.weather_ready is True
+    mock_task_manager.add.assert_called_once_with(
+        data_extractor_service.publish_weather,
+        "publishWeather",
+        appendTask=True,
+    )
+    mock_cache.save_frame.assert_called_once_with("processed_weather_data", processed_weather_data)
+
+
+def test_extract_weather_data_loads_from_cache(
+    data_extractor_service: DataExtractorService,
+    processed_weather_data: DataFrame,
+    mock_session: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.has_frame.return_value = True
+    mock_cache.load_frame.return_value = processed_weather_data
+    data_extractor_service._processed_session_cache = mock_cache
+    mock_process_weather_data = mocker.patch.object(data_extractor_service, "process_weather_data")
+
+    data_extractor_service.extract_weather_data(mocker.MagicMock())
+
+    mock_process_weather_data.assert_not_called()
+    mock_session.load.assert_not_called()
+    mock_cache.load_frame.assert_called_once_with("processed_weather_data")
+    assert processed_weather_data is data_extractor_service.weather_parser.processed_weather_data
+    assert data_extractor_service.weather_ready is True
+
+
+def test_publish_weather_drops_cached_snapshot(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    mock_messenger = mocker.patch("f1p.services.data_extractor.service.messenger")
+    data_extractor_service._snapshot = mocker.MagicMock(spec=TickSnapshot)
+    mock_task = mocker.MagicMock()
+
+    assert mock_task.done == data_extractor_service.publish_weather(mock_task)
+
+    assert data_extractor_service._snapshot is None
+    mock_messenger.send.assert_called_once_with("weatherLoaded")
+
+
+def test_stages_are_recorded_in_timing_report(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    pos_df, laps_df = random_pos_and_laps(0)
+    mocker.patch.object(data_extractor_service, "update_loading")
+    data_extractor_service.processed_pos_data = pos_df
+    data_extractor_service.laps_parser.processed_laps = laps_df
+
+    data_extractor_service.merge_pos_and_laps()
+
+    timing = data_extractor_service.timing_report.timings[-1]
+    assert "DataExtractorService.merge_pos_and_laps" == timing.name
+    assert len(pos_df) == timing.rows_in
+    assert len(data_extractor_service.processed_pos_data) == timing.rows_out
+    assert len(data_extractor_service.processed_pos_data.columns) == timing.columns
+
+
+def test_show_stage_timing(data_extractor_service: DataExtractorService, mocker: MockerFixture) -> None:
+    timing = StageTiming("DataExtractorService.compute_in_pit", 0.5, 0.25, 10, 10, 4, 0, 0)
+
+    data_extractor_service.show_stage_timing(timing)
+
+    data_extractor_service.timing_text = mocker.MagicMock()
+    data_extractor_service.timing_report.record(timing)
+
+    data_extractor_service.timing_text.__setitem__.assert_called_once_with(
+        "text",
+        "compute_in_pit 500/250ms 10 rows 4 cols +0.0MiB",
+    )
+
+
+def test_extract_writes_timing_report(
+    data_extractor_service: DataExtractorService,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.exists.return_value = True
+    mock_cache.pipeline_version = "abc"
+    data_extractor_service._processed_session_cache = mock_cache
+    data_extractor_service.timing_report_path = tmp_path / "reports" / "timings.json"
+    data_extractor_service.timing_report.record(StageTiming("DataExtractorService.stage", 0.5, 0.25, 10, 10, 4, 0, 0))
+    mocker.patch.object(data_extractor_service, "load_processed_session")
+    mocker.patch.object(data_extractor_service, "publish_session")
+
+    data_extractor_service.extract(mocker.MagicMock())
+
+    report = json.loads((tmp_path / "reports" / "timings.json").read_text())
+    assert "Australian Grand Prix" == report["event_name"]
+    assert "abc" == report["pipeline_version"]
+    assert pd.__version__ == report["pandas_version"]
+    assert ["DataExtractorService.stage"] == [stage["name"] for stage in report["stages"]]
+
+
+def test_compact_processed_pos_data(windowed_data_extractor_service: DataExtractorService) -> None:
+    pos_df = windowed_data_extractor_service.processed_pos_data
+    lap_index = pos_df["SessionTimeTick"] // 75
+    pos_df["Status"] = "OnTrack"
+    pos_df["Source"] = "pos"
+    pos_df["Driver"] = "D" + pos_df["DriverNumber"]
+    pos_df["Team"] = "Team " + pos_df["DriverNumber"]
+    pos_df["Sector1Color"] = [[1, 0, 1, 1]] * len(pos_df)
+    pos_df["LapTimeColor"] = [[0.4, 0.85, 0.49, 1]] * len(pos_df)
+    pos_df["LapTimeFormatted"] = "1:3" + lap_index.astype(str) + ".123"
+    pos_df["Sector1TimeFormatted"] = "0:2" + lap_index.astype(str) + ".456"
+    df = windowed_data_extractor_service.process_pos_data_window(pos_df, 600)
+    windowed_data_extractor_service.processed_pos_data = df
+
+    assert windowed_data_extractor_service == windowed_data_extractor_service.compact_processed_pos_data()
+
+    compacted_df = windowed_data_extractor_service.processed_pos_data
+    assert "category" == compacted_df["DriverNumber"].dtype
+    assert "float32" == compacted_df["X"].dtype
+    assert "int32" == compacted_df["SessionTimeTick"].dtype
+    assert "int8" == compacted_df["PositionIndex"].dtype
+
+    expected = df[df["DriverNumber"] == "16"].set_index("SessionTimeTick").to_dict(orient="index")
+    actual = compacted_df[compacted_df["DriverNumber"] == "16"].set_index("SessionTimeTick").to_dict(orient="index")
+    assert expected.keys() == actual.keys()
+    assert expected[10]["Compound"] == actual[10]["Compound"]
+    assert tuple(expected[10]["Sector1Color"]) == actual[10]["Sector1Color"]
+    assert expected[10]["X"] == pytest.approx(actual[10]["X"], abs=1e-6)
+
+    total_report = windowed_data_extractor_service.dtype_report.iloc[-1]
+    assert "Total" == total_report["Column"]
+    assert total_report["BytesAfter"] < total_report["BytesBefore"] / 2
+
+
+def test_dtype_report_raises_value_error_when_not_compacted(data_extractor_service: DataExtractorService) -> None:
+    with pytest.raises(ValueError, match="Dtypes are not compacted yet."):
+        assert data_extractor_service.dtype_report is None
+
+
+def test_tick_store_builds_from_processed_pos_data(windowed_data_extractor_service: DataExtractorService) -> None:
+    pos_df = windowed_data_extractor_service.process_pos_data_window(
+        windowed_data_extractor_service.processed_pos_data,
+        600,
+    )
+    windowed_data_extractor_service.processed_pos_data = pos_df
+
+    tick_store = windowed_data_extractor_service.tick_store
+
+    assert tick_store is windowed_data_extractor_service.tick_store
+    assert ["1", "16", "44"] == tick_store.driver_numbers
+    assert (600, 3) == tick_store.arrays["X"].shape
+    expected = pos_df.loc[(pos_df["DriverNumber"] == "44") & (pos_df["SessionTimeTick"] == 321), "X"].iloc[0]
+    assert expected == tick_store.value("X", 321, "44")
+
+
+def test_store_processed_session_saves_tick_store(
+    windowed_data_extractor_service: DataExtractorService,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.store_path.return_value = tmp_path / "tick_store"
+    windowed_data_extractor_service._processed_session_cache = mock_cache
+    windowed_data_extractor_service.processed_pos_data = windowed_data_extractor_service.process_pos_data_window(
+        windowed_data_extractor_service.processed_pos_data,
+        600,
+    )
+    mocker.patch.object(windowed_data_extractor_service.laps_parser, "_processed_laps", DataFrame())
+    mocker.patch.object(windowed_data_extractor_service.track_parser, "_track_status", DataFrame())
+    windowed_data_extractor_service._processed_corners = DataFrame()
+    windowed_data_extractor_service._session_results = DataFrame()
+    windowed_data_extractor_service.map_center_coordinate = (0.0, 0.0, 0.0)
+    windowed_data_extractor_service.session_parser.session_start_time = Timedelta(0)
+    windowed_data_extractor_service.session_parser.session_end_time = Timedelta(0)
+
+    windowed_data_extractor_service.build_tick_store().store_processed_session()
+
+    mock_cache.store_path.assert_called_once_with("tick_store")
+    loaded_store = TickDriverStore.load(tmp_path / "tick_store")
+    built_store = windowed_data_extractor_service._built_tick_data.tick_store
+    np.testing.assert_array_equal(built_store.arrays["X"], loaded_store.arrays["X"])
+
+
+def test_get_current_lap_number_matches_filtered_maximum(
+    windowed_data_extractor_service: DataExtractorService,
+) -> None:
+    pos_df = windowed_data_extractor_service.process_pos_data_window(
+        windowed_data_extractor_service.processed_pos_data,
+        600,
+    )
+    windowed_data_extractor_service.processed_pos_data = pos_df
+    windowed_data_extractor_service.build_tick_store()
+
+    for session_time_tick in [1, 75, 150, 333, 599, 600]:
+        laps_completion = pos_df.loc[pos_df["SessionTimeTick"] == session_time_tick, "LapsCompletion"]
+        expected = int(np.ceil(laps_completion.max()))
+
+        assert expected == windowed_data_extractor_service.get_current_lap_number(session_time_tick)
+
+
+def test_compute_leader_lap_numbers_ignores_missing_drivers() -> None:
+    tick_store = TickDriverStore(
+        {
+            "LapsCompletion": np.array([[0.5, np.nan], [np.nan, np.nan], [1.2, 2.0]]),
+            "Present": np.array([[True, False], [False, False], [True, True]]),
+        },
+        ["1", "16"],
+        1,
+    )
+
+    actual = DataExtractorService.compute_leader_lap_numbers(tick_store)
+
+    np.testing.assert_array_equal(np.array([1, 0, 2]), actual)
+
+
+def test_tick_data_is_built_once(data_extractor_service: DataExtractorService, mocker: MockerFixture) -> None:
+    mock_from_frame = mocker.patch.object(TickDriverStore, "from_frame")
+    mock_build_tick_data = mocker.patch.object(data_extractor_service, "build_tick_data")
+
+    actual = data_extractor_service.leaderboard_table
+
+    assert mock_build_tick_data.return_value.leaderboard_table == actual
+    assert actual is data_extractor_service.leaderboard_table
+    mock_build_tick_data.assert_called_once_with(mock_from_frame.return_value)
+
+
+def test_build_tick_data(data_extractor_service: DataExtractorService, mocker: MockerFixture) -> None:
+    tick_store = mocker.MagicMock(spec=TickDriverStore)
+    mock_leader_lap_numbers = mocker.patch.object(DataExtractorService, "compute_leader_lap_numbers")
+    mock_tick_session_milliseconds = mocker.patch.object(DataExtractorService, "compute_tick_session_milliseconds")
+    mock_from_store = mocker.patch.object(LeaderboardTable, "from_store")
+    data_extractor_service._processed_ticks = 150
+
+    tick_data = data_extractor_service.build_tick_data(tick_store)
+
+    assert tick_store is tick_data.tick_store
+    assert mock_leader_lap_numbers.return_value is tick_data.leader_lap_numbers
+    assert mock_tick_session_milliseconds.return_value is tick_data.tick_session_milliseconds
+    assert mock_from_store.return_value is tick_data.leaderboard_table
+    assert 150 == tick_data.processed_ticks
+    mock_from_store.assert_called_once_with(tick_store)
+
+
+def test_get_current_track_status_matches_interval_filters(data_extractor_service: DataExtractorService) -> None:
+    ts_df = DataFrame(
+        {
+            "Status": [1, 2, 4, 1],
+            "SessionTimeTick": [1, 40, 55, 70],
+            "SessionTimeTickEnd": [40, 60, 58, np.nan],
+        },
+    )
+    data_extractor_service._session_ticks = 100
+    data_extractor_service._track_statuses = ts_df
+
+    data_extractor_service.index_track_statuses()
+
+    for session_time_tick in range(-1, 102):
+        filtered_df = ts_df[ts_df["SessionTimeTick"] <= session_time_tick]
+        filtered_df = filtered_df[filtered_df["SessionTimeTickEnd"] >= session_time_tick]
+
+        actual = data_extractor_service.get_current_track_status(session_time_tick)
+
+        if filtered_df.empty:
+            assert actual is None
+        else:
+            assert filtered_df.iloc[0].equals(actual)
+
+
+def test_process_track_statuses_indexes_track_statuses(
+    data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    ts_df = DataFrame({"Status": [1], "SessionTimeTick": [1], "SessionTimeTickEnd": [3]})
+    mocker.patch.object(data_extractor_service.track_parser, "parse", return_value=ts_df)
+    data_extractor_service._session_ticks = 3
+    data_extractor_service._session_time_ticks_df = DataFrame()
+    data_extractor_service.session_parser.session_start_time = Timedelta(0)
+    data_extractor_service.session_parser.session_end_time = Timedelta(0)
+
+    data_extractor_service.process_track_statuses(100)
+
+    np.testing.assert_array_equal(np.array([-1, 0, 0, 0]), data_extractor_service._track_status_ids)
+    assert 1 == data_extractor_service.get_current_track_status(2)["Status"]
+
+
+def test_snapshot_resolves_tick_and_caches(
+    windowed_data_extractor_service: DataExtractorService,
+    mocker: MockerFixture,
+) -> None:
+    pos_df = windowed_data_extractor_service.processed_pos_data
+    pos_df["Y"] = pos_df["X"] * 2
+    pos_df["Z"] = 0.0
+    windowed_data_extractor_service.processed_pos_data = windowed_data_extractor_service.process_pos_data_window(
+        pos_df,
+        600,
+    )
+    track_status = Series({"Status": 4})
+    mocker.patch.object(windowed_data_extractor_service, "get_current_track_status", return_value=track_status)
+    mocker.patch.object(windowed_data_extractor_service, "get_current_weather_row_id", return_value=None)
+
+    snapshot = windowed_data_extractor_service.snapshot(321)
+
+    assert snapshot is windowed_data_extractor_service.snapshot(321)
+    assert 321 == snapshot.session_time_tick
+    assert windowed_data_extractor_service.get_current_lap_number(321) == snapshot.lap_number
+    assert track_status is snapshot.track_status
+    assert snapshot.weather is None
+    assert ["1", "16", "44"] == sorted(record["DriverNumber"] for record in snapshot.drivers)
+    assert [0, 1, 2] == [record["PositionIndex"] for record in snapshot.drivers]
+    assert windowed_data_extractor_service.snapshot_seconds > 0
+    assert snapshot is not windowed_data_extractor_service.snapshot(322)
+
+    fractional_snapshot = windowed_data_extractor_service.snapshot(321.5)
+    assert 321 == fractional_snapshot.session_time_tick
+    assert 321.5 == fractional_snapshot.playback_tick
+    lower_x = windowed_data_extractor_service.tick_store.value("X", 321, "44")
+    upper_x = windowed_data_extractor_service.tick_store.value("X", 322, "44")
+    assert pytest.approx((lower_x + upper_x) / 2) == fractional_snapshot.position("44")[0]
+
+
+def test_compute_tick_session_milliseconds() -> None:
+    tick_store = TickDriverStore(
+        {
+            "SessionTimeMilliseconds": np.array([[1000, 1010], [0, 0], [1500, 0], [1400, 1440]]),
+            "Present": np.array([[True, True], [False, False], [True, False], [True, True]]),
+        },
+        ["1", "16"],
+        1,
+    )
+
+    actual = DataExtractorService.compute_tick_session_milliseconds(tick_store)
+
+    np.testing.assert_array_equal(np.array([1005, 1252.5, 1500, 1500]), actual)
@@ -0,0 +1,64 @@
+import pytest
+from pandas import Series
+
+from f1p.services.data_extractor.snapshot import TickSnapshot
+
+
+@pytest.fixture()
+def snapshot() -> TickSnapshot:
+    return TickSnapshot(
+        12,
+        {
+            "1": {"DriverNumber": "1", "PositionIndex": 1, "X": 1.0, "Y": 2.0, "Z": 3.0},
+            "16": {"DriverNumber": "16", "PositionIndex": 0, "X": 4.0, "Y": 5.0, "Z": 6.0},
+        },
+        3,
+        Series({"Status": 1}),
+        0,
+        Series({"AirTemp": 21.5}),
+    )
+
+
+def test_initialization(snapshot: TickSnapshot) -> None:
+    assert 12 == snapshot.session_time_tick
+    assert 12 == snapshot.playback_tick
+    assert 3 == snapshot.lap_number
+    assert 1 == snapshot.track_status["Status"]
+    assert 0 == snapshot.weather_row_id
+    assert 21.5 == snapshot.weather["AirTemp"]
+
+
+def test_drivers_are_ordered_by_position(snapshot: TickSnapshot) -> None:
+    assert ["16", "1"] == [record["DriverNumber"] for record in snapshot.drivers]
+
+
+def test_driver(snapshot: TickSnapshot) -> None:
+    assert 1 == snapshot.driver("1")["PositionIndex"]
+    assert snapshot.driver("44") is None
+
+
+def test_snapshot_is_immutable(snapshot: TickSnapshot) -> None:
+    with pytest.raises(AttributeError, match="TickSnapshot is immutable."):
+        snapshot._lap_number = 4
+
+    with pytest.raises(TypeError):
+        snapshot.driver("1")["PositionIndex"] = 2
+
+
+def test_position_falls_back_to_record(snapshot: TickSnapshot) -> None:
+    assert (1.0, 2.0, 3.0) == snapshot.position("1")
+    assert snapshot.position("44") is None
+
+
+def test_at_playback_tick(snapshot: TickSnapshot) -> None:
+    fractional_snapshot = snapshot.at_playback_tick(12.25, {"1": (1.5, 2.5, 3.5)})
+
+    assert 12 == fractional_snapshot.session_time_tick
+    assert 12.25 == fractional_snapshot.playback_tick
+    assert (1.5, 2.5, 3.5) == fractional_snapshot.position("1")
+    assert (4.0, 5.0, 6.0) == fractional_snapshot.position("16")
+    assert snapshot.drivers is fractional_snapshot.drivers
+    assert 12 == snapshot.playback_tick
+
+    with pytest.raises(AttributeError, match="TickSnapshot is immutable."):
+        fractional_snapshot._playback_tick = 13
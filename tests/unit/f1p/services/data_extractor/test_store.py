@@ -0,0 +1,146 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from f1p.services.data_extractor.store import TickDriverStore
+
+
+@pytest.fixture()
+def pos_df() -> DataFrame:
+    return DataFrame(
+        {
+            "DriverNumber": pd.Categorical(["1", "16", "1", "16", "1", "4"]),
+            "SessionTimeTick": np.array([1, 1, 2, 2, 3, 3], dtype="int32"),
+            "X": np.array([0.5, 1.5, 0.6, 1.6, 0.7, 2.7], dtype="float32"),
+            "LapsCompletion": [0.1, 0.2, 0.3, np.nan, 0.5, 0.6],
+            "PositionIndex": np.array([1, 0, 1, 0, 0, 2], dtype="int8"),
+            "IsDNF": [False, False, False, True, False, False],
+            "InPit": pd.array([False, True, None, True, False, False], dtype="boolean"),
+            "Compound": ["S", "M", "S", "M", "S", "H"],
+            "SessionTime": pd.to_timedelta([1, 1, 2, 2, 3, 3], unit="s"),
+        },
+    )
+
+
+@pytest.fixture()
+def store(pos_df: DataFrame) -> TickDriverStore:
+    return TickDriverStore.from_frame(pos_df)
+
+
+def test_from_frame(store: TickDriverStore) -> None:
+    assert ["1", "4", "16"] == store.driver_numbers
+    assert {"1": 0, "4": 1, "16": 2} == store.driver_index
+    assert 1 == store.first_tick
+    assert 3 == store.last_tick
+    expected = ["SessionTimeTick", "X", "LapsCompletion", "PositionIndex", "IsDNF", "InPit", "Compound", "SessionTime"]
+    assert expected == store.columns
+
+    assert np.dtype("float32") == store.arrays["X"].dtype
+    assert np.dtype("int8") == store.arrays["PositionIndex"].dtype
+    assert np.dtype("bool") == store.arrays["InPit"].dtype
+    assert np.dtype("int8") == store.arrays["Compound"].dtype
+    assert np.dtype("m8[ns]") == store.arrays["SessionTime"].dtype
+    assert (3, 3) == store.arrays["X"].shape
+
+
+def test_from_frame_matches_long_frame(pos_df: DataFrame, store: TickDriverStore) -> None:
+    for record in pos_df.to_dict(orient="records"):
+        for column in ["X", "PositionIndex", "IsDNF", "Compound", "SessionTime"]:
+            assert record[column] == store.value(column, record["SessionTimeTick"], record["DriverNumber"])
+
+    assert np.isnan(store.value("LapsCompletion", 2, "16"))
+    assert store.value("InPit", 2, "1") is np.False_
+
+
+def test_missing_cells_are_not_present(store: TickDriverStore) -> None:
+    np.testing.assert_array_equal([[True, False, True], [True, False, True], [True, True, False]], store.present)
+    assert np.isnan(store.value("X", 1, "4"))
+    assert 0 == store.value("PositionIndex", 1, "4")
+
+
+def test_factorize_converts_lists_to_tuples() -> None:
+    codes, categories = TickDriverStore.factorize(pd.Series([[1, 0], None, [1, 0], [0, 1]]))
+
+    np.testing.assert_array_equal([0, -1, 0, 1], codes)
+    assert (1, 0) == categories[0]
+    assert (0, 1) == categories[1]
+    assert np.isnan(categories[-1])
+
+
+def test_records(store: TickDriverStore) -> None:
+    records = store.records(2)
+
+    assert ["1", "16"] == list(records.keys())
+    assert "1" == records["1"]["DriverNumber"]
+    assert "S" == records["1"]["Compound"]
+    assert pd.Timedelta(seconds=2) == records["16"]["SessionTime"]
+    assert records["16"]["IsDNF"] is True
+    assert 1 == records["1"]["PositionIndex"]
+    assert pytest.approx(0.6) == records["1"]["X"]
+
+
+def test_records_resolve_missing_categories(store: TickDriverStore) -> None:
+    store.arrays["Compound"][0, 0] = -1
+
+    assert np.isnan(store.records(1)["1"]["Compound"])
+
+
+def test_at(store: TickDriverStore) -> None:
+    tick = store.at(3)
+
+    np.testing.assert_array_equal(np.array([0.7, 2.7, np.nan], dtype="float32"), tick["X"])
+    np.testing.assert_array_equal([0, 2, 0], tick["PositionIndex"])
+    np.testing.assert_array_equal([True, True, False], tick["Present"])
+
+
+@pytest.mark.parametrize(
+    ("playback_tick", "expected"),
+    [
+        (1, [0.5, np.nan, 1.5]),
+        (1.5, [0.55, np.nan, 1.55]),
+        (2.25, [0.625, np.nan, 1.6]),
+        (3, [0.7, 2.7, np.nan]),
+        (3.5, [0.7, 2.7, np.nan]),
+    ],
+)
+def test_interpolate(store: TickDriverStore, playback_tick: float, expected: list[float]) -> None:
+    actual = store.interpolate(playback_tick, ("X",))
+
+    np.testing.assert_allclose(np.array(expected)[:, None], actual, rtol=1e-6)
+
+
+def test_interpolate_blends_on_session_time() -> None:
+    store = TickDriverStore.from_frame(
+        DataFrame(
+            {
+                "DriverNumber": ["1", "16", "1", "16"],
+                "SessionTimeTick": [1, 1, 2, 2],
+                "SessionTimeMilliseconds": [1000, 1000, 1200, 1400],
+                "X": [0.0, 0.0, 1.0, 1.0],
+            },
+        ),
+    )
+
+    np.testing.assert_allclose([[0.75], [0.375]], store.interpolate(1.5, ("X",)))
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_and_load(store: TickDriverStore, tmp_path: Path, mmap: bool) -> None:
+    path = tmp_path / "tick_store"
+    store.save(path)
+    store.save(path)
+
+    loaded_store = TickDriverStore.load(path, mmap=mmap)
+
+    assert path.with_name("tick_store.tmp").exists() is False
+    assert store.driver_numbers == loaded_store.driver_numbers
+    assert store.first_tick == loaded_store.first_tick
+    assert list(store.arrays.keys()) == list(loaded_store.arrays.keys())
+    assert store.records(3) == loaded_store.records(3)
+    assert mmap == isinstance(loaded_store.arrays["X"], np.memmap)
+
+    for column, array in store.arrays.items():
+        np.testing.assert_array_equal(array, loaded_store.arrays[column])
@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from f1p.main import app, parse_args
+from f1p.services.data_extractor.cache import ProcessedSessionCache
+from f1p.services.data_extractor.service import DataExtractorService
+
+
+def test_parse_args_defaults() -> None:
+    args = parse_args([])
+
+    assert args.parse_workers is None
+    assert args.progressive_window_laps is None
+    assert args.timing_report_path is None
+
+
+def test_parse_args() -> None:
+    args = parse_args(
+        ["--parse-workers", "4", "--progressive-window-laps", "5", "--timing-report-path", "report.json"],
+    )
+
+    assert 4 == args.parse_workers
+    assert 5 == args.progressive_window_laps
+    assert Path("report.json") == args.timing_report_path
+
+
+@pytest.mark.parametrize("progressive_window_laps", ["0", "-3"])
+def test_parse_args_rejects_progressive_window_laps_below_one(progressive_window_laps: str) -> None:
+    with pytest.raises(SystemExit):
+        parse_args(["--progressive-window-laps", progressive_window_laps])
+
+
+def test_app_passes_options_to_the_app(mocker: MockerFixture) -> None:
+    mock_app_class = mocker.patch("f1p.main.F1PlayerApp")
+
+    app(["--parse-workers", "2", "--progressive-window-laps", "3"])
+
+    mock_app_class.assert_called_once_with(parse_workers=2, progressive_window_laps=3, timing_report_path=None)
+    mock_menu = mock_app_class.return_value.configure_window.return_value.draw_menu.return_value
+    mock_menu.register_ui_components.return_value.register_controls.return_value.run.assert_called_once_with()
+
+
+def test_app_timing_report_path_is_the_report_file(
+    data_extractor_service: DataExtractorService,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    mock_app_class = mocker.patch("f1p.main.F1PlayerApp")
+    report_path = tmp_path / "reports" / "report.json"
+
+    app(["--timing-report-path", str(report_path)])
+
+    mock_cache = mocker.MagicMock(spec=ProcessedSessionCache)
+    mock_cache.exists.return_value = True
+    mock_cache.pipeline_version = "abc"
+    data_extractor_service._processed_session_cache = mock_cache
+    data_extractor_service.timing_report_path = mock_app_class.call_args.kwargs["timing_report_path"]
+    mocker.patch.object(data_extractor_service, "load_processed_session")
+    mocker.patch.object(data_extractor_service, "publish_session")
+
+    data_extractor_service.extract(mocker.MagicMock())
+
+    assert [report_path] == list((tmp_path / "reports").iterdir())
+    assert "abc" == json.loads(report_path.read_text())["pipeline_version"]
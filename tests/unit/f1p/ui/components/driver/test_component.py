@@ -1,25 +1,34 @@
-from decimal import Decimal
 from unittest.mock import MagicMock
 
 import pytest
 from direct.showbase.DirectObject import DirectObject
-from panda3d.core import LVecBase4f, NodePath
+from panda3d.core import LVecBase4f
 from pandas import DataFrame, Series
 from pytest_mock import MockerFixture
 
+from f1p.services.data_extractor.snapshot import TickSnapshot
 from f1p.ui.components.driver.component import Driver
 from f1p.ui.components.driver.window import DriverWindow
-from procedural3d import SphereMaker
 
 
 @pytest.fixture
-def ticks(pos_data: DataFrame) -> dict:
-    return pos_data.set_index("SessionTimeTick").to_dict(orient="index")
+def driver_sr(session_results_after_process_team_colors: DataFrame) -> Series:
+    return session_results_after_process_team_colors.iloc[0]
 
 
 @pytest.fixture
-def driver_sr(session_results: DataFrame) -> Series:
-    return session_results.iloc[0]
+def snapshots(pos_data: DataFrame, driver_sr: Series) -> dict[int, TickSnapshot]:
+    return {
+        record["SessionTimeTick"]: TickSnapshot(
+            record["SessionTimeTick"],
+            {driver_sr["DriverNumber"]: record | {"PositionIndex": 0}},
+            1,
+            None,
+            None,
+            None,
+        )
+        for record in pos_data.to_dict(orient="records")
+    }
 
 
 @pytest.fixture
@@ -92,18 +101,13 @@ def strategy() -> dict[int, dict[str, str | int]]:
 @pytest.fixture
 def driver(
     mock_f1p_app: MagicMock,
-    mock_parent: MagicMock,
     mock_data_extractor: MagicMock,
     driver_sr: Series,
 ) -> Driver:
-    return Driver.from_df(mock_f1p_app, mock_parent, mock_data_extractor, driver_sr)
+    return Driver.from_df(mock_f1p_app, mock_data_extractor, driver_sr)
 
 
-def test_initialization(
-    mock_f1p_app: MagicMock,
-    mock_data_extractor: MagicMock,
-    mocker: MockerFixture,
-) -> None:
+def test_initialization(mock_f1p_app: MagicMock, mock_data_extractor: MagicMock) -> None:
     number = "1"
     first_name = "Joe"
     last_name = "Shmoe"
@@ -112,9 +116,6 @@ def test_initialization(
     team_name = "Team 1"
     headshot_url = "https://some.img.url"
 
-    mock_accept = mocker.MagicMock()
-    mocker.patch("f1p.ui.components.driver.component.Driver.accept", mock_accept)
-
     driver = Driver(
         mock_f1p_app,
         number,
@@ -137,10 +138,8 @@ def test_initialization(
     assert team_name == driver.team_name
     assert headshot_url == driver.headshot_url
     assert mock_data_extractor == driver.data_extractor
-    assert driver.node_path is None
+    assert (1.0, 1.0, 1.0, 1.0) == driver.team_color
 
-    assert driver._pos_data is None
-    assert driver._ticks is None
     assert driver._strategy is None
     assert driver._driver_window is None
 
@@ -149,8 +148,6 @@ def test_initialization(
     assert driver.is_finished is False
     assert driver.has_fastest_lap is False
 
-    mock_accept.assert_called_once_with("updateDrivers", driver.queue_update)
-
 
 def test_driver_window_lazy_initialization(
     driver: Driver,
@@ -192,42 +189,18 @@ def test_driver_window_returns_cached_instance(
     mock_driver_window_class.assert_called_once()
 
 
-def test_team_color_obj(driver: Driver, mocker: MockerFixture) -> None:
-    color = LVecBase4f(1, 0, 0, 1)
-    mock_node_path = mocker.MagicMock(space=NodePath)
-    mock_node_path.getColor.return_value = color
-    driver.node_path = mock_node_path
-
-    assert color == driver.team_color_obj
-    mock_node_path.getColor.assert_called_once()
-
-
-def test_create_node_path(mock_parent: MagicMock, mocker: MockerFixture) -> None:
-    sphere = mocker.MagicMock()
-    mock_sphere_maker = mocker.MagicMock(spec=SphereMaker)
-    mock_sphere_maker.generate.return_value = sphere
-    mock_sphere_maker_class = mocker.MagicMock(return_value=mock_sphere_maker)
-    mocker.patch("f1p.ui.components.driver.component.SphereMaker", mock_sphere_maker_class)
-
-    node_path = mocker.MagicMock(spec=NodePath)
-    mock_parent.attachNewNode.return_value = node_path
+def test_team_color_obj(driver: Driver) -> None:
+    driver.team_color = (1.0, 0.0, 0.0, 1.0)
 
-    color = (1, 0, 0, 1)
-
-    assert node_path == Driver.create_node_path(mock_parent, color)
-    mock_sphere_maker_class.assert_called_once_with(radius=0.10)
-    mock_sphere_maker.generate.assert_called_once()
-    mock_parent.attachNewNode.assert_called_once_with(sphere)
-    node_path.setColor.assert_called_once_with(*color)
+    assert LVecBase4f(1, 0, 0, 1) == driver.team_color_obj
 
 
 def test_from_df(
-    mock_parent: MagicMock,
     driver_sr: Series,
     mock_f1p_app: MagicMock,
     mock_data_extractor: MagicMock,
 ) -> None:
-    driver = Driver.from_df(mock_f1p_app, mock_parent, mock_data_extractor, driver_sr)
+    driver = Driver.from_df(mock_f1p_app, mock_data_extractor, driver_sr)
 
     assert isinstance(driver, DirectObject)
     assert mock_f1p_app == driver.app
@@ -239,10 +212,9 @@ def test_from_df(
     assert driver_sr["TeamName"] == driver.team_name
     assert driver_sr["HeadshotUrl"] == driver.headshot_url
     assert mock_data_extractor == driver.data_extractor
-    assert mock_parent.attachNewNode.return_value == driver.node_path
+    assert driver_sr["TeamColor"] == driver.team_color
+    assert (0.0, 0.0, 0.0) == driver.position
 
-    assert driver._pos_data is None
-    assert driver._ticks is None
     assert driver._strategy is None
     assert driver._driver_window is None
 
@@ -255,96 +227,79 @@ def test_from_df(
 @pytest.mark.parametrize(
     ("session_time_tick", "x", "y", "z", "is_dnf", "in_pit", "is_finished", "has_fastest_lap"),
     [
-        (1, "1", "1", "1", False, False, False, False),
-        (2, "2", "2", "2", True, False, False, False),
-        (3, "3", "3", "3", False, True, False, False),
-        (4, "4", "4", "4", False, False, True, False),
-        (5, "5", "5", "5", False, False, False, True),
+        (1, 1.0, 1.0, 1.0, False, False, False, False),
+        (2, 2.0, 2.0, 2.0, True, False, False, False),
+        (3, 3.0, 3.0, 3.0, False, True, False, False),
+        (4, 4.0, 4.0, 4.0, False, False, True, False),
+        (5, 5.0, 5.0, 5.0, False, False, False, True),
     ],
 )
 def test_update(
     session_time_tick: int,
-    x: str,
-    y: str,
-    z: str,
+    x: float,
+    y: float,
+    z: float,
     is_dnf: bool,
     in_pit: bool,
     is_finished: bool,
     has_fastest_lap: bool,
     driver: Driver,
-    ticks: dict,
-    mocker: MockerFixture,
+    snapshots: dict[int, TickSnapshot],
 ) -> None:
-    mock_pos = mocker.MagicMock()
-    mock_pos.x = 1
-    mock_pos.y = 1
-    mock_pos.z = 1
-    node_path = mocker.MagicMock(spec=NodePath)
-    node_path.getPos.return_value = mock_pos
-    driver.node_path = node_path
-    driver._ticks = ticks
-
-    driver.update(session_time_tick)
+    driver.update(snapshots[session_time_tick])
 
     assert is_dnf == driver.is_dnf
     assert in_pit == driver.in_pit
     assert is_finished == driver.is_finished
     assert has_fastest_lap == driver.has_fastest_lap
+    assert (x, y, z) == driver.position
+
+
+def test_update_uses_interpolated_position(driver: Driver, snapshots: dict[int, TickSnapshot]) -> None:
+    snapshot = snapshots[1].at_playback_tick(1.5, {driver.number: (1.5, 1.5, 1.5)})
+
+    driver.update(snapshot)
 
-    node_path.getPos.assert_called_once()
+    assert (1.5, 1.5, 1.5) == driver.position
 
-    if session_time_tick > 1:
-        precision = Decimal("0.001")
-        parsed_x = Decimal(x).quantize(precision)
-        parsed_y = Decimal(y).quantize(precision)
-        parsed_z = Decimal(z).quantize(precision)
-        node_path.setPos.assert_called_once_with(parsed_x, parsed_y, parsed_z)
 
+def test_update_skips_driver_missing_from_snapshot(driver: Driver) -> None:
+    driver.position = (3.0, 2.0, 1.0)
 
-def test_update_with_open_window(driver: Driver, ticks: dict, mocker: MockerFixture) -> None:
-    mock_pos = mocker.MagicMock()
-    mock_pos.x = 1
-    mock_pos.y = 1
-    mock_pos.z = 1
-    node_path = mocker.MagicMock(spec=NodePath)
-    node_path.getPos.return_value = mock_pos
-    driver.node_path = node_path
-    driver._ticks = ticks
+    driver.update(TickSnapshot(1, {}, 1, None, None, None))
 
+    assert (3.0, 2.0, 1.0) == driver.position
+
+
+def test_update_with_open_window(
+    driver: Driver,
+    snapshots: dict[int, TickSnapshot],
+    mocker: MockerFixture,
+) -> None:
     mock_driver_window = mocker.MagicMock(spec=DriverWindow)
     mock_driver_window.is_open = True
     driver._driver_window = mock_driver_window
 
-    driver.update(2)
+    driver.update(snapshots[2])
 
     assert driver.is_dnf is True
     assert driver.in_pit is False
     assert driver.is_finished is False
     assert driver.has_fastest_lap is False
+    assert (2, 2, 2) == driver.position
 
-    node_path.getPos.assert_called_once()
-    precision = Decimal("0.001")
-    parsed_x = Decimal(2).quantize(precision)
-    parsed_y = Decimal(2).quantize(precision)
-    parsed_z = Decimal(2).quantize(precision)
-    node_path.setPos.assert_called_once_with(parsed_x, parsed_y, parsed_z)
-    mock_driver_window.update.assert_called_once_with(driver.ticks[2])
+    driver.data_extractor.get_car_record.assert_called_once_with(driver.number, 2)
+    car_record = driver.data_extractor.get_car_record.return_value
+    mock_driver_window.update.assert_called_once_with(snapshots[2].driver(driver.number), car_record)
 
 
 def test_open_driver(driver: Driver, mocker: MockerFixture) -> None:
     mock_driver_window = mocker.MagicMock(spec=DriverWindow)
     driver._driver_window = mock_driver_window
-
-    mock_node_path = mocker.MagicMock(spec=NodePath)
-    mock_pos = mocker.MagicMock()
-    mock_pos.x = 1.5
-    mock_pos.y = 2.5
-    mock_pos.z = 3.5
-    mock_node_path.getPos.return_value = mock_pos
-    driver.node_path = mock_node_path
+    driver.position = (1.5, 2.5, 3.5)
 
     driver.open_driver()
 
+    driver.data_extractor.request_car_telemetry.assert_called_once()
     mock_driver_window.open.assert_called_once()
-    mock_node_path.getPos.assert_called_once()
     mock_driver_window.update_camera_position.assert_called_once_with(1.5, 2.5, 3.5)
@@ -0,0 +1,101 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from panda3d.core import Geom, GeomNode, GeomVertexReader
+
+from f1p.ui.components.driver.markers import CarMarkers
+
+
+@pytest.fixture
+def colors() -> list[tuple[float, float, float, float]]:
+    return [(1.0, 0.0, 0.0, 1.0), (0.0, 0.0, 1.0, 1.0), (0.0, 1.0, 0.0, 1.0)]
+
+
+@pytest.fixture
+def car_markers(mock_parent: MagicMock, colors: list[tuple[float, float, float, float]]) -> CarMarkers:
+    return CarMarkers(mock_parent, colors)
+
+
+def read_column(car_markers: CarMarkers, column: str, size: int) -> np.ndarray:
+    reader = GeomVertexReader(car_markers.vertex_data, column)
+    rows = car_markers.vertex_data.getNumRows()
+
+    values = [tuple(getattr(reader, f"getData{size}")()) for _ in range(rows)]
+
+    return np.array(values).reshape(car_markers.marker_count, -1, size)
+
+
+def test_initialization(
+    car_markers: CarMarkers,
+    mock_parent: MagicMock,
+) -> None:
+    vertex_count = len(car_markers.template_vertices)
+
+    assert mock_parent == car_markers.parent
+    assert 0.10 == car_markers.radius
+    assert 3 == car_markers.marker_count
+    assert 3 * vertex_count == car_markers.vertex_data.getNumRows()
+    assert Geom.UH_dynamic == car_markers.vertex_data.getUsageHint()
+    assert mock_parent.attachNewNode.return_value == car_markers.node_path
+    assert [[0.0, 0.0, 0.0]] * 3 == car_markers.positions.tolist()
+
+
+def test_sphere_template() -> None:
+    vertices, normals, indices = CarMarkers.sphere_template(0.10)
+
+    assert vertices.shape == normals.shape
+    assert 3 == vertices.shape[1]
+    assert np.allclose(0.10, np.linalg.norm(vertices, axis=1), atol=1e-6)
+    assert 0 == len(indices) % 3
+    assert len(vertices) - 1 == indices.max()
+
+
+def test_create_node_path_builds_single_geom(car_markers: CarMarkers, mock_parent: MagicMock) -> None:
+    node = mock_parent.attachNewNode.call_args.args[0]
+
+    assert isinstance(node, GeomNode)
+    assert 1 == node.getNumGeoms()
+    assert node.getBounds().isInfinite()
+    assert node.isFinal()
+
+    geom = node.getGeom(0)
+    triangles = geom.getPrimitive(0)
+    vertex_count = len(car_markers.template_vertices)
+
+    assert 1 == geom.getNumPrimitives()
+    assert 3 * len(car_markers.template_indices) == triangles.getNumVertices()
+    assert 3 * vertex_count - 1 == triangles.getMaxVertex()
+
+
+def test_write_attributes(car_markers: CarMarkers, colors: list[tuple[float, float, float, float]]) -> None:
+    marker_colors = read_column(car_markers, "color", 4)
+    marker_normals = read_column(car_markers, "normal", 3)
+
+    for index, color in enumerate(colors):
+        assert np.allclose(color, marker_colors[index])
+        assert np.allclose(car_markers.template_normals, marker_normals[index])
+
+
+def test_update(car_markers: CarMarkers) -> None:
+    positions = np.array([[1.0, 2.0, 3.0], [-4.0, 5.0, 0.5], [0.0, 0.0, 0.0]])
+
+    car_markers.update(positions)
+
+    marker_vertices = read_column(car_markers, "vertex", 3)
+    for index, position in enumerate(positions):
+        assert np.allclose(car_markers.template_vertices + position, marker_vertices[index], atol=1e-6)
+
+    assert positions.tolist() == car_markers.positions.tolist()
+
+
+def test_update_skips_moves_below_tolerance(car_markers: CarMarkers) -> None:
+    car_markers.update(np.array([[1.0, 1.0, 1.0]] * 3))
+    car_markers.update(np.array([[1.0004, 0.9996, 1.0]] * 3))
+
+    assert [[1.0, 1.0, 1.0]] * 3 == car_markers.positions.tolist()
+
+    car_markers.update(np.array([[1.0, 1.0, 1.0], [1.0, 1.0, 1.0], [1.0, 1.0, 1.5]]))
+
+    assert [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0], [1.0, 1.0, 1.5]] == car_markers.positions.tolist()
+    assert np.allclose(car_markers.template_vertices + (1.0, 1.0, 1.5), read_column(car_markers, "vertex", 3)[2])
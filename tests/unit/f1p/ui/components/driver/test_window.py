@@ -1085,11 +1085,9 @@ def test_update_camera_position_sets_camera_position_and_looks_at(
     driver_window: DriverWindow,
     mocker: MockerFixture,
 ) -> None:
-    from decimal import Decimal
-
-    x = Decimal("10.123")
-    y = Decimal("20.456")
-    z = Decimal("30.789")
+    x = 10.123
+    y = 20.456
+    z = 30.789
 
     mock_camera_np = mocker.MagicMock(spec=NodePath)
     driver_window._camera_np = mock_camera_np
@@ -1106,8 +1104,6 @@ def test_update(
     driver_window: DriverWindow,
     mocker: MockerFixture,
 ) -> None:
-    from decimal import Decimal
-
     mock_update_telemetry = mocker.patch.object(driver_window, "update_telemetry")
     mock_update_camera = mocker.patch.object(driver_window, "update_camera_position")
     mock_update_lap_time_line = mocker.patch.object(driver_window, "update_lap_time_line")
@@ -1117,6 +1113,12 @@ def test_update(
         "PositionIndex": 2,
         "LapNumber": 15,
         "TotalLaps": 60.0,
+        "X": 10.123,
+        "Y": 20.456,
+        "Z": 30.789,
+        "LapsCompletion": 14.23,
+    }
+    car_record = {
         "nGear": "3",
         "RPM": 10000.0,
         "Brake": True,
@@ -1124,24 +1126,33 @@ def test_update(
         "DRS": 0.0,
         "SpeedMph": 93.0,
         "Throttle": 75.0,
-        "X": "10.123",
-        "Y": "20.456",
-        "Z": "30.789",
-        "LapsCompletion": 14.23,
     }
 
-    driver_window.update(current_record)
+    driver_window.update(current_record, car_record)
 
     mock_update_telemetry.assert_called_once_with("3", 10000.0, True, 150.0, 0, 93.0, 75.0)
-    mock_update_camera.assert_called_once_with(
-        Decimal("10.123"),
-        Decimal("20.456"),
-        Decimal("30.789"),
-    )
+    mock_update_camera.assert_called_once_with(10.123, 20.456, 30.789)
     mock_update_lap_time_line.assert_called_once_with(current_record["LapsCompletion"])
     mock_update_current_lap.assert_called_once_with(current_record)
 
 
+def test_update_without_car_record_skips_telemetry(
+    driver_window: DriverWindow,
+    mocker: MockerFixture,
+) -> None:
+    mock_update_telemetry = mocker.patch.object(driver_window, "update_telemetry")
+    mocker.patch.object(driver_window, "update_camera_position")
+    mocker.patch.object(driver_window, "update_lap_time_line")
+    mock_update_current_lap = mocker.patch.object(driver_window, "update_current_lap")
+
+    current_record = {"X": "10.123", "Y": "20.456", "Z": "30.789", "LapsCompletion": 14.23}
+
+    driver_window.update(current_record, None)
+
+    mock_update_telemetry.assert_not_called()
+    mock_update_current_lap.assert_called_once_with(current_record)
+
+
 def test_open_calls_make_widgets_and_sets_is_open_true(
     driver_window: DriverWindow,
     mocker: MockerFixture,
@@ -0,0 +1,168 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from panda3d.core import LVecBase4f
+from pandas import DataFrame, Series
+from pytest_mock import MockerFixture
+
+from f1p.services.data_extractor.leaderboard import LeaderboardTable
+from f1p.services.data_extractor.snapshot import TickSnapshot
+from f1p.services.data_extractor.store import TickDriverStore
+from f1p.ui.components.driver.component import Driver
+from f1p.ui.components.leaderboard.processors import (
+    IntervalLeaderboardProcessor,
+    LeaderboardProcessor,
+    LeaderLeaderboardProcessor,
+    TiresLeaderboardProcessor,
+)
+from f1p.ui.components.leaderboard.renderer import LeaderboardRow
+
+WHITE = (1.0, 1.0, 1.0, 0.8)
+FADED = (1.0, 1.0, 1.0, 0.5)
+TEAM = (0.2, 0.4, 0.6, 1.0)
+SOFT = (1.0, 0.0, 0.0, 1.0)
+
+
+def mock_driver(mocker: MockerFixture, number: str, abbreviation: str, **state: bool) -> MagicMock:
+    m = mocker.MagicMock(spec=Driver)
+    m.number = number
+    m.abbreviation = abbreviation
+    m.team_color = TEAM
+    m.is_finished = state.get("is_finished", False)
+    m.has_fastest_lap = state.get("has_fastest_lap", False)
+
+    return m
+
+
+@pytest.fixture
+def drivers(mocker: MockerFixture) -> list[MagicMock]:
+    return [
+        mock_driver(mocker, "1", "VER", has_fastest_lap=True),
+        mock_driver(mocker, "4", "NOR"),
+        mock_driver(mocker, "16", "LEC", is_finished=True),
+        mock_driver(mocker, "44", "HAM"),
+        mock_driver(mocker, "81", "PIA"),
+    ]
+
+
+@pytest.fixture
+def leaderboard_table() -> LeaderboardTable:
+    pos_df = DataFrame(
+        {
+            "DriverNumber": pd.Categorical(["1", "4", "16", "44"]),
+            "SessionTimeTick": np.array([1, 1, 1, 1], dtype="int32"),
+            "PositionIndex": np.array([0, 2, 1, 3], dtype="int8"),
+            "DiffToCarInFront": np.array([0.0, 0.5, 1.5, 0.0], dtype="float32"),
+            "DiffToLeader": np.array([0.0, 2.0, 1.5, 0.0], dtype="float32"),
+            "TyreLife": [12.0, 3.0, 12.0, 30.0],
+            "IsDNF": [False, False, False, True],
+            "InPit": [False, True, False, False],
+            "Compound": ["S", "S", "S", "S"],
+            "CompoundColor": [list(SOFT), list(SOFT), list(SOFT), list(SOFT)],
+        },
+    )
+
+    return LeaderboardTable.from_store(TickDriverStore.from_frame(pos_df))
+
+
+@pytest.fixture
+def snapshot() -> TickSnapshot:
+    return TickSnapshot(1, {}, 7, None, None, None)
+
+
+@pytest.fixture
+def mock_green_flag(mock_data_extractor: MagicMock, leaderboard_table: LeaderboardTable) -> MagicMock:
+    mock_data_extractor.total_laps = 50
+    mock_data_extractor.leaderboard_table = leaderboard_table
+    mock_data_extractor.green_flag_track_status_label = "Green"
+    mock_data_extractor.green_flag_track_status_color = LVecBase4f(0.0, 1.0, 0.0, 1.0)
+    mock_data_extractor.green_flag_track_status_text_color = LVecBase4f(0.0, 0.0, 0.0, 1.0)
+
+    return mock_data_extractor
+
+
+@pytest.mark.parametrize(
+    ("processor_class", "expected"),
+    [
+        (IntervalLeaderboardProcessor, [("Interval", WHITE), ("+1.500", WHITE), ("IN PIT", TEAM), ("OUT", FADED)]),
+        (LeaderLeaderboardProcessor, [("Leader", WHITE), ("+1.500", WHITE), ("IN PIT", TEAM), ("OUT", FADED)]),
+        (TiresLeaderboardProcessor, [("12", WHITE), ("12", WHITE), ("3", WHITE), ("OUT", FADED)]),
+    ],
+)
+def test_model_times(
+    processor_class: type[LeaderboardProcessor],
+    expected: list[tuple[str, tuple[float, ...]]],
+    drivers: list[MagicMock],
+    snapshot: TickSnapshot,
+    mock_green_flag: MagicMock,
+) -> None:
+    model = processor_class(drivers, mock_green_flag).model(snapshot)
+
+    assert expected == [(row.time, row.time_color) for row in model.rows[:4]]
+    assert model.rows[4] is None
+
+
+def test_model_rows(drivers: list[MagicMock], snapshot: TickSnapshot, mock_green_flag: MagicMock) -> None:
+    model = IntervalLeaderboardProcessor(drivers, mock_green_flag).model(snapshot)
+
+    assert "LAP 7/50" == model.lap_counter
+    assert (0.0, 1.0, 0.0, 1.0) == model.track_status_color
+    assert (0.0, 0.0, 0.0, 1.0) == model.track_status_text_color
+    assert "Green" == model.track_status_label
+    assert (
+        LeaderboardRow(
+            checkered_flag="",
+            team_color=TEAM,
+            abbreviation="VER",
+            open_driver=drivers[0].open_driver,
+            abbreviation_color=WHITE,
+            time_color=WHITE,
+            time="Interval",
+            tire_color=SOFT,
+            tire="S",
+            fastest_lap="⏱",
+        )
+        == model.rows[0]
+    )
+    assert ("LEC", "🮕") == (model.rows[1].abbreviation, model.rows[1].checkered_flag)
+    assert ("HAM", FADED, "", None) == (
+        model.rows[3].abbreviation,
+        model.rows[3].abbreviation_color,
+        model.rows[3].tire,
+        model.rows[3].tire_color,
+    )
+
+
+def test_model_track_status(drivers: list[MagicMock], mock_green_flag: MagicMock) -> None:
+    track_status = Series(
+        {"Label": "Yellow", "Color": LVecBase4f(1.0, 1.0, 0.0, 1.0), "TextColor": LVecBase4f(0.0, 0.0, 0.0, 1.0)},
+    )
+
+    model = IntervalLeaderboardProcessor(drivers, mock_green_flag).model(
+        TickSnapshot(1, {}, 7, track_status, None, None),
+    )
+
+    assert (1.0, 1.0, 0.0, 1.0) == model.track_status_color
+    assert "Yellow" == model.track_status_label
+
+
+def test_model_skips_drivers_without_widgets(
+    drivers: list[MagicMock],
+    snapshot: TickSnapshot,
+    mock_green_flag: MagicMock,
+) -> None:
+    model = IntervalLeaderboardProcessor(drivers[:2], mock_green_flag).model(snapshot)
+
+    assert ("VER", None) == (model.rows[0].abbreviation, model.rows[1])
+
+
+def test_unchanged_snapshot_builds_equal_model(
+    drivers: list[MagicMock],
+    snapshot: TickSnapshot,
+    mock_green_flag: MagicMock,
+) -> None:
+    processor = IntervalLeaderboardProcessor(drivers, mock_green_flag)
+
+    assert processor.model(snapshot) == processor.model(snapshot)
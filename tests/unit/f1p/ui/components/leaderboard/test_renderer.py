@@ -0,0 +1,146 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from f1p.ui.components.leaderboard.renderer import LeaderboardModel, LeaderboardRenderer, LeaderboardRow
+
+WHITE = (1.0, 1.0, 1.0, 0.8)
+GREEN = (0.0, 1.0, 0.0, 1.0)
+BLACK = (0.0, 0.0, 0.0, 1.0)
+RED = (1.0, 0.0, 0.0, 1.0)
+
+
+def open_driver() -> None: ...
+
+
+def row(abbreviation: str, time: str, tire_color: tuple[float, ...] | None = RED) -> LeaderboardRow:
+    return LeaderboardRow(
+        checkered_flag="",
+        team_color=RED,
+        abbreviation=abbreviation,
+        open_driver=open_driver,
+        abbreviation_color=WHITE,
+        time_color=WHITE,
+        time=time,
+        tire_color=tire_color,
+        tire="S",
+        fastest_lap="",
+    )
+
+
+def model(*rows: LeaderboardRow | None, lap_counter: str = "LAP 1/50", label: str = "Green") -> LeaderboardModel:
+    return LeaderboardModel(
+        lap_counter=lap_counter,
+        track_status_color=GREEN,
+        track_status_text_color=BLACK,
+        track_status_label=label,
+        rows=rows,
+    )
+
+
+@pytest.fixture
+def widgets(mocker: MockerFixture) -> dict[str, list[MagicMock]]:
+    names = [
+        "checkered_flags",
+        "team_colors",
+        "driver_abbreviations",
+        "driver_times",
+        "driver_tires",
+        "has_fastest_lap",
+    ]
+
+    return {name: [mocker.MagicMock(name=f"{name}{index}") for index in range(3)] for name in names}
+
+
+@pytest.fixture
+def renderer(widgets: dict[str, list[MagicMock]], mocker: MockerFixture) -> LeaderboardRenderer:
+    return LeaderboardRenderer(
+        mocker.MagicMock(name="lap_counter"),
+        [mocker.MagicMock(name=f"track_status_frame{index}") for index in range(3)],
+        mocker.MagicMock(name="track_status"),
+        **widgets,
+    )
+
+
+def writes(widget: MagicMock) -> dict[str, object]:
+    return {call.args[0]: call.args[1] for call in widget.__setitem__.call_args_list}
+
+
+def reset(renderer: LeaderboardRenderer, widgets: dict[str, list[MagicMock]]) -> None:
+    for widget in [renderer.lap_counter, renderer.track_status, *renderer.track_status_frames]:
+        widget.reset_mock()
+
+    for widget_list in widgets.values():
+        for widget in widget_list:
+            widget.reset_mock()
+
+
+def test_first_render_writes_every_cell(renderer: LeaderboardRenderer, widgets: dict[str, list[MagicMock]]) -> None:
+    actual = renderer.render(model(row("VER", "Interval"), row("NOR", "+1.234"), row("LEC", "+0.456")))
+
+    assert 6 + 3 * 10 == actual
+    assert {"text": "LAP 1/50"} == writes(renderer.lap_counter)
+    assert {"fg": BLACK, "text": "Green"} == writes(renderer.track_status)
+    assert all({"frameColor": GREEN} == writes(frame) for frame in renderer.track_status_frames)
+    assert {"text": "NOR", "command": open_driver, "text_fg": WHITE} == writes(widgets["driver_abbreviations"][1])
+    assert {"fg": WHITE, "text": "+0.456"} == writes(widgets["driver_times"][2])
+
+
+def test_identical_model_writes_nothing(renderer: LeaderboardRenderer, widgets: dict[str, list[MagicMock]]) -> None:
+    renderer.render(model(row("VER", "Interval"), row("NOR", "+1.234"), row("LEC", "+0.456")))
+    reset(renderer, widgets)
+
+    actual = renderer.render(model(row("VER", "Interval"), row("NOR", "+1.234"), row("LEC", "+0.456")))
+
+    assert 0 == actual
+    assert [] == renderer.dirty_rows(model(row("VER", "Interval"), row("NOR", "+1.234"), row("LEC", "+0.456")))
+    assert all(not widget.__setitem__.called for widget_list in widgets.values() for widget in widget_list)
+
+
+def test_changed_gap_writes_only_its_cell(renderer: LeaderboardRenderer, widgets: dict[str, list[MagicMock]]) -> None:
+    renderer.render(model(row("VER", "Interval"), row("NOR", "+1.234"), row("LEC", "+0.456")))
+    reset(renderer, widgets)
+    next_model = model(row("VER", "Interval"), row("NOR", "+1.301"), row("LEC", "+0.456"))
+
+    assert [1] == renderer.dirty_rows(next_model)
+    assert 1 == renderer.render(next_model)
+    assert {"text": "+1.301"} == writes(widgets["driver_times"][1])
+    assert not widgets["driver_abbreviations"][1].__setitem__.called
+
+
+def test_overtake_rewrites_both_rows(renderer: LeaderboardRenderer, widgets: dict[str, list[MagicMock]]) -> None:
+    renderer.render(model(row("VER", "Interval"), row("NOR", "+1.234"), row("LEC", "+0.456")))
+    reset(renderer, widgets)
+
+    actual = renderer.render(model(row("VER", "Interval"), row("LEC", "+0.100"), row("NOR", "+0.100")))
+
+    assert 4 == actual
+    assert {"text": "LEC"} == writes(widgets["driver_abbreviations"][1])
+    assert {"text": "+0.100"} == writes(widgets["driver_times"][1])
+    assert {"text": "NOR"} == writes(widgets["driver_abbreviations"][2])
+    assert {"text": "+0.100"} == writes(widgets["driver_times"][2])
+
+
+def test_missing_rows_and_cells_are_kept(renderer: LeaderboardRenderer, widgets: dict[str, list[MagicMock]]) -> None:
+    renderer.render(model(row("VER", "Interval"), row("NOR", "+1.234"), row("LEC", "+0.456")))
+    reset(renderer, widgets)
+
+    actual = renderer.render(model(row("VER", "Interval"), None, row("LEC", "+0.456", tire_color=None)))
+
+    assert 0 == actual
+    assert row("NOR", "+1.234") == renderer.rows[1]
+    assert row("LEC", "+0.456", tire_color=None) == renderer.rows[2]
+    assert not widgets["driver_tires"][2].__setitem__.called
+
+
+def test_header_changes(renderer: LeaderboardRenderer, widgets: dict[str, list[MagicMock]]) -> None:
+    renderer.render(model(row("VER", "Interval")))
+    reset(renderer, widgets)
+
+    actual = renderer.render(model(row("VER", "Interval"), lap_counter="LAP 2/50", label="Yellow"))
+
+    assert 2 == actual
+    assert {"text": "LAP 2/50"} == writes(renderer.lap_counter)
+    assert {"text": "Yellow"} == writes(renderer.track_status)
+    assert all(not frame.__setitem__.called for frame in renderer.track_status_frames)
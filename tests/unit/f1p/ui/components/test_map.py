@@ -1,12 +1,15 @@
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from direct.showbase.DirectObject import DirectObject
 from direct.task.Task import Task
-from panda3d.core import BillboardEffect, LineSegs, NodePath, TextNode
+from panda3d.core import BillboardEffect, GeomNode, LineSegs, NodePath, TextNode
 from pandas import DataFrame
 from pytest_mock import MockerFixture
 
+from f1p.ui.components.driver.component import Driver
+from f1p.ui.components.driver.markers import CarMarkers
 from f1p.ui.components.map import Map
 
 
@@ -42,10 +45,16 @@ def test_initialization(
     assert map_component.outer_border_node_path is None
 
     assert [] == map_component.drivers
+    assert map_component.car_markers is None
     assert map_component._pos_data is None
     assert map_component._map_center_coordinate is None
 
-    mock_accept.assert_called_once_with("sessionSelected", map_component.render_task)
+    mock_accept.assert_has_calls(
+        [
+            mocker.call("sessionSelected", map_component.render_task),
+            mocker.call("updateDrivers", map_component.update_drivers),
+        ],
+    )
 
 
 def test_render_map(map_component: Map, mock_data_extractor: MagicMock, mocker: MockerFixture) -> None:
@@ -77,53 +86,34 @@ def test_render_map(map_component: Map, mock_data_extractor: MagicMock, mocker:
         [3.17677669529663687, 2.8232233047033631, 0.0],
     ]
 
-    mock_draw_track.assert_has_calls(
-        [
-            mocker.call(inner_track, (0.9, 0.9, 0.9, 1)),
-            mocker.call().reparentTo(map_component.parent),
-            mocker.call(outer_track, (0.9, 0.9, 0.9, 1)),
-            mocker.call().reparentTo(map_component.parent),
-        ],
-    )
+    inner_call, outer_call = mock_draw_track.call_args_list
+    assert np.allclose(inner_track, inner_call.args[0])
+    assert (0.9, 0.9, 0.9, 1) == inner_call.args[1]
+    assert np.allclose(outer_track, outer_call.args[0])
+    assert (0.9, 0.9, 0.9, 1) == outer_call.args[1]
 
+    assert mock_node_path == map_component.inner_border_node_path
+    assert mock_node_path == map_component.outer_border_node_path
+    assert [mocker.call(map_component.parent)] * 2 == mock_node_path.reparentTo.call_args_list
 
-def test_draw_track(map_component: Map, mocker: MockerFixture) -> None:
-    mock_line_segs = mocker.MagicMock(spec=LineSegs)
-    mock_line_node = mocker.MagicMock()
-    mock_line_segs.create.return_value = mock_line_node
-    mocker.patch("f1p.ui.components.map.LineSegs", return_value=mock_line_segs)
 
-    mock_node_path = mocker.MagicMock(spec=NodePath)
-    mocker.patch("f1p.ui.components.map.NodePath", return_value=mock_node_path)
-
-    track = [
-        [0.0, 0.0, 0.0],
-        [1.0, 1.0, 0.0],
-        [2.0, 2.0, 0.0],
-    ]
-    color = (1.0, 0.0, 0.0, 1.0)
-
-    assert mock_node_path == map_component.draw_track(track, color)
-
-    mock_line_segs.setThickness.assert_called_once_with(1)
-    mock_line_segs.setColor.assert_called_with(*color)
-
-    mock_line_segs.moveTo.assert_has_calls(
+def test_draw_track(map_component: Map) -> None:
+    track = np.array(
         [
-            mocker.call(0.0, 0.0, 0.0),
-            mocker.call(1.0, 1.0, 0.0),
-            mocker.call(2.0, 2.0, 0.0),
-        ],
-    )
-    mock_line_segs.drawTo.assert_has_calls(
-        [
-            mocker.call(1.0, 1.0, 0.0),
-            mocker.call(2.0, 2.0, 0.0),
-            mocker.call(0.0, 0.0, 0.0),
+            [0.0, 0.0, 0.0],
+            [1.0, 1.0, 0.0],
+            [2.0, 2.0, 0.0],
         ],
     )
+    color = (1.0, 0.0, 0.0, 1.0)
 
-    mock_line_segs.create.assert_called_once_with(False)
+    node_path = map_component.draw_track(track, color)
+
+    assert isinstance(node_path, NodePath)
+    assert isinstance(node_path.node(), GeomNode)
+
+    line_strip = node_path.node().getGeom(0).getPrimitive(0)
+    assert [0, 1, 2, 0] == [line_strip.getVertex(index) for index in range(line_strip.getNumVertices())]
 
 
 def test_render_corners(
@@ -244,21 +234,11 @@ def test_initialize_drivers(
     })
     mock_data_extractor.session_results = driver_results
 
-    pos_data = DataFrame({
-        "SessionTimeTick": [1, 2, 1, 2],
-        "DriverNumber": [1, 1, 2, 2],
-        "X": [0.0, 1.0, 2.0, 3.0],
-        "Y": [0.0, 1.0, 2.0, 3.0],
-        "Z": [0.0, 0.0, 0.0, 0.0],
-    })
-    mock_data_extractor.processed_pos_data = pos_data
-
     map_component.initialize_drivers()
 
     assert len(map_component.drivers) == 2
 
     driver1_sr = driver_results.iloc[0]
-    driver1_pos_data = pos_data[pos_data["DriverNumber"] == driver1_sr["DriverNumber"]]
     driver1 = map_component.drivers[0]
     assert isinstance(driver1, DirectObject)
     assert driver1_sr["DriverNumber"] == driver1.number
@@ -268,16 +248,13 @@ def test_initialize_drivers(
     assert driver1_sr["Abbreviation"] == driver1.abbreviation
     assert driver1_sr["TeamName"] == driver1.team_name
     assert driver1_sr["HeadshotUrl"] == driver1.headshot_url
-    assert driver1_pos_data.equals(driver1.pos_data)
-    assert driver1_pos_data.set_index("SessionTimeTick").to_dict(orient="index") == driver1.ticks
-    assert mock_f1p_app.render.attachNewNode.return_value == driver1.node_path
+    assert driver1_sr["TeamColor"] == driver1.team_color
     assert driver1.in_pit is False
     assert driver1.is_dnf is False
     assert driver1.is_finished is False
     assert driver1.has_fastest_lap is False
 
     driver2_sr = driver_results.iloc[1]
-    driver2_pos_data = pos_data[pos_data["DriverNumber"] == driver2_sr["DriverNumber"]]
     driver2 = map_component.drivers[1]
     assert isinstance(driver2, DirectObject)
     assert driver2_sr["DriverNumber"] == driver2.number
@@ -286,14 +263,16 @@ def test_initialize_drivers(
     assert driver2_sr["BroadcastName"] == driver2.broadcast_name
     assert driver2_sr["Abbreviation"] == driver2.abbreviation
     assert driver2_sr["TeamName"] == driver2.team_name
-    assert driver2_pos_data.equals(driver2.pos_data)
-    assert driver2_pos_data.set_index("SessionTimeTick").to_dict(orient="index") == driver2.ticks
-    assert mock_f1p_app.render.attachNewNode.return_value == driver2.node_path
+    assert driver2_sr["TeamColor"] == driver2.team_color
     assert driver2.in_pit is False
     assert driver2.is_dnf is False
     assert driver2.is_finished is False
     assert driver2.has_fastest_lap is False
 
+    assert isinstance(map_component.car_markers, CarMarkers)
+    assert 2 == map_component.car_markers.marker_count
+    assert mock_f1p_app.render.attachNewNode.return_value == map_component.car_markers.node_path
+
 
 def test_render_task(map_component: Map, mock_task_manager: MagicMock) -> None:
     map_component.render_task()
@@ -317,3 +296,27 @@ def test_render(map_component: Map, mocker: MockerFixture) -> None:
     mock_render_map.assert_called_once()
     mock_render_corners.assert_called_once()
     mock_initialize_drivers.assert_called_once()
+
+
+def test_update_drivers(map_component: Map, mocker: MockerFixture) -> None:
+    drivers = [mocker.MagicMock(spec=Driver), mocker.MagicMock(spec=Driver)]
+    map_component.drivers = drivers
+    snapshot = mocker.MagicMock()
+
+    map_component.update_drivers(snapshot)
+
+    for driver in drivers:
+        driver.update.assert_called_once_with(snapshot)
+
+
+def test_update_drivers_moves_car_markers(map_component: Map, mocker: MockerFixture) -> None:
+    drivers = [mocker.MagicMock(spec=Driver), mocker.MagicMock(spec=Driver)]
+    drivers[0].position = (1.0, 2.0, 3.0)
+    drivers[1].position = (4.0, 5.0, 6.0)
+    map_component.drivers = drivers
+    map_component.car_markers = mocker.MagicMock(spec=CarMarkers)
+
+    map_component.update_drivers(mocker.MagicMock())
+
+    positions = map_component.car_markers.update.call_args.args[0]
+    assert [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]] == positions.tolist()
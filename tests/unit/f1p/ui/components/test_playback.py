@@ -0,0 +1,149 @@
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from f1p.ui.components.playback import PlaybackControls
+from f1p.ui.components.playback_clock import PlaybackClock
+
+
+@pytest.fixture()
+def mock_messenger(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch("f1p.ui.components.playback.messenger")
+
+
+@pytest.fixture()
+def playback_controls(
+    mock_parent: MagicMock,
+    mock_task_manager: MagicMock,
+    mock_data_extractor: MagicMock,
+    mocker: MockerFixture,
+) -> PlaybackControls:
+    mocker.patch("f1p.ui.components.playback.PlaybackControls.accept")
+
+    controls = PlaybackControls(
+        mock_parent,
+        mock_task_manager,
+        1080,
+        1920,
+        34,
+        mocker.MagicMock(),
+        mocker.MagicMock(),
+        mock_data_extractor,
+    )
+    controls.timeline = {"value": 1.0, "range": (1, 11)}
+    controls.clock = PlaybackClock(np.arange(11) * 250.0 + 1000, 1)
+    mock_data_extractor.processed_ticks = 11
+    mock_data_extractor.snapshot.side_effect = lambda playback_tick: f"snapshot {playback_tick}"
+
+    return controls
+
+
+class Slider(dict):
+    def __init__(self, command: Callable[[], None], **options: object):
+        super().__init__(**options)
+        self.command = command
+
+    def __setitem__(self, key: str, value: object) -> None:
+        super().__setitem__(key, value)
+        self.command()
+
+
+def sent_events(mock_messenger: MagicMock) -> list[tuple[str, str]]:
+    return [(call.args[0], call.kwargs["sentArgs"][0]) for call in mock_messenger.send.call_args_list]
+
+
+def test_update_components_only_records_the_latest_tick(
+    playback_controls: PlaybackControls,
+    mock_data_extractor: MagicMock,
+    mock_messenger: MagicMock,
+) -> None:
+    for value in [2.0, 3.0, 4.0]:
+        playback_controls.timeline["value"] = value
+        playback_controls.update_components()
+
+    assert 4.0 == playback_controls.requested_tick
+    assert playback_controls.scrubbing is True
+    mock_data_extractor.snapshot.assert_not_called()
+    mock_messenger.send.assert_not_called()
+
+
+def test_scrubbing_updates_drivers_and_defers_panels_until_settled(
+    playback_controls: PlaybackControls,
+    mock_data_extractor: MagicMock,
+    mock_messenger: MagicMock,
+) -> None:
+    playback_controls.last_frame_time = 1.0
+    for value in [2.0, 3.0, 4.0]:
+        playback_controls.timeline["value"] = value
+        playback_controls.update_components()
+
+    playback_controls.apply_requested_tick(1.05)
+
+    mock_data_extractor.snapshot.assert_called_once_with(4.0)
+    assert [("updateDrivers", "snapshot 4.0")] == sent_events(mock_messenger)
+
+    playback_controls.apply_requested_tick(1.1)
+
+    assert [("updateDrivers", "snapshot 4.0")] == sent_events(mock_messenger)
+
+    playback_controls.apply_requested_tick(1.25)
+
+    assert [
+        ("updateDrivers", "snapshot 4.0"),
+        ("updateLeaderboard", "snapshot 4.0"),
+        ("updateWeather", "snapshot 4.0"),
+    ] == sent_events(mock_messenger)
+    assert playback_controls.scrubbing is False
+
+    playback_controls.apply_requested_tick(1.3)
+
+    assert 3 == mock_messenger.send.call_count
+
+
+def test_move_timeline_updates_every_layer_while_playing(
+    playback_controls: PlaybackControls,
+    mock_messenger: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    playback_controls.timeline = Slider(playback_controls.update_components, value=1.0, range=(1, 11))
+    playback_controls.playing = True
+    playback_controls.last_frame_time = 1.0
+    task = mocker.MagicMock()
+    task.time = 1.25
+
+    assert task.cont == playback_controls.move_timeline(task)
+
+    assert [
+        ("updateDrivers", "snapshot 2.0"),
+        ("updateLeaderboard", "snapshot 2.0"),
+        ("updateWeather", "snapshot 2.0"),
+    ] == sent_events(mock_messenger)
+    assert playback_controls.scrubbing is False
+
+
+def test_refresh_snapshot_requests_the_shown_tick_while_paused(
+    playback_controls: PlaybackControls,
+    mock_data_extractor: MagicMock,
+    mock_messenger: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    playback_controls.latest_snapshot = mocker.MagicMock(playback_tick=4.5)
+
+    playback_controls.refresh_snapshot()
+    playback_controls.apply_requested_tick(1.0)
+
+    mock_data_extractor.snapshot.assert_called_once_with(4.5)
+    assert [
+        ("updateDrivers", "snapshot 4.5"),
+        ("updateLeaderboard", "snapshot 4.5"),
+        ("updateWeather", "snapshot 4.5"),
+    ] == sent_events(mock_messenger)
+
+
+def test_refresh_snapshot_before_first_snapshot(playback_controls: PlaybackControls) -> None:
+    playback_controls.refresh_snapshot()
+
+    assert playback_controls.requested_tick is None
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from f1p.ui.components.playback_clock import PlaybackClock
+
+
+@pytest.fixture()
+def clock() -> PlaybackClock:
+    # Ticks 1..11, 250 ms apart
+    return PlaybackClock(np.arange(11) * 250.0 + 1000, 1)
+
+
+def test_initialization(clock: PlaybackClock) -> None:
+    assert 1.0 == clock.speed
+    assert 1 == clock.first_tick
+    assert 11 == clock.last_tick
+    assert 1000.0 == clock.session_milliseconds
+    assert 1.0 == clock.playback_tick
+    assert 0.0 == clock.effective_speed
+
+
+@pytest.mark.parametrize("speed", [0.1, 100.5])
+def test_speed_out_of_range_raises_value_error(clock: PlaybackClock, speed: float) -> None:
+    with pytest.raises(ValueError, match="Playback speed must be between 0.25x and 100.0x."):
+        clock.speed = speed
+
+
+@pytest.mark.parametrize(
+    ("playback_tick", "expected"),
+    [(0, 1000.0), (1, 1000.0), (2.5, 1375.0), (11, 3500.0), (12, 3500.0)],
+)
+def test_tick_to_milliseconds(clock: PlaybackClock, playback_tick: float, expected: float) -> None:
+    assert expected == clock.tick_to_milliseconds(playback_tick)
+
+
+@pytest.mark.parametrize(
+    ("session_milliseconds", "expected"),
+    [(900.0, 1.0), (1000.0, 1.0), (1375.0, 2.5), (3500.0, 11.0), (4000.0, 11.0)],
+)
+def test_milliseconds_to_tick(clock: PlaybackClock, session_milliseconds: float, expected: float) -> None:
+    assert expected == clock.milliseconds_to_tick(session_milliseconds)
+
+
+def test_advance_follows_wall_time(clock: PlaybackClock) -> None:
+    assert 2.0 == clock.advance(0.25)
+    assert 4.0 == clock.advance(0.5)
+
+    clock.speed = 2.0
+
+    assert 6.0 == clock.advance(0.25)
+    assert 2.0 == clock.effective_speed
+
+
+def test_advance_skips_ticks_on_slow_frames(clock: PlaybackClock) -> None:
+    clock.speed = 4.0
+
+    assert 9.0 == clock.advance(0.5)
+
+
+def test_advance_caps_stalled_frames(clock: PlaybackClock) -> None:
+    assert 5.0 == clock.advance(5.0)
+
+
+def test_advance_holds_at_max_tick(clock: PlaybackClock) -> None:
+    clock.speed = 10.0
+
+    assert 3.0 == clock.advance(0.5, 3)
+    assert 3.0 == clock.advance(0.5, 3)
+    assert 0.5 == pytest.approx(clock.effective_speed)
+
+
+def test_seek(clock: PlaybackClock) -> None:
+    clock.seek(6.5)
+
+    assert 6.5 == clock.playback_tick
+    assert 2375.0 == clock.session_milliseconds
+    assert 7.5 == clock.advance(0.25)
+
+
+def test_set_ticks(clock: PlaybackClock) -> None:
+    clock.set_ticks(np.arange(21) * 250.0 + 1000, 1)
+
+    clock.speed = 4.0
+
+    assert 21 == clock.last_tick
+    assert 15.0 == clock.advance(1.0, 15)
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from panda3d.core import Geom, GeomLinestrips, GeomNode, GeomTristrips, GeomVertexReader
+
+from f1p.ui.components.track_geometry import TrackGeometry
+
+
+@pytest.fixture
+def track() -> np.ndarray:
+    return np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [1.0, 1.0, 0.0],
+            [2.0, 2.0, 0.5],
+            [3.0, 3.0, 0.0],
+        ],
+    )
+
+
+def read_column(node: GeomNode, column: str, size: int) -> list[tuple[float, ...]]:
+    vertex_data = node.getGeom(0).getVertexData()
+    reader = GeomVertexReader(vertex_data, column)
+
+    return [tuple(getattr(reader, f"getData{size}")()) for _ in range(vertex_data.getNumRows())]
+
+
+def read_indices(node: GeomNode) -> list[int]:
+    primitive = node.getGeom(0).getPrimitive(0)
+
+    return [primitive.getVertex(index) for index in range(primitive.getNumVertices())]
+
+
+def test_borders(track: np.ndarray) -> None:
+    inner, outer = TrackGeometry.borders(track, track_width=0.5)
+
+    offset = 0.17677669529663687
+    assert np.allclose(track + [offset, -offset, 0.0], inner)
+    assert np.allclose(track + [-offset, offset, 0.0], outer)
+
+
+def test_borders_with_repeated_points() -> None:
+    track = np.zeros((3, 3))
+
+    inner, outer = TrackGeometry.borders(track, track_width=0.5)
+
+    assert np.array_equal(track, inner)
+    assert np.array_equal(track, outer)
+
+
+def test_vertex_data(track: np.ndarray) -> None:
+    vertex_data = TrackGeometry.vertex_data("map", track, (0.9, 0.9, 0.9, 1))
+
+    assert len(track) == vertex_data.getNumRows()
+    assert Geom.UH_static == vertex_data.getUsageHint()
+
+
+def test_line_loop(track: np.ndarray) -> None:
+    node = TrackGeometry.line_loop("map", track, (0.9, 0.8, 0.7, 1))
+
+    assert "map" == node.getName()
+    assert 1 == node.getNumGeoms()
+    assert isinstance(node.getGeom(0).getPrimitive(0), GeomLinestrips)
+    assert 1 == node.getGeom(0).getPrimitive(0).getNumPrimitives()
+    assert [0, 1, 2, 3, 0] == read_indices(node)
+    assert np.allclose(track, read_column(node, "vertex", 3))
+    assert np.allclose([(0.9, 0.8, 0.7, 1)] * len(track), read_column(node, "color", 4))
+
+
+def test_ribbon(track: np.ndarray) -> None:
+    inner, outer = TrackGeometry.borders(track, track_width=0.5)
+
+    node = TrackGeometry.ribbon("surface", inner, outer, (0.2, 0.2, 0.2, 1))
+
+    triangles = node.getGeom(0).getPrimitive(0)
+    vertices = np.array(read_column(node, "vertex", 3))
+
+    assert "surface" == node.getName()
+    assert isinstance(triangles, GeomTristrips)
+    assert 1 == triangles.getNumPrimitives()
+    assert 2 * len(track) == triangles.decompose().getNumPrimitives()
+    assert [0, 1, 2, 3, 4, 5, 6, 7, 0, 1] == read_indices(node)
+    assert np.allclose(inner, vertices[0::2])
+    assert np.allclose(outer, vertices[1::2])
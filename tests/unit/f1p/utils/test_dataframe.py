@@ -0,0 +1,56 @@
+import numpy as np
+from pandas import DataFrame
+
+from f1p.utils.dataframe import compact_dtypes, memory_usage_report
+
+
+def make_frame() -> DataFrame:
+    return DataFrame(
+        {
+            "DriverNumber": ["1", "1", "16", "16"],
+            "X": [0.5, 1.5, 2.5, 3.5],
+            "SessionTimeTick": [1, 2, 1, 2],
+            "Compound": ["S", "S", None, "M"],
+            "Sector1Color": [[1, 0, 1, 1], [1, 0, 1, 1], np.nan, [0, 1, 0, 1]],
+            "IsDNF": [False, False, True, False],
+            "LapTimeFormatted": ["1:30.001", "1:30.002", "1:30.003", "1:30.004"],
+        },
+    ).astype({"IsDNF": "object"})
+
+
+def test_compact_dtypes() -> None:
+    df = make_frame()
+
+    compacted_df = compact_dtypes(df, {"X": "float32", "SessionTimeTick": "int32", "Missing": "int8"}, 0.75)
+
+    assert "object" == str(df["DriverNumber"].dtype), "Source frame is left untouched"
+    assert {
+        "DriverNumber": "category",
+        "X": "float32",
+        "SessionTimeTick": "int32",
+        "Compound": "category",
+        "Sector1Color": "category",
+        "IsDNF": "bool",
+        "LapTimeFormatted": "object",
+    } == compacted_df.dtypes.astype(str).to_dict()
+    assert ["1", "1", "16", "16"] == compacted_df["DriverNumber"].tolist()
+    assert (1, 0, 1, 1) == compacted_df["Sector1Color"].iloc[0]
+    assert np.isnan(compacted_df["Sector1Color"].iloc[2])
+
+
+def test_memory_usage_report() -> None:
+    df = make_frame()
+    compacted_df = compact_dtypes(df, {"X": "float32"})
+
+    report_df = memory_usage_report(df, compacted_df)
+
+    assert [*df.columns, "Total"] == report_df["Column"].tolist()
+    x_report = report_df[report_df["Column"] == "X"].iloc[0]
+    assert ("float64", "float32", 32, 16) == (
+        x_report["DtypeBefore"],
+        x_report["DtypeAfter"],
+        x_report["BytesBefore"],
+        x_report["BytesAfter"],
+    )
+    total_report = report_df[report_df["Column"] == "Total"].iloc[0]
+    assert df.memory_usage(index=False, deep=True).sum() == total_report["BytesBefore"]
@@ -0,0 +1,107 @@
+import json
+from pathlib import Path
+from typing import Self
+
+from pandas import DataFrame
+from pytest_mock import MockerFixture
+
+from f1p.utils.performance import StageTiming, TimingReport, frame_stats, instrumented
+
+
+class Stages:
+    def __init__(self, timing_report: TimingReport | None):
+        self.timing_report = timing_report
+
+        self.frame: DataFrame | None = None
+
+    @instrumented("frame")
+    def load(self) -> Self:
+        self.frame = DataFrame({"A": [1, 2, 3], "B": [4.0, 5.0, 6.0]})
+
+        return self
+
+    @instrumented("frame")
+    def filter(self, limit: int) -> Self:
+        self.frame = self.frame[self.frame["A"] < limit]
+
+        return self
+
+    @instrumented()
+    def idle(self) -> Self:
+        return self
+
+
+def make_timing(name: str) -> StageTiming:
+    return StageTiming(name, 0.25, 0.125, 10, 5, 3, 2**20, 0)
+
+
+def test_instrumented_records_stages() -> None:
+    timing_report = TimingReport()
+
+    Stages(timing_report).load().filter(3).idle()
+
+    assert ["Stages.load", "Stages.filter", "Stages.idle"] == [timing.name for timing in timing_report.timings]
+
+    load, filter_, idle = timing_report.timings
+    assert (0, 3, 2) == (load.rows_in, load.rows_out, load.columns)
+    assert (3, 2, 2) == (filter_.rows_in, filter_.rows_out, filter_.columns)
+    assert (0, 0, 0) == (idle.rows_in, idle.rows_out, idle.columns)
+    assert load.memory_delta > 0
+    assert load.wall_time >= 0
+    assert load.cpu_time >= 0
+    assert 0 < load.process_peak_rss <= idle.process_peak_rss
+
+
+def test_instrumented_without_report_only_runs_stage(mocker: MockerFixture) -> None:
+    mock_perf_counter = mocker.patch("f1p.utils.performance.time.perf_counter")
+
+    stages = Stages(None).load()
+
+    assert 3 == len(stages.frame)
+    mock_perf_counter.assert_not_called()
+
+
+def test_frame_stats_of_non_frame() -> None:
+    assert (0, 0, 0) == frame_stats(None)
+
+
+def test_timing_report_calls_on_record() -> None:
+    recorded = []
+    timing_report = TimingReport(recorded.append)
+    timing = make_timing("Service.stage")
+
+    timing_report.record(timing)
+
+    assert [timing] == recorded
+
+
+def test_timing_report_summary_shows_latest_stages() -> None:
+    timing_report = TimingReport()
+    for name in ["Service.first", "Service.second", "Service.third"]:
+        timing_report.record(make_timing(name))
+
+    assert "second 250/125ms 5 rows 3 cols +1.0MiB\nthird 250/125ms 5 rows 3 cols +1.0MiB" == timing_report.summary(2)
+
+
+def test_timing_report_write_json(tmp_path: Path) -> None:
+    timing_report = TimingReport()
+    timing_report.record(make_timing("Service.stage"))
+    path = tmp_path / "reports" / "report.json"
+
+    timing_report.write_json(path, {"year": 2026})
+
+    assert {
+        "year": 2026,
+        "stages": [
+            {
+                "name": "Service.stage",
+                "wall_time": 0.25,
+                "cpu_time": 0.125,
+                "rows_in": 10,
+                "rows_out": 5,
+                "columns": 3,
+                "memory_delta": 2**20,
+                "process_peak_rss": 0,
+            },
+        ],
+    } == json.loads(path.read_text())
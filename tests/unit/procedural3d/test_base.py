@@ -0,0 +1,119 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from panda3d.core import GeomNode
+from pytest_mock import MockerFixture
+
+from procedural3d import BoxMaker, ConeMaker, CylinderMaker, SphereMaker, TorusMaker
+from procedural3d.base import ModelMaker
+
+
+@pytest.fixture(autouse=True)
+def geometry_cache() -> Iterator[None]:
+    ModelMaker.clear_cache()
+    ModelMaker.set_cache_path(None)
+
+    yield
+
+    ModelMaker.clear_cache()
+    ModelMaker.set_cache_path(None)
+
+
+def geometry_bytes(node: GeomNode) -> tuple[bytes, ...]:
+    geom = node.get_geom(0)
+    vertex_data = geom.get_vertex_data()
+
+    return (
+        *(bytes(memoryview(vertex_data.get_array(index))) for index in range(vertex_data.get_num_arrays())),
+        bytes(memoryview(geom.get_primitive(0).get_vertices())),
+    )
+
+
+@pytest.mark.parametrize(
+    "make_maker",
+    [
+        lambda: SphereMaker(radius=0.5, segments={"horizontal": 12}),
+        lambda: BoxMaker(width=2.0, height=3.0),
+        lambda: CylinderMaker(radius=1.0, slice=90.0),
+        lambda: ConeMaker(bottom_radius=1.0, top_radius=0.5),
+        lambda: TorusMaker(ring_radius=2.0, section_radius=0.5),
+    ],
+)
+def test_generate_returns_instanced_copy(make_maker, mocker: MockerFixture) -> None:
+    expected = geometry_bytes(make_maker()._generate())
+    expected_ranges = make_maker().vertex_ranges
+    spy = mocker.spy(type(make_maker()), "_generate")
+
+    first_maker = make_maker()
+    first = first_maker.generate()
+    second_maker = make_maker()
+    second = second_maker.generate()
+
+    assert 1 == spy.call_count
+    assert first is not second
+    assert first.get_geom(0) == second.get_geom(0)
+    assert expected == geometry_bytes(first)
+    assert expected == geometry_bytes(second)
+    assert first_maker.vertex_ranges == second_maker.vertex_ranges
+    assert expected_ranges.keys() == second_maker.vertex_ranges.keys()
+
+
+def test_generate_keys_on_parameters() -> None:
+    small = SphereMaker(radius=0.5).generate()
+    large = SphereMaker(radius=1.0).generate()
+    faceted = SphereMaker(radius=0.5, smooth=False).generate()
+
+    assert geometry_bytes(small) != geometry_bytes(large)
+    assert geometry_bytes(small) != geometry_bytes(faceted)
+    assert 3 == len(ModelMaker._geometry_cache)
+
+
+def test_generate_after_changing_parameter() -> None:
+    maker = SphereMaker(radius=0.5)
+    small = maker.generate()
+
+    maker.radius = 1.0
+
+    assert geometry_bytes(SphereMaker(radius=1.0)._generate()) == geometry_bytes(maker.generate())
+    assert geometry_bytes(SphereMaker(radius=0.5)._generate()) == geometry_bytes(small)
+
+
+def test_modifying_returned_geometry_keeps_cache_intact() -> None:
+    expected = geometry_bytes(SphereMaker(radius=0.5)._generate())
+
+    node = SphereMaker(radius=0.5).generate()
+    vertex_data = node.modify_geom(0).modify_vertex_data()
+    vertex_data.set_num_rows(vertex_data.get_num_rows() + 1)
+
+    assert expected == geometry_bytes(SphereMaker(radius=0.5).generate())
+
+
+def test_thick_sphere_reuses_cached_inner_sphere() -> None:
+    expected = geometry_bytes(SphereMaker(radius=1.0, thickness=0.2)._generate())
+
+    first = SphereMaker(radius=1.0, thickness=0.2).generate()
+    ModelMaker.clear_cache()
+    SphereMaker(None, 0.8, None, True, -1.0, 1.0, 0.0, inverted=True).generate()
+    second = SphereMaker(radius=1.0, thickness=0.2).generate()
+
+    assert expected == geometry_bytes(first)
+    assert expected == geometry_bytes(second)
+
+
+def test_bam_cache(tmp_path: Path, mocker: MockerFixture) -> None:
+    ModelMaker.set_cache_path(tmp_path)
+    expected_maker = BoxMaker(width=2.0)
+    expected = geometry_bytes(expected_maker.generate())
+
+    assert 1 == len(list(tmp_path.glob("*.bam")))
+
+    ModelMaker.clear_cache()
+    spy = mocker.spy(BoxMaker, "_generate")
+    maker = BoxMaker(width=2.0)
+    node = maker.generate()
+
+    assert 0 == spy.call_count
+    assert expected == geometry_bytes(node)
+    assert expected_maker.vertex_ranges == maker.vertex_ranges
+    assert node.has_tag("vertex_ranges") is False
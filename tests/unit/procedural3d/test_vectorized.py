@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from panda3d.core import Geom, GeomNode, Vec3
+from pytest_mock import MockerFixture
+
+from procedural3d import BoxMaker, ConeMaker, CylinderMaker, SphereMaker, TorusMaker
+from procedural3d.base import ModelMaker
+
+
+def geometry_bytes(node: GeomNode) -> tuple[object, ...]:
+    geom = node.get_geom(0)
+    vertex_data = geom.get_vertex_data()
+    primitive = geom.get_primitive(0)
+
+    return (
+        node.get_name(),
+        vertex_data.get_name(),
+        str(vertex_data.get_format()),
+        *(bytes(memoryview(vertex_data.get_array(index))) for index in range(vertex_data.get_num_arrays())),
+        primitive.get_index_type(),
+        bytes(memoryview(primitive.get_vertices())),
+    )
+
+
+@pytest.mark.parametrize(
+    "make_maker",
+    [
+        lambda: SphereMaker(),
+        lambda: SphereMaker(radius=0.10, has_uvs=False),
+        lambda: SphereMaker(center=(1.0, -2.0, 0.5), radius=2.0, segments={"horizontal": 3, "vertical": 2}),
+        lambda: SphereMaker(segments={"horizontal": 37, "vertical": 13}, inverted=True, vertex_color=(1, 0, 0, 1)),
+        lambda: SphereMaker(segments={"horizontal": 300, "vertical": 150}),
+        lambda: CylinderMaker(),
+        lambda: CylinderMaker(bottom_center=(1.0, -2.0, 0.5), top_center=(0.0, 3.0, 1.0), radius=0.3),
+        lambda: CylinderMaker(segments={"circular": 41, "axial": 7, "bottom_cap": 4, "top_cap": 0}, inverted=True),
+        lambda: CylinderMaker(top_center=(0.0, 0.0, -2.0), thickness=5.0, has_uvs=False, vertex_color=(0, 1, 0, 1)),
+        lambda: CylinderMaker(top_center=(0.0, 0.0, 0.0)),
+        lambda: ConeMaker(),
+        lambda: ConeMaker(bottom_radius=0.0, top_radius=1.0, segments={"bottom_cap": 3, "top_cap": 3}),
+        lambda: ConeMaker(bottom_radius=0.7, top_radius=0.7, inverted=True, vertex_color=(0, 0, 1, 1)),
+        lambda: ConeMaker(top_center=(0.0, 3.0, 1.0), top_radius=0.5, segments={"circular": 300, "axial": 200}),
+        lambda: TorusMaker(),
+        lambda: TorusMaker(center=(1.0, -2.0, 0.5), ring_radius=0.5, section_radius=0.2, rotation=33.0),
+        lambda: TorusMaker(ring_radius=0.0, inverted=True, has_uvs=False, vertex_color=(1, 1, 0, 1)),
+        lambda: TorusMaker(segments={"ring": 150, "section": 60}, thickness=5.0),
+        lambda: BoxMaker(),
+        lambda: BoxMaker(center=(1.0, -2.0, 0.5), width=2.5, depth=0.3, height=0.0, inverted=True),
+        lambda: BoxMaker(segments={"width": 41, "depth": 17, "height": 9}, open_sides=("top", "left")),
+        lambda: BoxMaker(segments={"width": 3, "height": 2}, has_uvs=False, vertex_color=(1, 0, 1, 1)),
+    ],
+)
+def test_numpy_geometry_matches_python_geometry(make_maker) -> None:
+    python_maker = make_maker()
+    numpy_maker = make_maker()
+
+    expected = geometry_bytes(python_maker._generate_python())
+    actual = geometry_bytes(numpy_maker._generate_numpy())
+
+    assert numpy_maker._supports_numpy() is True
+    assert expected == actual
+    assert python_maker.vertex_ranges == numpy_maker.vertex_ranges
+
+
+@pytest.mark.parametrize(
+    "make_maker",
+    [
+        lambda: SphereMaker(smooth=False),
+        lambda: SphereMaker(bottom_clip=-0.5),
+        lambda: SphereMaker(slice=90.0),
+        lambda: SphereMaker(thickness=0.2),
+        lambda: SphereMaker(tex_units={"main": (1.0, 1.0)}),
+        lambda: CylinderMaker(slice=90.0),
+        lambda: CylinderMaker(thickness=0.2),
+        lambda: ConeMaker(bottom_thickness=0.2),
+        lambda: ConeMaker(tex_scale={"main": (2.0, 2.0)}),
+        lambda: TorusMaker(smooth_section=False),
+        lambda: TorusMaker(twist=90.0),
+        lambda: TorusMaker(section_slice=45.0),
+        lambda: BoxMaker(thickness=0.1),
+        lambda: BoxMaker(tex_offset={"top": (0.5, 0.0)}),
+    ],
+)
+def test_unsupported_parameters_use_python_geometry(make_maker, mocker: MockerFixture) -> None:
+    maker = make_maker()
+    numpy_spy = mocker.spy(type(maker), "_generate_numpy")
+    python_spy = mocker.spy(type(maker), "_generate_python")
+
+    maker._generate()
+
+    # A thick shape generates its inner shape as well, which can take the NumPy path by itself
+    assert maker._supports_numpy() is False
+    assert maker not in [call.args[0] for call in numpy_spy.call_args_list]
+    assert maker in [call.args[0] for call in python_spy.call_args_list]
+
+
+def test_supported_parameters_use_numpy_geometry(mocker: MockerFixture) -> None:
+    maker = SphereMaker(radius=0.10)
+    numpy_spy = mocker.spy(SphereMaker, "_generate_numpy")
+    python_spy = mocker.spy(SphereMaker, "_generate_python")
+
+    maker._generate()
+
+    assert 1 == numpy_spy.call_count
+    assert 0 == python_spy.call_count
+
+
+def test_numpy_geometry_switches_to_32_bit_indices() -> None:
+    node = TorusMaker(segments={"ring": 200, "section": 100})._generate_numpy()
+    primitive = node.get_geom(0).get_primitive(0)
+
+    assert Geom.NT_uint32 == primitive.get_index_type()
+    assert 200 * 100 * 6 == primitive.get_num_vertices()
+    assert 201 * 101 - 1 == primitive.get_max_vertex()
+
+
+def test_normalize_matches_vec3() -> None:
+    vecs = np.array([(3.0, 4.0, 0.0), (0.1, -0.2, 0.3), (0.0, 0.0, 0.0), (0.0, 0.0, 1.0), (1e-3, 2.5, -7.0)])
+    out = np.empty(vecs.shape, dtype=np.float32)
+
+    ModelMaker._normalize(vecs, out, -1.0)
+
+    expected = [tuple(Vec3(*vec).normalized() * -1.0) for vec in vecs.tolist()]
+    assert np.array(expected, dtype=np.float32).tobytes() == out.tobytes()